@@ -0,0 +1,79 @@
+# benchmarks/compare.py
+#
+# Compare two benchmark result files (from run.py or import_time.py) and flag regressions.
+#
+# Usage:
+#     python benchmarks/compare.py baseline.json results.json [--threshold 1.10]
+#
+# Exits with status 1 when any case got slower, or allocated more at peak, by more than the threshold ratio
+# (slowdowns under --min-seconds are ignored as timer noise).
+
+import argparse
+import json
+import sys
+
+
+def load(path):
+    with open(path) as file:
+        return json.load(file)
+
+
+def compare(baseline, current, threshold=1.10, min_seconds=0.005, metrics=("seconds", "peak_bytes")):
+    """
+    Compare the cases present in both result sets.
+
+    Parameters:
+    - baseline: The results dict of the reference run.
+    - current: The results dict of the new run.
+    - threshold: The new/old ratio above which a metric counts as a regression.
+    - min_seconds: Slowdowns smaller than this many seconds are timer noise, not regressions.
+    - metrics: The metrics to compare.
+
+    Returns:
+    - list: One row per case and metric: (case, metric, old, new, ratio, regressed).
+    """
+    rows = []
+    for case in sorted(set(baseline) & set(current)):
+        for metric in metrics:
+            old, new = baseline[case].get(metric), current[case].get(metric)
+            if old is None or new is None:
+                continue
+            ratio = new / old if old else (1.0 if not new else float("inf"))
+            regressed = ratio > threshold and (metric != "seconds" or new - old > min_seconds)
+            rows.append((case, metric, old, new, ratio, regressed))
+    return rows
+
+
+def _format(metric, value):
+    return f"{value:.4f}s" if metric == "seconds" else f"{value / 1e6:.1f}MB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare two benchmark JSON files.")
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=1.10, help="new/old ratio counted as a regression")
+    parser.add_argument("--min-seconds", type=float, default=0.005, help="ignore slowdowns smaller than this")
+    args = parser.parse_args()
+
+    baseline, current = load(args.baseline), load(args.current)
+    if baseline.get("environment") != current.get("environment"):
+        print("Warning: the results come from different environments; differences may not be regressions.\n")
+
+    rows = compare(baseline["results"], current["results"], threshold=args.threshold,
+                   min_seconds=args.min_seconds)
+    print(f"{'case':<60} {'metric':<10} {'baseline':>10} {'current':>10} {'ratio':>7}")
+    for case, metric, old, new, ratio, regressed in rows:
+        flag = "  REGRESSION" if regressed else ""
+        print(f"{case:<60} {metric:<10} {_format(metric, old):>10} {_format(metric, new):>10} {ratio:>7.2f}{flag}")
+
+    only = set(baseline["results"]) ^ set(current["results"])
+    if only:
+        print(f"\n{len(only)} cases are only in one of the files and were not compared.")
+    regressions = sum(row[-1] for row in rows)
+    print(f"\n{regressions} regressions out of {len(rows)} comparisons.")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
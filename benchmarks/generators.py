@@ -0,0 +1,96 @@
+# benchmarks/generators.py
+#
+# Synthetic datasets for the benchmarks. Every generator is seeded, so runs on different versions
+# see exactly the same data.
+
+import numpy as np
+import pandas as pd
+
+
+def tall(n_rows, seed=0):
+    """A few numeric columns and one low-cardinality categorical column, with a few missing values."""
+    rng = np.random.default_rng(seed)
+    data = pd.DataFrame({
+        "normal": rng.normal(50, 10, n_rows),
+        "uniform": rng.uniform(0, 1, n_rows),
+        "integer": rng.integers(0, 1000, n_rows),
+        "group": rng.choice(np.array(["a", "b", "c", "d"], dtype=object), n_rows),
+    })
+    data.loc[rng.random(n_rows) < 0.01, "normal"] = np.nan
+    return data
+
+
+def wide(n_rows, seed=0, n_columns=200):
+    """Many float columns (`n_columns`), each with a few missing values."""
+    rng = np.random.default_rng(seed)
+    block = rng.normal(size=(n_rows, n_columns))
+    block[rng.random(block.shape) < 0.01] = np.nan
+    return pd.DataFrame(block, columns=[f"x{i}" for i in range(n_columns)])
+
+
+def null_heavy(n_rows, seed=0):
+    """Numeric and text columns where 30-60% of the values are missing."""
+    rng = np.random.default_rng(seed)
+    data = pd.DataFrame({
+        "a": rng.normal(size=n_rows),
+        "b": rng.normal(size=n_rows),
+        "c": rng.exponential(size=n_rows),
+        "label": rng.choice(np.array(["x", "y", "z"], dtype=object), n_rows),
+    })
+    for column, rate in zip(data.columns, (0.3, 0.45, 0.6, 0.3)):
+        data.loc[rng.random(n_rows) < rate, column] = np.nan
+    return data
+
+
+def skewed(n_rows, seed=0):
+    """Heavy-tailed columns (log-normal, Pareto) with planted extreme outliers."""
+    rng = np.random.default_rng(seed)
+    data = pd.DataFrame({
+        "lognormal": rng.lognormal(0, 1.5, n_rows),
+        "pareto": rng.pareto(1.2, n_rows),
+        "spiky": rng.normal(size=n_rows),
+    })
+    spikes = rng.random(n_rows) < 0.001
+    data.loc[spikes, "spiky"] = rng.normal(0, 1000, spikes.sum())
+    return data
+
+
+def high_cardinality(n_rows, seed=0):
+    """Text columns with many distinct values (one per ~10 rows, capped at a million) and one numeric column."""
+    rng = np.random.default_rng(seed)
+    cardinality = int(min(max(n_rows // 10, 1), 1_000_000))
+    ids = np.array([f"user_{i}" for i in range(cardinality)], dtype=object)
+    cities = np.array([f"city_{i}" for i in range(min(cardinality, 5000))], dtype=object)
+    data = pd.DataFrame({
+        "user": ids[rng.integers(0, cardinality, n_rows)],
+        "city": cities[rng.zipf(1.5, n_rows) % len(cities)],
+        "amount": rng.gamma(2.0, 50.0, n_rows),
+    })
+    data.loc[rng.random(n_rows) < 0.02, "city"] = np.nan
+    return data
+
+
+GENERATORS = {
+    "tall": tall,
+    "wide": wide,
+    "null_heavy": null_heavy,
+    "skewed": skewed,
+    "high_cardinality": high_cardinality,
+}
+
+
+def make_dataset(kind, n_rows, seed=0):
+    """
+    Generate one synthetic dataset.
+
+    Parameters:
+    - kind: One of the GENERATORS names.
+    - n_rows: The number of rows.
+    - seed: The random seed.
+
+    Returns:
+    - pd.DataFrame: The dataset.
+    """
+    if kind not in GENERATORS:
+        raise ValueError(f"Unknown dataset '{kind}'. Use one of: {', '.join(GENERATORS)}.")
+    return GENERATORS[kind](int(n_rows), seed=seed)
@@ -0,0 +1,87 @@
+# benchmarks/import_time.py
+#
+# Startup benchmark: the time and memory it takes to import each datai submodule in a fresh interpreter,
+# and whether the import pulls in the plotting stack.
+#
+# Usage:
+#     python benchmarks/import_time.py [--repeat 5] [--json results.json]
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+MODULES = [
+    "datai",
+    "datai.data_cleaning",
+    "datai.utils",
+    "datai.streaming",
+    "datai.sketches",
+    "datai.profile",
+    "datai.datasets",
+    "datai.rendering",
+    "datai.auto_plot",
+    "datai.visualization",
+    "datai.gift",
+]
+
+# Modules that should only be loaded once a plot is requested
+HEAVY_MODULES = ["matplotlib", "matplotlib.pyplot", "matplotlib.animation", "seaborn"]
+
+# Run in the child interpreter: import one module and report the time and the heavy modules loaded.
+# tracemalloc slows imports down several times, so memory is measured in a separate run.
+CHILD = """
+import json, sys, time, tracemalloc
+if {trace_memory}:
+    tracemalloc.start()
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+print(json.dumps({{"seconds": seconds, "peak_bytes": tracemalloc.get_traced_memory()[1],
+                  "heavy": [name for name in {heavy!r} if name in sys.modules]}}))
+"""
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure(module, repeat=5):
+    """Import a module `repeat` times, each in a fresh interpreter, and return the median time and the peak memory."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [REPO_ROOT, os.environ.get("PYTHONPATH")])))
+
+    def run(trace_memory):
+        code = CHILD.format(module=module, heavy=HEAVY_MODULES, trace_memory=trace_memory)
+        output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True, env=env)
+        return json.loads(output.stdout)
+
+    timings = [run(False) for _ in range(repeat)]
+    return {
+        "seconds": statistics.median(timing["seconds"] for timing in timings),
+        "peak_bytes": run(True)["peak_bytes"],
+        "heavy_modules": timings[0]["heavy"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the import time of each datai submodule.")
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters per module (median is reported)")
+    parser.add_argument("--json", help="write the results to this JSON file")
+    args = parser.parse_args()
+
+    results = {}
+    print(f"{'module':<22} {'time (ms)':>10} {'peak (MB)':>10}  heavy modules loaded")
+    for module in MODULES:
+        result = measure(module, repeat=args.repeat)
+        results[module] = result
+        print(f"{module:<22} {result['seconds'] * 1000:>10.1f} {result['peak_bytes'] / 1e6:>10.1f}  "
+              f"{', '.join(result['heavy_modules']) or '-'}")
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump({"benchmark": "import_time", "results": results}, file, indent=2)
+        print(f"\nResults have been written to {args.json}.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,159 @@
+# benchmarks/run.py
+#
+# Benchmark suite for the cleaning, profiling and rendering hot paths. Each case is timed over a few
+# repeats (the minimum and median are kept) and its peak traced allocation is measured in one extra run.
+#
+# Usage:
+#     python benchmarks/run.py --sizes 1e4 1e5 1e6 --json results.json
+#     python benchmarks/run.py --datasets tall skewed --cases cleaning --sizes 1e7 --repeat 1
+#     python benchmarks/compare.py baseline.json results.json
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+# Run against the working tree, not an installed copy
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+import datai  # noqa: E402
+from datai.data_cleaning import DataCleaning  # noqa: E402
+from datai.memory import MemoryTracker  # noqa: E402
+from datai.profile import clear_profiles  # noqa: E402
+from datai.utils import Utils  # noqa: E402
+from generators import GENERATORS, make_dataset  # noqa: E402
+
+
+def _cleaner(data):
+    """Setup for the cleaning steps: a fresh DataCleaning (its copy of the data is not timed)."""
+    return DataCleaning(data)
+
+
+def _first_numeric(data):
+    return data.select_dtypes(include=["number"]).columns[0]
+
+
+def _render(plot, **kwargs):
+    """Render one AutoPlot plot to PNG bytes on the Agg backend."""
+    from datai.auto_plot import AutoPlot
+    getattr(AutoPlot, plot)(output='png', **kwargs)
+
+
+def _profiled(data):
+    """Setup for the profiling cases: drop cached profiles, so every run computes its statistics."""
+    clear_profiles()
+    return data
+
+
+# Name -> (setup(data) -> state, run(state)). Setup is not timed; run gets a fresh state every repeat.
+CASES = {
+    "cleaning.get_cleaned_data": (_cleaner, lambda cleaner: cleaner.get_cleaned_data()),
+    "cleaning.get_cleaned_data_fused": (_cleaner, lambda cleaner: cleaner.get_cleaned_data(fused=True)),
+    "cleaning.clean_missing_data": (_cleaner, lambda cleaner: cleaner.clean_missing_data()),
+    "cleaning.remove_outliers": (_cleaner, lambda cleaner: cleaner.remove_outliers()),
+    "cleaning.remove_outliers_approximate": (lambda data: DataCleaning(data, approximate=True),
+                                             lambda cleaner: cleaner.remove_outliers()),
+    "cleaning.normalize_data": (_cleaner, lambda cleaner: cleaner.normalize_data()),
+    "cleaning.optimize_dtypes": (_cleaner, lambda cleaner: cleaner.optimize_dtypes()),
+    "utils.summarize_data": (_profiled, Utils.summarize_data),
+    "utils.summarize_data_approximate": (_profiled, lambda data: Utils.summarize_data(data, approximate=True)),
+    "utils.normalize_data": (lambda data: data.copy(), Utils.normalize_data),
+    "render.histogram": (lambda data: data, lambda data: _render("histogram", data=data, col=_first_numeric(data))),
+    "render.line_chart": (
+        lambda data: data.reset_index(),
+        lambda data: _render("line_chart", data=data, x_col="index", y_col=_first_numeric(data.iloc[:, 1:])),
+    ),
+    "render.scatter_plot": (
+        lambda data: data,
+        lambda data: _render("scatter_plot", data=data, x_col=_first_numeric(data),
+                             y_col=data.select_dtypes(include=["number"]).columns[-1]),
+    ),
+}
+
+
+def run_case(name, data, repeat=3):
+    """Time a case `repeat` times and measure its peak traced allocation once."""
+    setup, run = CASES[name]
+    timings = []
+    # The cases print progress messages; keep the benchmark output readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            state = setup(data)
+            start = time.perf_counter()
+            run(state)
+            timings.append(time.perf_counter() - start)
+        state = setup(data)
+        with MemoryTracker() as tracker:
+            run(state)
+    return {
+        "seconds": min(timings),
+        "median_seconds": statistics.median(timings),
+        "peak_bytes": tracker.peak_bytes,
+    }
+
+
+def environment():
+    """Describe the machine and library versions, so results from different hosts are not compared blindly."""
+    return {
+        "datai": datai.__version__,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark datai's cleaning, profiling and rendering hot paths.")
+    parser.add_argument("--sizes", nargs="+", type=float, default=[1e4, 1e5, 1e6], help="row counts (e.g. 1e4 1e6)")
+    parser.add_argument("--datasets", nargs="+", default=list(GENERATORS), choices=list(GENERATORS))
+    parser.add_argument("--cases", nargs="+", default=[""],
+                        help="only run cases whose name starts with one of these prefixes (e.g. cleaning render)")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case (the minimum is compared)")
+    parser.add_argument("--max-cells", type=float, default=5e7,
+                        help="skip datasets with more cells than this (raise it for 1e7-1e8 row runs)")
+    parser.add_argument("--json", help="write the results to this JSON file")
+    args = parser.parse_args()
+
+    # Headless rendering, no GUI windows
+    import matplotlib
+    matplotlib.use("Agg")
+
+    cases = [name for name in CASES if any(name.startswith(prefix) for prefix in args.cases)]
+    results = {}
+    print(f"{'case':<34} {'dataset':<18} {'rows':>11} {'time (s)':>10} {'peak (MB)':>10}")
+    for kind in args.datasets:
+        for size in args.sizes:
+            n_rows = int(size)
+            # Check the size on a tiny sample first, so oversized datasets are never generated
+            cells = n_rows * make_dataset(kind, 10).shape[1]
+            if cells > args.max_cells:
+                print(f"Skipping {kind} at {n_rows} rows ({cells} cells > --max-cells).")
+                continue
+            data = make_dataset(kind, n_rows)
+            for name in cases:
+                result = run_case(name, data, repeat=args.repeat)
+                results[f"{name}/{kind}/{n_rows}"] = result
+                print(f"{name:<34} {kind:<18} {n_rows:>11} {result['seconds']:>10.4f} "
+                      f"{result['peak_bytes'] / 1e6:>10.1f}")
+            del data
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump({"benchmark": "suite", "environment": environment(), "results": results}, file, indent=2)
+        print(f"\nResults have been written to {args.json}.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+# benchmarks/serve_load.py
+#
+# Load test for `datai serve`: starts a local server (or targets a running one), sends requests from concurrent
+# keep-alive clients and reports the throughput, the latency percentiles and how many answers came from the cache.
+#
+# Usage:
+#     python benchmarks/serve_load.py --workers 4 --concurrency 16 --requests 400 --distinct 8 --rows 1e5
+#     python benchmarks/serve_load.py --url http://127.0.0.1:8000 --endpoints summary plot --json load.json
+
+import argparse
+import http.client
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter
+from urllib.parse import urlsplit
+
+import numpy as np
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from generators import GENERATORS, make_dataset  # noqa: E402
+
+# Endpoint name -> request target (the dataset is sent as the body)
+ENDPOINTS = {
+    "summary": "/summary",
+    "clean": "/clean?fused=true",
+    "plot": "/plot?plot=histogram&col={column}",
+}
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(workers, port):
+    """Start `python -m datai serve` and wait until it answers /health."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [REPO_ROOT, os.environ.get("PYTHONPATH")])))
+    process = subprocess.Popen([sys.executable, "-m", "datai", "serve", "--port", str(port), "--workers", str(workers)],
+                               env=env, stdout=subprocess.DEVNULL)
+    for _ in range(600):
+        try:
+            connection = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+            connection.request("GET", "/health")
+            connection.getresponse().read()
+            return process
+        except OSError:
+            if process.poll() is not None:
+                raise RuntimeError("The server exited before answering.") from None
+            time.sleep(0.1)
+    process.terminate()
+    raise RuntimeError("The server did not start within a minute.")
+
+
+def run_load(host, port, jobs, concurrency):
+    """Send the (target, body) jobs from `concurrency` keep-alive clients; returns the latencies and outcomes."""
+    latencies = [None] * len(jobs)
+    outcomes = [None] * len(jobs)
+    next_job = iter(range(len(jobs)))
+    lock = threading.Lock()
+
+    def client():
+        connection = http.client.HTTPConnection(host, port, timeout=600)
+        while True:
+            with lock:
+                index = next(next_job, None)
+            if index is None:
+                return
+            target, body = jobs[index]
+            start = time.perf_counter()
+            connection.request("POST", target, body=body, headers={"Content-Type": "text/csv"})
+            response = connection.getresponse()
+            response.read()
+            latencies[index] = time.perf_counter() - start
+            outcomes[index] = (response.status, response.getheader("X-Cache"))
+
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start, np.array(latencies), outcomes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the datai HTTP service on this machine.")
+    parser.add_argument("--url", help="a running server (by default one is started for the test)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="worker processes of the server")
+    parser.add_argument("--concurrency", type=int, default=8, help="concurrent clients")
+    parser.add_argument("--requests", type=int, default=200, help="requests in total")
+    parser.add_argument("--distinct", type=int, default=4, help="distinct datasets (the rest are cache hits)")
+    parser.add_argument("--rows", type=float, default=1e5, help="rows per dataset")
+    parser.add_argument("--dataset", default="tall", choices=list(GENERATORS))
+    parser.add_argument("--endpoints", nargs="+", default=["summary"], choices=list(ENDPOINTS))
+    parser.add_argument("--json", help="write the results to this JSON file")
+    args = parser.parse_args()
+
+    datasets = [make_dataset(args.dataset, int(args.rows), seed=seed) for seed in range(args.distinct)]
+    column = datasets[0].select_dtypes(include=["number"]).columns[0]
+    bodies = [data.to_csv(index=False).encode() for data in datasets]
+    # Every endpoint is paired with every dataset, so there are `distinct` x endpoints different jobs
+    jobs = [(ENDPOINTS[args.endpoints[i % len(args.endpoints)]].format(column=column),
+             bodies[i // len(args.endpoints) % len(bodies)]) for i in range(args.requests)]
+
+    process = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+    else:
+        host, port = "127.0.0.1", _free_port()
+        process = start_server(args.workers, port)
+    try:
+        seconds, latencies, outcomes = run_load(host, port, jobs, args.concurrency)
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    statuses = Counter(status for status, _ in outcomes)
+    hits = sum(cache == "hit" for _, cache in outcomes)
+    results = {
+        "requests": len(jobs),
+        "seconds": seconds,
+        "requests_per_second": len(jobs) / seconds,
+        "latency_ms": {f"p{q}": float(np.percentile(latencies, q) * 1000) for q in (50, 95, 99)},
+        "statuses": {str(status): count for status, count in statuses.items()},
+        "cache_hits": hits,
+    }
+    print(f"{len(jobs)} requests in {seconds:.2f} s ({results['requests_per_second']:.1f} requests/s), "
+          f"{hits} from the cache")
+    print("latency (ms): " + ", ".join(f"{name} {value:.1f}" for name, value in results["latency_ms"].items()))
+    print("statuses: " + ", ".join(f"{status}: {count}" for status, count in sorted(statuses.items())))
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump({"benchmark": "serve_load", "arguments": vars(args), "results": results}, file, indent=2)
+        print(f"\nResults have been written to {args.json}.")
+
+
+if __name__ == '__main__':
+    main()
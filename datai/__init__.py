@@ -13,4 +13,40 @@ __email__ = "m.ans.cs@outlook.com"
 __description__ = "A Python library for easy data visualization, data cleaning, and automatic chart generation."
 
 # Documentation URL
-__url__ = "https://github.com/anschoudary/datai"
\ No newline at end of file
+__url__ = "https://github.com/anschoudary/datai"
+
+import importlib
+
+# Public API, imported from its submodule on first access so that `import datai` stays cheap
+# (a worker using only DataCleaning never loads matplotlib or seaborn)
+_EXPORTS = {
+    "DataCleaning": "datai.data_cleaning",
+    "CleaningTransformer": "datai.data_cleaning",
+    "ChunkedCleaning": "datai.streaming",
+    "IncrementalSummary": "datai.streaming",
+    "StreamingDeduplicator": "datai.dedup",
+    "Utils": "datai.utils",
+    "AutoPlot": "datai.auto_plot",
+    "Examples": "datai.visualization",
+    "Gift": "datai.gift",
+    "MemoryTracker": "datai.memory",
+    "profile_data": "datai.profile",
+    "load_dataset": "datai.datasets",
+    "read_path": "datai.loaders",
+    "render_batch": "datai.rendering",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name]), name)
+        # Cache it, so later lookups skip this function
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module 'datai' has no attribute '{name}'")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
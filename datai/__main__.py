@@ -0,0 +1,7 @@
+# datai/__main__.py
+#
+# `python -m datai serve ...`, the same as the `datai` command.
+
+from datai.cli import main
+
+main()
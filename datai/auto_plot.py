@@ -1,160 +1,407 @@
 # datai/auto_plot.py
 
-import matplotlib.pyplot as plt
 import pandas as pd
 import numpy as np
-import seaborn as sns
+
+from datai.backends import backend_name, to_pandas
+from datai.charts import make_chart
+from datai.correlation import aggregate_tiles, clustered_submatrix, correlation_matrix
+from datai.downsample import density_grid, lttb_indices, minmax_indices, prebin, sample_rows
+from datai.inference import convert_column, infer_column_type, informative_columns, sample_frame
+from datai.instrumentation import instrumented
+from datai.loaders import read_path
+from datai.lazy import LazyModule
+from datai.rendering import numbered_output, show_or_save
+from datai.sketches import ColumnSketch
+
+# Imported on first use, so importing datai does not load the plotting stack
+plt = LazyModule('matplotlib.pyplot')
+sns = LazyModule('seaborn')
+colors = LazyModule('matplotlib.colors')
+
+
+def _sketch_box_stats(values, label, epsilon=0.01):
+    """Box plot statistics for `Axes.bxp` computed from a quantile sketch instead of a full sort."""
+    sketch = ColumnSketch(epsilon=epsilon).update(values)
+    q1, median, q3 = sketch.quantiles.quantile([0.25, 0.5, 0.75])
+    iqr = q3 - q1
+    return {
+        "label": label,
+        "med": median,
+        "q1": q1,
+        "q3": q3,
+        # Whiskers stop at the IQR fences, or at the data range when it is narrower
+        "whislo": max(sketch.min, q1 - 1.5 * iqr),
+        "whishi": min(sketch.max, q3 + 1.5 * iqr),
+        "fliers": [],
+    }
+
+
+def _sketch_boxplot(data, y, x=None, epsilon=0.01):
+    """Draw a box plot of `y` (optionally grouped by `x`) from quantile sketches."""
+    if x is None:
+        stats = [_sketch_box_stats(data[y], y, epsilon)]
+    else:
+        groups = data.groupby(x, sort=True, observed=True)[y]
+        stats = [_sketch_box_stats(group, str(name), epsilon) for name, group in groups]
+    ax = plt.gca()
+    ax.bxp(stats, showfliers=False)
+    ax.set_xlabel(x or '')
+    ax.set_ylabel(y)
+
+
+def _plot_size_pixels():
+    """Return the (width, height) of the current figure in pixels."""
+    fig = plt.gcf()
+    width, height = fig.get_size_inches() * fig.dpi
+    return int(width), int(height)
+
+
+def _draw_line(x, y, threshold, downsample='minmax', **kwargs):
+    """Draw a line, decimated to about one point per pixel column when it has more than `threshold` points."""
+    if len(y) > threshold:
+        width = _plot_size_pixels()[0]
+        keep = lttb_indices(x, y, 2 * width) if downsample == 'lttb' else minmax_indices(y, width)
+        x, y = np.asarray(x)[keep], np.asarray(y)[keep]
+        # Markers on every decimated point would only draw a solid band
+        kwargs.pop('marker', None)
+    plt.plot(x, y, **kwargs)
+
+
+def _draw_scatter(x, y, threshold, color='red'):
+    """Draw a scatter plot, or a 2D density grid computed in NumPy when it has more than `threshold` points."""
+    if len(x) <= threshold:
+        plt.scatter(x, y, color=color)
+        return
+    width, height = _plot_size_pixels()
+    counts, x_edges, y_edges = density_grid(x, y, bins=(max(width // 2, 1), max(height // 2, 1)))
+    # Empty cells stay transparent so sparse regions look like the point cloud they replace
+    mesh = plt.pcolormesh(x_edges, y_edges, np.ma.masked_equal(counts.T, 0), cmap='Reds', norm=colors.LogNorm())
+    plt.colorbar(mesh, label='Points per cell')
+
+
+def _draw_histogram(values, threshold, bins=15, **kwargs):
+    """Draw a histogram, binning in NumPy first when it has more than `threshold` values."""
+    if len(values) <= threshold:
+        plt.hist(values, bins=bins, **kwargs)
+        return
+    counts, edges = prebin(values, bins=bins)
+    # One weighted value per bin draws exactly the same bars as the raw data
+    plt.hist(edges[:-1], bins=edges, weights=counts, **kwargs)
+
+
+def _categories_figsize(n_categories):
+    """Figure size that leaves room for `n_categories` labels along the x axis."""
+    return min(max(10, 0.5 * n_categories), 20), 6
+
+
+def _draw_heatmap(correlation, annotation_limit, max_tiles):
+    """
+    Draw a correlation heatmap. Above `annotation_limit` columns the cell labels and grid lines are dropped,
+    and above `max_tiles` columns neighbouring cells are averaged into tiles.
+    """
+    if len(correlation) > max_tiles:
+        correlation = aggregate_tiles(correlation, max_tiles)
+    small = len(correlation) <= annotation_limit
+    sns.heatmap(correlation, annot=small, cmap='coolwarm', linewidths=0.5 if small else 0, vmin=-1, vmax=1)
+
 
 class AutoPlot:
-    """Class for automatically plotting the right type of graph based on the dataset."""
+    """
+    Class for automatically plotting the right type of graph based on the dataset.
+
+    Every method takes an optional `output`: None shows the plot (the default), a format name
+    ('png', 'svg' or 'pdf') returns the rendered bytes, and a file path saves the plot there.
+    The figure is closed once it has been rendered.
+    """
+
+    # Above this many rows, plots switch to the downsampled/aggregated render path
+    large_data_threshold = 100_000
+    # Pairplots, violin plots and density plots draw a random sample of at most this many rows; their cost
+    # grows with every point drawn or kernel evaluated, and a denser sample looks the same
+    sample_points = 5_000
+    # Heatmaps of more columns than this are drawn without cell annotations
+    heatmap_annotation_limit = 20
+    # Heatmaps of more columns than this are averaged into this many tiles per side
+    heatmap_max_tiles = 100
+    # auto_plot pairs at most this many numeric columns, draws at most this many categories,
+    # and only colours the pairplot by a column with at most this many categories
+    pairplot_max_columns = 5
+    max_categories = 20
+    max_hue_categories = 10
 
     @staticmethod
-    def auto_plot(dataset):
+    @instrumented
+    def auto_plot(dataset, approximate=False, epsilon=0.01, output=None):
         """
         Suggests a type of plot based on the characteristics of the dataset and provides examples.
 
         Parameters:
-        dataset (pd.DataFrame): The dataset to analyze.
+        dataset (pd.DataFrame): The dataset to analyze (Polars and Arrow data is converted to pandas for plotting).
+        approximate (bool): If True, box plots are drawn from quantile sketches instead of sorting every group.
+        epsilon (float): The target normalized rank error of the sketches when `approximate` is True.
+        output (str): None to show the plots, a format name ('png', 'svg' or 'pdf') for bytes, or a file path;
+            the n-th plot is saved as '<name>_<n><extension>'.
 
         Returns:
-        None
+        list: The rendered bytes or paths of each plot, or None when the plots are shown.
         """
-        if not isinstance(dataset, pd.DataFrame):
-            raise ValueError("The input dataset must be a pandas DataFrame.")
+        try:
+            backend_name(dataset)
+        except ValueError:
+            raise ValueError("The input dataset must be a pandas DataFrame, Polars DataFrame or pyarrow Table.")
+        # seaborn and matplotlib plot pandas data
+        dataset = to_pandas(dataset)
         
-        # Analyze the dataset
+        # Column types and plot choices come from a bounded sample only, without a pass over every row, so
+        # deciding takes the same time for any number of rows
         num_rows, num_cols = dataset.shape
-        data_types = dataset.dtypes
-        numeric_cols = data_types[data_types != 'object'].index
-        categorical_cols = data_types[data_types == 'object'].index
+        sample = sample_frame(dataset)
+        types = {column: infer_column_type(sample[column]) for column in sample.columns}
+        numeric_cols = [column for column, info in types.items() if info["kind"] == 'numeric']
+        categorical_cols = [column for column, info in types.items() if info["kind"] in ('categorical', 'boolean')]
+        # An ordered time or sequence column makes a better line chart axis than the row number
+        order_cols = [column for column, info in types.items()
+                      if info["kind"] in ('datetime', 'identifier') and info["monotonic"]]
+
+        # Text columns holding numbers, dates or yes/no flags are converted before plotting
+        parsed = {column: convert_column(dataset[column], info) for column, info in types.items()
+                  if info["parsed"] and column in numeric_cols + categorical_cols + order_cols[:1]}
+        plot_data = dataset.assign(**parsed) if parsed else dataset
+        sample = sample.assign(**{column: convert_column(sample[column], types[column]) for column in parsed})
 
         # Print dataset summary
         print(f"Number of rows: {num_rows}")
         print(f"Number of columns: {num_cols}")
-        print(f"Numeric columns: {numeric_cols.tolist()}")
-        print(f"Categorical columns: {categorical_cols.tolist()}")
+        print(f"Numeric columns: {numeric_cols}")
+        print(f"Categorical columns: {categorical_cols}")
+
+        results = []
+
+        def finish_plot():
+            results.append(show_or_save(numbered_output(output, len(results) + 1)))
 
         # Function to display plots
-        def display_plot(plot_func, **kwargs):
-            plt.figure(figsize=(10, 6))
+        def display_plot(plot_func, figsize=(10, 6), **kwargs):
+            plt.figure(figsize=figsize)
             plot_func(**kwargs)
-            plt.show()
+            finish_plot()
 
         # Suggest plot types based on dataset characteristics
-        if numeric_cols.size > 0:
-            if categorical_cols.size > 0:
+        if numeric_cols:
+            if categorical_cols:
+                category = categorical_cols[0]
+                # The most frequent categories of the sample, so a high-cardinality column stays readable
+                categories = sample[category].value_counts().index[:AutoPlot.max_categories].tolist()
+                figsize = _categories_figsize(len(categories))
                 print("Suggested plots:")
                 print("- Pairplot: To visualize relationships between numeric columns.")
-                sns.pairplot(data=dataset, hue=categorical_cols[0] if categorical_cols.size > 0 else None)
-                plt.show()
+                # Pairwise scatters of a random sample look the same as those of every row, and only the most
+                # correlated columns are paired, so the grid stays small on wide data
+                pair_cols = informative_columns(sample, numeric_cols, AutoPlot.pairplot_max_columns)
+                sns.pairplot(data=sample_rows(plot_data, AutoPlot.sample_points), vars=pair_cols,
+                             hue=category if types[category]["unique"] <= AutoPlot.max_hue_categories else None,
+                             height=2.5 if len(pair_cols) <= 3 else 2)
+                finish_plot()
                 print("- Countplot: To visualize the distribution of categorical columns.")
-                display_plot(sns.countplot, x=categorical_cols[0], data=dataset)
+                display_plot(sns.countplot, figsize=figsize, x=category, data=plot_data, order=categories)
                 print("- Boxplot: To visualize the distribution of numeric data grouped by a categorical column.")
-                display_plot(sns.boxplot, x=categorical_cols[0], y=numeric_cols[0], data=dataset)
+                if approximate:
+                    display_plot(_sketch_boxplot, figsize=figsize, x=category, y=numeric_cols[0],
+                                 data=plot_data[plot_data[category].isin(categories)], epsilon=epsilon)
+                else:
+                    # The boxes come from every row; on large data the outliers would be drawn one by one
+                    display_plot(sns.boxplot, figsize=figsize, x=category, y=numeric_cols[0], data=plot_data,
+                                 order=categories, showfliers=num_rows <= AutoPlot.large_data_threshold)
                 print("- Violin Plot: To visualize the distribution of numeric data grouped by a categorical column.")
-                display_plot(sns.violinplot, x=categorical_cols[0], y=numeric_cols[0], data=dataset)
-                print("- Heatmap: To visualize the correlation matrix of numeric columns.")
-                display_plot(sns.heatmap, data=dataset[numeric_cols].corr(), annot=True, cmap='coolwarm', linewidths=0.5)
+                display_plot(sns.violinplot, figsize=figsize, x=category, y=numeric_cols[0],
+                             data=sample_rows(plot_data, AutoPlot.sample_points), order=categories)
+                if len(numeric_cols) > 1:
+                    print("- Heatmap: To visualize the correlation matrix of numeric columns.")
+                    correlation = correlation_matrix(plot_data, columns=numeric_cols)
+                    display_plot(_draw_heatmap, correlation=correlation,
+                                 annotation_limit=AutoPlot.heatmap_annotation_limit,
+                                 max_tiles=AutoPlot.heatmap_max_tiles)
             else:
                 print("Suggested plots:")
                 print("- Histogram: For distribution of numeric data.")
-                display_plot(sns.histplot, x=numeric_cols[0], data=dataset)
+                display_plot(sns.histplot, x=numeric_cols[0], data=plot_data)
                 print("- Boxplot: For distribution and outliers of numeric data.")
-                display_plot(sns.boxplot, y=numeric_cols[0], data=dataset)
+                if approximate:
+                    display_plot(_sketch_boxplot, y=numeric_cols[0], data=plot_data, epsilon=epsilon)
+                else:
+                    display_plot(sns.boxplot, y=numeric_cols[0], data=plot_data,
+                                 showfliers=num_rows <= AutoPlot.large_data_threshold)
                 print("- Density Plot: For distribution of numeric data.")
-                display_plot(sns.kdeplot, x=numeric_cols[0], data=dataset, fill=True)
+                display_plot(sns.kdeplot, x=numeric_cols[0],
+                             data=sample_rows(plot_data, AutoPlot.sample_points), fill=True)
                 print("- Line Chart: For trends over time or ordered numeric data.")
-                display_plot(plt.plot, x=dataset.index, y=dataset[numeric_cols[0]], marker='o')
+                x = plot_data[order_cols[0]] if order_cols else plot_data.index
+                display_plot(_draw_line, x=x, y=plot_data[numeric_cols[0]],
+                             threshold=AutoPlot.large_data_threshold, marker='o')
         else:
-            if categorical_cols.size > 0:
+            if categorical_cols:
+                category = categorical_cols[0]
+                categories = sample[category].value_counts().index[:AutoPlot.max_categories].tolist()
                 print("Suggested plots:")
                 print("- Countplot: For frequency of categories.")
-                display_plot(sns.countplot, x=categorical_cols[0], data=dataset)
+                display_plot(sns.countplot, figsize=_categories_figsize(len(categories)), x=category,
+                             data=plot_data, order=categories)
                 print("- Pie chart: For proportion of categories.")
-                category_counts = dataset[categorical_cols[0]].value_counts()
+                category_counts = plot_data[category].value_counts()
                 plt.figure(figsize=(10, 6))
                 plt.pie(category_counts, labels=category_counts.index, autopct='%1.1f%%')
                 plt.title('Pie Chart of Categorical Data')
-                plt.show()
+                finish_plot()
             else:
                 print("The dataset does not have clear numeric or categorical features for visualization.")
 
+        return results if output is not None else None
+
     @staticmethod
-    def bar_chart(data, x_col, y_col):
+    def chart(kind, *args, **kwargs):
+        """
+        Create a persistent chart handle for repeated refreshes (e.g. a dashboard).
+
+        The handle keeps its figure, axes and artists; `update(data)` only replaces their data
+        (`set_data`, `set_offsets`, bar heights) and `render(output)` renders without closing the figure.
+        See `datai.charts.ChartPool` to manage several handles.
+
+        Parameters:
+        - kind: 'line', 'scatter', 'bar' or 'histogram'.
+        - args, kwargs: The chart's columns and options, e.g. `AutoPlot.chart('line', 'date', 'sales')`.
+
+        Returns:
+        - Chart: The chart handle.
+        """
+        kwargs.setdefault('threshold', AutoPlot.large_data_threshold)
+        return make_chart(kind, *args, **kwargs)
+
+    @staticmethod
+    def auto_plot_path(path, columns=None, filters=None, n_jobs=1, **kwargs):
+        """
+        Load a CSV, Parquet or Feather file and run `auto_plot` on it, reading only the needed columns and rows.
+
+        Parameters:
+        - path: The file (see `datai.loaders.read_path` for the supported formats).
+        - columns: The columns to load and plot (defaults to all).
+        - filters: Row predicates, e.g. [('year', '>=', 2020)], pushed down to Parquet row groups.
+        - n_jobs: The number of threads parsing a large CSV in byte ranges.
+        - kwargs: Other `auto_plot` options (e.g. `output`).
+
+        Returns:
+        - The result of `auto_plot`.
+        """
+        return AutoPlot.auto_plot(read_path(path, columns=columns, filters=filters, n_jobs=n_jobs), **kwargs)
+
+    @staticmethod
+    @instrumented
+    def bar_chart(data, x_col, y_col, output=None):
         """Plot a bar chart."""
         plt.figure(figsize=(10, 6))
         plt.bar(data[x_col], data[y_col], color='blue')
         plt.xlabel(x_col)
         plt.ylabel(y_col)
         plt.title(f'{y_col} by {x_col}')
-        plt.show()
+        result = show_or_save(output)
         print(f"Bar Chart: Displaying {y_col} by {x_col}.")
+        return result
 
     @staticmethod
-    def line_chart(data, x_col, y_col):
-        """Plot a line chart."""
+    @instrumented
+    def line_chart(data, x_col, y_col, downsample='minmax', output=None):
+        """
+        Plot a line chart.
+
+        Above `AutoPlot.large_data_threshold` rows the line is decimated to about one point per pixel,
+        using min-max bucketing ('minmax') or Largest-Triangle-Three-Buckets ('lttb').
+        """
         plt.figure(figsize=(10, 6))
-        plt.plot(data[x_col], data[y_col], color='green', marker='o')
+        _draw_line(data[x_col], data[y_col], AutoPlot.large_data_threshold, downsample=downsample,
+                   color='green', marker='o')
         plt.xlabel(x_col)
         plt.ylabel(y_col)
         plt.title(f'{y_col} over {x_col}')
         plt.grid(True)
-        plt.show()
+        result = show_or_save(output)
         print(f"Line Chart: Displaying {y_col} over {x_col}.")
+        return result
 
     @staticmethod
-    def scatter_plot(data, x_col, y_col):
-        """Plot a scatter plot for the specified x and y columns."""
+    @instrumented
+    def scatter_plot(data, x_col, y_col, output=None):
+        """
+        Plot a scatter plot for the specified x and y columns.
+
+        Above `AutoPlot.large_data_threshold` rows the points are drawn as a 2D density grid.
+        """
         plt.figure(figsize=(10, 6))
-        plt.scatter(data[x_col], data[y_col], color='red')
+        _draw_scatter(data[x_col], data[y_col], AutoPlot.large_data_threshold, color='red')
         plt.xlabel(x_col)
         plt.ylabel(y_col)
         plt.title(f'{y_col} vs {x_col}')
         plt.grid(True)
-        plt.show()
+        result = show_or_save(output)
         print(f"Scatter Plot: Displaying {y_col} vs {x_col}.")
+        return result
 
     @staticmethod
-    def histogram(data, col):
-        """Plot a histogram for a specific column."""
+    @instrumented
+    def histogram(data, col, output=None):
+        """Plot a histogram for a specific column (pre-binned in NumPy above `AutoPlot.large_data_threshold` rows)."""
         plt.figure(figsize=(10, 6))
-        plt.hist(data[col], bins=15, color='purple', edgecolor='black')
+        _draw_histogram(data[col], AutoPlot.large_data_threshold, bins=15, color='purple', edgecolor='black')
         plt.title(f'Histogram of {col}')
         plt.xlabel(col)
         plt.ylabel('Frequency')
-        plt.show()
+        result = show_or_save(output)
         print(f"Histogram: Displaying distribution of {col}.")
+        return result
 
     @staticmethod
-    def heatmap(data, cols):
-        """Plot a heatmap for the correlation matrix of specific columns."""
+    @instrumented
+    def heatmap(data, cols, max_columns=None, output=None):
+        """
+        Plot a heatmap for the correlation matrix of specific columns.
+
+        The matrix is computed with blocked matrix products. Wide matrices are drawn without annotations
+        (above `AutoPlot.heatmap_annotation_limit` columns) and averaged into tiles (above
+        `AutoPlot.heatmap_max_tiles`); `max_columns` instead keeps only the most correlated columns, clustered.
+        """
         plt.figure(figsize=(12, 8))
-        correlation_matrix = data[cols].corr()
-        sns.heatmap(correlation_matrix, annot=True, cmap='coolwarm', linewidths=0.5)
+        correlation = correlation_matrix(data, columns=cols)
+        if max_columns is not None:
+            correlation = clustered_submatrix(correlation, max_columns=max_columns)
+        _draw_heatmap(correlation, AutoPlot.heatmap_annotation_limit, AutoPlot.heatmap_max_tiles)
         plt.title('Heatmap of Correlation Matrix')
-        plt.show()
+        result = show_or_save(output)
         print("Heatmap: Displaying correlation matrix of the dataset.")
+        return result
 
     @staticmethod
-    def violin_plot(data, x_col, y_col):
+    @instrumented
+    def violin_plot(data, x_col, y_col, output=None):
         """Plot a violin plot for the specified x and y columns."""
         plt.figure(figsize=(10, 6))
-        sns.violinplot(x=x_col, y=y_col, data=data)
+        sns.violinplot(x=x_col, y=y_col, data=sample_rows(data, AutoPlot.sample_points))
         plt.xlabel(x_col)
         plt.ylabel(y_col)
         plt.title(f'Violin Plot of {y_col} by {x_col}')
-        plt.show()
+        result = show_or_save(output)
         print(f"Violin Plot: Displaying {y_col} by {x_col}.")
+        return result
 
     @staticmethod
-    def density_plot(data, col):
+    @instrumented
+    def density_plot(data, col, output=None):
         """Plot a density plot for a specific numeric column."""
         plt.figure(figsize=(10, 6))
-        sns.kdeplot(data[col], fill=True, color='blue')
+        sns.kdeplot(sample_rows(data[col], AutoPlot.sample_points), fill=True, color='blue')
         plt.xlabel(col)
         plt.title(f'Density Plot of {col}')
-        plt.show()
+        result = show_or_save(output)
         print(f"Density Plot: Displaying distribution of {col}.")
+        return result
 
 
 # Test the AutoPlot class
@@ -0,0 +1,422 @@
+# datai/backends.py
+
+from functools import reduce
+
+import numpy as np
+import pandas as pd
+
+# The statistics reported for numeric columns, in `describe()` order
+NUMERIC_STATISTICS = ("count", "mean", "std", "min", "25%", "50%", "75%", "max")
+
+
+def backend_name(data):
+    """
+    Return the backend of a dataset: 'pandas', 'polars' (DataFrame or LazyFrame) or 'arrow' (pyarrow.Table).
+
+    Detection only looks at the object's type, so it never imports polars or pyarrow.
+    """
+    if isinstance(data, pd.DataFrame):
+        return 'pandas'
+    module = type(data).__module__.split('.')[0]
+    if module == 'polars' and type(data).__name__ in ('DataFrame', 'LazyFrame'):
+        return 'polars'
+    if module == 'pyarrow' and type(data).__name__ == 'Table':
+        return 'arrow'
+    raise ValueError("The dataset must be a pandas DataFrame, a Polars DataFrame/LazyFrame or a pyarrow Table.")
+
+
+def get_backend(data):
+    """Return the backend class running the cleaning steps natively on the dataset (None for pandas)."""
+    return {'pandas': None, 'polars': PolarsBackend, 'arrow': ArrowBackend}[backend_name(data)]
+
+
+def to_pandas(data):
+    """Convert a dataset of any supported backend to a pandas DataFrame (for plotting)."""
+    name = backend_name(data)
+    if name == 'pandas':
+        return data
+    if name == 'polars' and type(data).__name__ == 'LazyFrame':
+        data = data.collect()
+    return data.to_pandas()
+
+
+class PolarsBackend:
+    """
+    Cleaning steps as Polars expressions, run by Polars' multi-threaded engine.
+
+    LazyFrames stay lazy: every step returns a LazyFrame, and the aggregates each step needs are evaluated
+    inside the query plan. Missing values are nulls; float NaNs are turned into nulls first, since pandas
+    treats both as missing.
+    Results match the pandas steps: medians and linear-interpolation quartiles, IQR bounds computed on the rows
+    kept so far, and min-max scaling over the kept rows.
+    """
+
+    name = 'polars'
+
+    @staticmethod
+    def _pl():
+        import polars as pl
+        return pl
+
+    @staticmethod
+    def _is_lazy(data):
+        return type(data).__name__ == 'LazyFrame'
+
+    @staticmethod
+    def columns(data):
+        """Return the (numeric, text) column names; booleans are neither, as with pandas."""
+        pl = PolarsBackend._pl()
+        schema = data.collect_schema()
+        numeric = [name for name, dtype in schema.items() if dtype.is_numeric()]
+        text = [name for name, dtype in schema.items() if dtype == pl.Utf8 or dtype == pl.Categorical]
+        return numeric, text
+
+    @staticmethod
+    def _nan_to_null(data):
+        """Turn the NaNs of float columns into nulls, so they are missing values as in pandas."""
+        pl = PolarsBackend._pl()
+        floats = [name for name, dtype in data.collect_schema().items() if dtype.is_float()]
+        return data.with_columns([pl.col(column).fill_nan(None) for column in floats]) if floats else data
+
+    @staticmethod
+    def _collect_row(data, expressions):
+        """Evaluate aggregate expressions in one (parallel) pass and return them as a dict."""
+        result = data.select(expressions)
+        if PolarsBackend._is_lazy(result):
+            result = result.collect()
+        return result.row(0, named=True)
+
+    @staticmethod
+    def null_counts(data):
+        """Return the number of nulls in each column."""
+        pl = PolarsBackend._pl()
+        return PolarsBackend._collect_row(PolarsBackend._nan_to_null(data), [pl.all().null_count()])
+
+    @staticmethod
+    def fill_missing(data):
+        """Fill nulls with the median of numeric columns and the mode (smallest on ties) of text columns."""
+        pl = PolarsBackend._pl()
+        data = PolarsBackend._nan_to_null(data)
+        numeric, text = PolarsBackend.columns(data)
+        nulls = PolarsBackend.null_counts(data)
+        schema = data.collect_schema()
+        expressions = []
+        for column in numeric:
+            if nulls[column]:
+                expressions.append(pl.col(column).fill_null(pl.col(column).median()))
+        for column in text:
+            if nulls[column]:
+                # Compute the mode on the strings, so ties resolve like pandas (smallest value first)
+                values = pl.col(column).cast(pl.Utf8)
+                mode = values.drop_nulls().mode().sort().first()
+                expressions.append(values.fill_null(mode).cast(schema[column]))
+        return data.with_columns(expressions) if expressions else data
+
+    @staticmethod
+    def _inside_bounds(column, threshold):
+        """Expression that is True for the values within the IQR bounds of the column."""
+        pl = PolarsBackend._pl()
+        q1 = pl.col(column).quantile(0.25, interpolation='linear')
+        q3 = pl.col(column).quantile(0.75, interpolation='linear')
+        iqr = q3 - q1
+        return pl.col(column).is_between(q1 - threshold * iqr, q3 + threshold * iqr)
+
+    @staticmethod
+    def remove_outliers(data, threshold=1.5, sequential=True):
+        """Drop rows outside the IQR bounds of any numeric column (rows with nulls are dropped too, as in pandas)."""
+        pl = PolarsBackend._pl()
+        numeric, _ = PolarsBackend.columns(data)
+        if not numeric:
+            return data
+        data = PolarsBackend._nan_to_null(data)
+        if sequential:
+            # Each filter's quartiles are aggregated over the rows the previous filters kept
+            for column in numeric:
+                data = data.filter(PolarsBackend._inside_bounds(column, threshold))
+            return data
+        return data.filter(pl.all_horizontal([PolarsBackend._inside_bounds(column, threshold) for column in numeric]))
+
+    @staticmethod
+    def normalize(data, method='min-max'):
+        """Scale numeric columns with 'min-max' or 'z-score' (sample standard deviation)."""
+        pl = PolarsBackend._pl()
+        numeric, _ = PolarsBackend.columns(data)
+        data = PolarsBackend._nan_to_null(data)
+        expressions = []
+        for column in numeric:
+            values = pl.col(column).cast(pl.Float64)
+            if method == 'min-max':
+                expressions.append((values - values.min()) / (values.max() - values.min()))
+            else:
+                expressions.append((values - values.mean()) / values.std(ddof=1))
+        return data.with_columns(expressions) if expressions else data
+
+    @staticmethod
+    def clean(data, threshold=1.5):
+        """The fused pipeline: fill, filter with bounds computed on the filled data, then min-max scale."""
+        data = PolarsBackend.fill_missing(data)
+        data = PolarsBackend.remove_outliers(data, threshold=threshold, sequential=False)
+        return PolarsBackend.normalize(data)
+
+    @staticmethod
+    def drop_duplicates(data, columns=None, keep='first'):
+        """Drop duplicate rows (by the key `columns`, default all), keeping the order of the remaining rows."""
+        return data.unique(subset=columns, keep={'first': 'first', 'last': 'last', False: 'none'}[keep],
+                           maintain_order=True)
+
+    @staticmethod
+    def drop_missing(data):
+        return PolarsBackend._nan_to_null(data).drop_nulls()
+
+    @staticmethod
+    def fill_value(data, value):
+        return PolarsBackend._nan_to_null(data).fill_null(value)
+
+    @staticmethod
+    def summarize(data):
+        """Return the summary dict of `Utils.summarize_data`, with every statistic aggregated in one pass."""
+        pl = PolarsBackend._pl()
+        data = PolarsBackend._nan_to_null(data)
+        schema = data.collect_schema()
+        numeric, _ = PolarsBackend.columns(data)
+        expressions = [pl.len().alias("rows")]
+        expressions += [pl.col(column).null_count().alias(f"nulls:{i}") for i, column in enumerate(schema)]
+        for i, column in enumerate(numeric):
+            values = pl.col(column)
+            expressions += [
+                values.count().alias(f"{i}:count"),
+                values.mean().alias(f"{i}:mean"),
+                values.std(ddof=1).alias(f"{i}:std"),
+                values.min().cast(pl.Float64).alias(f"{i}:min"),
+                values.quantile(0.25, interpolation='linear').alias(f"{i}:25%"),
+                values.quantile(0.5, interpolation='linear').alias(f"{i}:50%"),
+                values.quantile(0.75, interpolation='linear').alias(f"{i}:75%"),
+                values.max().cast(pl.Float64).alias(f"{i}:max"),
+            ]
+        row = PolarsBackend._collect_row(data, expressions)
+        return {
+            "Shape": (row["rows"], len(schema)),
+            "Columns": list(schema),
+            "Data Types": dict(schema),
+            "Missing Values": {column: row[f"nulls:{i}"] for i, column in enumerate(schema)},
+            "Summary Statistics": {
+                column: {stat: _as_float(row[f"{i}:{stat}"]) for stat in NUMERIC_STATISTICS}
+                for i, column in enumerate(numeric)
+            },
+        }
+
+    @staticmethod
+    def head(data, n=5):
+        head = data.head(n)
+        return head.collect() if PolarsBackend._is_lazy(head) else head
+
+
+class ArrowBackend:
+    """
+    Cleaning steps on pyarrow Tables with `pyarrow.compute` kernels, which run multi-threaded over the chunks.
+
+    Missing values are nulls; float NaNs are turned into nulls first, since pandas treats both as missing.
+    Results match the pandas steps:
+    medians and linear-interpolation quartiles, IQR bounds computed on the rows kept so far, and min-max scaling
+    over the kept rows. Integer columns that are filled or scaled become float64, as they would in pandas.
+    """
+
+    name = 'arrow'
+
+    @staticmethod
+    def _modules():
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        return pa, pc
+
+    @staticmethod
+    def columns(data):
+        """Return the (numeric, text) column names; booleans are neither, as with pandas."""
+        pa, _ = ArrowBackend._modules()
+        numeric, text = [], []
+        for field in data.schema:
+            if pa.types.is_integer(field.type) or pa.types.is_floating(field.type):
+                numeric.append(field.name)
+            elif (pa.types.is_string(field.type) or pa.types.is_large_string(field.type)
+                  or pa.types.is_dictionary(field.type)):
+                text.append(field.name)
+        return numeric, text
+
+    @staticmethod
+    def _nan_to_null(data):
+        """Turn the NaNs of float columns into nulls, so they are missing values as in pandas."""
+        pa, pc = ArrowBackend._modules()
+        for index, field in enumerate(data.schema):
+            if not pa.types.is_floating(field.type):
+                continue
+            values = data.column(index)
+            nans = pc.is_nan(values)
+            if pc.any(nans).as_py():
+                data = data.set_column(index, field, pc.if_else(nans, pa.scalar(None, field.type), values))
+        return data
+
+    @staticmethod
+    def _quantiles(values, q):
+        _, pc = ArrowBackend._modules()
+        return pc.quantile(values, q=q, interpolation='linear').to_pylist()
+
+    @staticmethod
+    def _replace(data, column, values):
+        index = data.schema.get_field_index(column)
+        if values.type != data.schema.field(index).type:
+            # The pandas metadata would restore the old dtype (e.g. Int64) on to_pandas()
+            data = data.replace_schema_metadata(None)
+        return data.set_column(index, column, values)
+
+    @staticmethod
+    def fill_missing(data):
+        """Fill nulls with the median of numeric columns and the mode (smallest on ties) of text columns."""
+        pa, pc = ArrowBackend._modules()
+        data = ArrowBackend._nan_to_null(data)
+        numeric, text = ArrowBackend.columns(data)
+        for column in numeric + text:
+            values = data.column(column)
+            if not values.null_count:
+                continue
+            if column in numeric:
+                median = ArrowBackend._quantiles(values, 0.5)[0]
+                if median is None:
+                    continue
+                values = values.cast(pa.float64()) if pa.types.is_integer(values.type) else values
+                filled = pc.fill_null(values, pa.scalar(median, values.type))
+            else:
+                dictionary = pa.types.is_dictionary(values.type)
+                strings = values.cast(values.type.value_type) if dictionary else values
+                # pc.mode has no string kernel: take the most frequent value, the smallest on ties, like pandas
+                counts = pc.value_counts(pc.drop_null(strings))
+                if not len(counts):
+                    continue
+                frequent = counts.filter(pc.equal(counts.field('counts'), pc.max(counts.field('counts'))))
+                mode = pc.min(frequent.field('values'))
+                filled = pc.fill_null(strings, mode)
+                filled = filled.dictionary_encode() if dictionary else filled
+            data = ArrowBackend._replace(data, column, filled)
+        return data
+
+    @staticmethod
+    def _inside_bounds(values, threshold):
+        """Boolean array that is True for the values within the IQR bounds (null for nulls, which filters drop)."""
+        _, pc = ArrowBackend._modules()
+        q1, q3 = ArrowBackend._quantiles(values, [0.25, 0.75])
+        if q1 is None:
+            # An all-null column has no bounds, so (as in pandas) no row is kept
+            return pc.and_(pc.is_valid(values), pc.is_null(values))
+        iqr = q3 - q1
+        return pc.and_(pc.greater_equal(values, q1 - threshold * iqr), pc.less_equal(values, q3 + threshold * iqr))
+
+    @staticmethod
+    def remove_outliers(data, threshold=1.5, sequential=True):
+        """Drop rows outside the IQR bounds of any numeric column (rows with nulls are dropped too, as in pandas)."""
+        _, pc = ArrowBackend._modules()
+        numeric, _ = ArrowBackend.columns(data)
+        if not numeric:
+            return data
+        data = ArrowBackend._nan_to_null(data)
+        if sequential:
+            for column in numeric:
+                data = data.filter(ArrowBackend._inside_bounds(data.column(column), threshold))
+            return data
+        masks = [ArrowBackend._inside_bounds(data.column(column), threshold) for column in numeric]
+        return data.filter(reduce(pc.and_, masks))
+
+    @staticmethod
+    def normalize(data, method='min-max'):
+        """Scale numeric columns with 'min-max' or 'z-score' (sample standard deviation)."""
+        pa, pc = ArrowBackend._modules()
+        numeric, _ = ArrowBackend.columns(data)
+        data = ArrowBackend._nan_to_null(data)
+        for column in numeric:
+            values = data.column(column).cast(pa.float64())
+            if method == 'min-max':
+                extremes = pc.min_max(values)
+                shift, high = extremes['min'].as_py(), extremes['max'].as_py()
+                scale = None if shift is None else high - shift
+            else:
+                shift, scale = pc.mean(values).as_py(), pc.stddev(values, ddof=1).as_py()
+            if shift is None or scale is None:
+                continue
+            # Float division follows IEEE rules, so a zero range gives NaN as in pandas
+            scaled = pc.divide(pc.subtract(values, shift), float(scale))
+            data = ArrowBackend._replace(data, column, scaled)
+        return data
+
+    @staticmethod
+    def clean(data, threshold=1.5):
+        """The fused pipeline: fill, filter with bounds computed on the filled data, then min-max scale."""
+        data = ArrowBackend.fill_missing(data)
+        data = ArrowBackend.remove_outliers(data, threshold=threshold, sequential=False)
+        return ArrowBackend.normalize(data)
+
+    @staticmethod
+    def drop_duplicates(data, columns=None, keep='first'):
+        """Drop duplicate rows (by the key `columns`, default all) with a hash group-by on the row numbers."""
+        pa, pc = ArrowBackend._modules()
+        keys = list(columns) if columns is not None else data.column_names
+        rows = data.select(keys).append_column('__row', pa.array(np.arange(data.num_rows)))
+        groups = rows.group_by(keys).aggregate([('__row', 'min'), ('__row', 'max'), ('__row', 'count')])
+        if keep is False:
+            kept = pc.filter(groups['__row_min'], pc.equal(groups['__row_count'], 1))
+        else:
+            kept = groups['__row_min' if keep == 'first' else '__row_max']
+        return data.take(np.sort(kept.to_numpy()))
+
+    @staticmethod
+    def drop_missing(data):
+        return ArrowBackend._nan_to_null(data).drop_null()
+
+    @staticmethod
+    def fill_value(data, value):
+        """Fill the nulls of every column whose type can hold `value`."""
+        pa, pc = ArrowBackend._modules()
+        data = ArrowBackend._nan_to_null(data)
+        for column in data.column_names:
+            values = data.column(column)
+            if not values.null_count:
+                continue
+            try:
+                data = ArrowBackend._replace(data, column, pc.fill_null(values, value))
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+                continue
+        return data
+
+    @staticmethod
+    def null_counts(data):
+        """Return the number of nulls (and NaNs) in each column."""
+        data = ArrowBackend._nan_to_null(data)
+        return {column: data.column(column).null_count for column in data.column_names}
+
+    @staticmethod
+    def summarize(data):
+        """Return the summary dict of `Utils.summarize_data`."""
+        _, pc = ArrowBackend._modules()
+        data = ArrowBackend._nan_to_null(data)
+        numeric, _ = ArrowBackend.columns(data)
+        statistics = {}
+        for column in numeric:
+            values = data.column(column)
+            extremes = pc.min_max(values)
+            q1, median, q3 = ArrowBackend._quantiles(values, [0.25, 0.5, 0.75])
+            stats = [pc.count(values).as_py(), pc.mean(values).as_py(), pc.stddev(values, ddof=1).as_py(),
+                     extremes['min'].as_py(), q1, median, q3, extremes['max'].as_py()]
+            statistics[column] = {stat: _as_float(value) for stat, value in zip(NUMERIC_STATISTICS, stats)}
+        return {
+            "Shape": (data.num_rows, data.num_columns),
+            "Columns": data.column_names,
+            "Data Types": {field.name: field.type for field in data.schema},
+            "Missing Values": ArrowBackend.null_counts(data),
+            "Summary Statistics": statistics,
+        }
+
+    @staticmethod
+    def head(data, n=5):
+        return data.slice(0, n)
+
+
+def _as_float(value):
+    """Turn a statistic into a float, with NaN for missing values (as `describe()` reports them)."""
+    return np.nan if value is None else float(value)
@@ -0,0 +1,299 @@
+# datai/charts.py
+
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from datai.downsample import lttb_indices, minmax_indices, prebin, sample_rows
+from datai.lazy import LazyModule
+from datai.rendering import save_figure
+
+# Imported on first use, so importing datai does not load matplotlib
+plt = LazyModule('matplotlib.pyplot')
+figure = LazyModule('matplotlib.figure')
+backend_agg = LazyModule('matplotlib.backends.backend_agg')
+
+# Above this many rows, lines are decimated and scatters sampled (AutoPlot passes its large_data_threshold)
+LARGE_DATA_THRESHOLD = 100_000
+# Released figures kept by a ChartPool for reuse (reused charts resize them to their own figsize)
+MAX_IDLE_FIGURES = 8
+
+
+class Chart(ABC):
+    """
+    A chart whose figure, axes and artists persist across refreshes: `update(data)` only replaces the data
+    of the existing artists, so a dashboard refreshing the same charts does not rebuild figures or grow memory.
+
+    Charts are headless by default (an Agg canvas outside pyplot, so nothing accumulates in pyplot's figure
+    manager); pass `interactive=True` to draw in a pyplot window instead. Call `close()`, or use the chart
+    as a context manager, when it is no longer needed.
+    """
+
+    def __init__(self, figsize=(10, 6), interactive=False, threshold=LARGE_DATA_THRESHOLD, fig=None):
+        """
+        Initialize an empty chart.
+
+        Parameters:
+        - figsize: The figure size in inches.
+        - interactive: If True, draw in a pyplot window (refreshed on every update).
+        - threshold: The number of rows above which the data is decimated or sampled.
+        - fig: A figure to reuse (e.g. from a ChartPool) instead of creating one; it is cleared first.
+        """
+        self.interactive = interactive
+        self.threshold = threshold
+        if fig is not None:
+            fig.clear()
+            fig.set_size_inches(figsize)
+            self.figure = fig
+        elif interactive:
+            self.figure = plt.figure(figsize=figsize)
+        else:
+            self.figure = figure.Figure(figsize=figsize)
+            backend_agg.FigureCanvasAgg(self.figure)
+        self.ax = self.figure.add_subplot()
+        self.artist = None
+        self.closed = False
+        self._decorate()
+
+    def _decorate(self):
+        """Set the titles and labels once."""
+
+    @abstractmethod
+    def _draw(self, data):
+        """Create the artists on the first update, or replace their data."""
+
+    def _rescale(self):
+        """Fit the axes limits to the new data."""
+        self.ax.relim()
+        self.ax.autoscale_view()
+
+    def update(self, data):
+        """
+        Refresh the chart with new data.
+
+        Parameters:
+        - data: The dataset.
+
+        Returns:
+        - Chart: self, so calls can be chained (e.g. `chart.update(data).render('png')`).
+        """
+        if self.closed:
+            raise ValueError("The chart has been closed.")
+        self._draw(data)
+        self._rescale()
+        if self.interactive:
+            self.figure.canvas.draw_idle()
+        return self
+
+    def render(self, output='png'):
+        """Render the chart to bytes ('png', 'svg' or 'pdf') or to a file path, keeping it open for the next refresh."""
+        return save_figure(self.figure, output)
+
+    def detach(self):
+        """Close the chart and return its figure, cleared, so that it can be reused by another chart."""
+        self.closed = True
+        self.artist = None
+        fig, self.figure = self.figure, None
+        fig.clear()
+        return fig
+
+    def close(self):
+        """Release the figure."""
+        if self.closed:
+            return
+        fig = self.detach()
+        if self.interactive:
+            plt.close(fig)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class LineChart(Chart):
+    """Line chart of `y_col` over `x_col`, decimated to about one point per pixel above the threshold."""
+
+    def __init__(self, x_col, y_col, downsample='minmax', **kwargs):
+        self.x_col, self.y_col, self.downsample = x_col, y_col, downsample
+        super().__init__(**kwargs)
+
+    def _decorate(self):
+        self.ax.set_xlabel(self.x_col)
+        self.ax.set_ylabel(self.y_col)
+        self.ax.set_title(f'{self.y_col} over {self.x_col}')
+        self.ax.grid(True)
+
+    def _draw(self, data):
+        x, y = np.asarray(data[self.x_col]), np.asarray(data[self.y_col])
+        decimated = len(y) > self.threshold
+        if decimated:
+            width = int(self.figure.get_size_inches()[0] * self.figure.dpi)
+            keep = lttb_indices(x, y, 2 * width) if self.downsample == 'lttb' else minmax_indices(y, width)
+            x, y = x[keep], y[keep]
+        if self.artist is None:
+            (self.artist,) = self.ax.plot(x, y, color='green', marker='o')
+        else:
+            self.artist.set_data(x, y)
+        # Markers on every decimated point would only draw a solid band
+        self.artist.set_marker('' if decimated else 'o')
+
+
+class ScatterChart(Chart):
+    """Scatter plot of `y_col` against `x_col`; above the threshold a random sample of the points is drawn."""
+
+    def __init__(self, x_col, y_col, **kwargs):
+        self.x_col, self.y_col = x_col, y_col
+        super().__init__(**kwargs)
+
+    def _decorate(self):
+        self.ax.set_xlabel(self.x_col)
+        self.ax.set_ylabel(self.y_col)
+        self.ax.set_title(f'{self.y_col} vs {self.x_col}')
+        self.ax.grid(True)
+
+    def _draw(self, data):
+        data = sample_rows(data[[self.x_col, self.y_col]], self.threshold)
+        points = data.to_numpy(dtype='float64')
+        if self.artist is None:
+            self.artist = self.ax.scatter(points[:, 0], points[:, 1], color='red')
+        else:
+            self.artist.set_offsets(points)
+
+    def _rescale(self):
+        # relim() ignores collections, so the data limits are reset from the points
+        points = self.artist.get_offsets()
+        finite = points[np.isfinite(points).all(axis=1)]
+        self.ax.ignore_existing_data_limits = True
+        if len(finite):
+            self.ax.update_datalim(finite)
+        self.ax.autoscale_view()
+
+
+class BarChart(Chart):
+    """Bar chart of `y_col` by `x_col`; bar heights are updated in place while the categories stay the same."""
+
+    def __init__(self, x_col, y_col, **kwargs):
+        self.x_col, self.y_col = x_col, y_col
+        self.categories = None
+        super().__init__(**kwargs)
+
+    def _decorate(self):
+        self.ax.set_xlabel(self.x_col)
+        self.ax.set_ylabel(self.y_col)
+        self.ax.set_title(f'{self.y_col} by {self.x_col}')
+
+    def _draw(self, data):
+        categories, heights = list(data[self.x_col]), np.asarray(data[self.y_col], dtype='float64')
+        if self.artist is not None and categories == self.categories:
+            for rect, height in zip(self.artist.patches, heights):
+                rect.set_height(height)
+            return
+        # New categories need new bars; numeric positions with tick labels, since a categorical axis
+        # would keep the old categories
+        if self.artist is not None:
+            self.artist.remove()
+        positions = np.arange(len(categories))
+        self.artist = self.ax.bar(positions, heights, color='blue')
+        self.ax.set_xticks(positions, labels=[str(category) for category in categories])
+        self.categories = categories
+
+
+class HistogramChart(Chart):
+    """Histogram of `col` with a fixed number of bins, whose rectangles are moved and resized on refresh."""
+
+    def __init__(self, col, bins=15, **kwargs):
+        self.col, self.bins = col, bins
+        super().__init__(**kwargs)
+
+    def _decorate(self):
+        self.ax.set_title(f'Histogram of {self.col}')
+        self.ax.set_xlabel(self.col)
+        self.ax.set_ylabel('Frequency')
+
+    def _draw(self, data):
+        counts, edges = prebin(data[self.col], bins=self.bins)
+        if self.artist is None:
+            self.artist = self.ax.hist(edges[:-1], bins=edges, weights=counts, color='purple', edgecolor='black')[2]
+            return
+        for rect, left, right, count in zip(self.artist, edges[:-1], edges[1:], counts):
+            rect.set_x(left)
+            rect.set_width(right - left)
+            rect.set_height(count)
+
+
+CHARTS = {
+    'line': LineChart,
+    'scatter': ScatterChart,
+    'bar': BarChart,
+    'histogram': HistogramChart,
+}
+
+
+def make_chart(kind, *args, **kwargs):
+    """Create a chart handle by kind ('line', 'scatter', 'bar' or 'histogram') or class."""
+    if isinstance(kind, str):
+        if kind not in CHARTS:
+            raise ValueError(f"Unknown chart '{kind}'. Use one of: {', '.join(CHARTS)}.")
+        kind = CHARTS[kind]
+    return kind(*args, **kwargs)
+
+
+class ChartPool:
+    """
+    Keyed set of persistent charts, e.g. one per dashboard panel.
+
+    `chart(key, ...)` returns the existing chart for a key, or creates it. Released charts hand their figure back
+    to the pool, and new charts reuse those figures instead of constructing new ones. `close()` releases
+    everything; the pool is also a context manager.
+    """
+
+    def __init__(self, max_idle=MAX_IDLE_FIGURES):
+        self.charts = {}
+        self.max_idle = max_idle
+        self._idle = []
+
+    def chart(self, key, kind, *args, **kwargs):
+        """
+        Return the chart stored under `key`, creating it on first use.
+
+        Parameters:
+        - key: Any hashable name, e.g. 'sales-by-day'.
+        - kind: 'line', 'scatter', 'bar', 'histogram' or a Chart class.
+        - args, kwargs: The chart's arguments (only used when it is created).
+
+        Returns:
+        - Chart: The chart handle.
+        """
+        chart = self.charts.get(key)
+        if chart is None:
+            if self._idle and not kwargs.get('interactive'):
+                kwargs.setdefault('fig', self._idle.pop())
+            chart = self.charts[key] = make_chart(kind, *args, **kwargs)
+        return chart
+
+    def release(self, key):
+        """Drop the chart stored under `key`, keeping its figure for reuse."""
+        chart = self.charts.pop(key, None)
+        if chart is None or chart.closed:
+            return
+        if chart.interactive or len(self._idle) >= self.max_idle:
+            chart.close()
+        else:
+            self._idle.append(chart.detach())
+
+    def close(self):
+        """Close every chart and drop the idle figures."""
+        for key in list(self.charts):
+            self.charts.pop(key).close()
+        self._idle.clear()
+
+    def __len__(self):
+        return len(self.charts)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
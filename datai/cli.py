@@ -0,0 +1,40 @@
+# datai/cli.py
+
+import argparse
+
+from datai.server import CACHE_BYTES, DEFAULT_HOST, DEFAULT_PORT, MAX_BODY_BYTES
+
+
+def main(argv=None):
+    """
+    Command line entry point.
+
+    Usage:
+        datai serve [--host 127.0.0.1] [--port 8000] [--workers 4] [--cache-mb 256] [--root /data]
+    """
+    parser = argparse.ArgumentParser(prog='datai', description="Datai command line tools.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    serve = commands.add_parser('serve', help="run the local HTTP profiling, cleaning and plotting service")
+    serve.add_argument('--host', default=DEFAULT_HOST, help="interface to listen on (default: %(default)s)")
+    serve.add_argument('--port', type=int, default=DEFAULT_PORT, help="port to listen on (default: %(default)s)")
+    serve.add_argument('--workers', type=int, default=None, help="worker processes (default: one per CPU core)")
+    serve.add_argument('--cache-mb', type=float, default=CACHE_BYTES / (1 << 20),
+                       help="size of the result cache in MB (default: %(default)g)")
+    serve.add_argument('--max-pending', type=int, default=None,
+                       help="jobs allowed to run or wait before answering 503 (default: 4 per worker)")
+    serve.add_argument('--max-upload-mb', type=float, default=MAX_BODY_BYTES / (1 << 20),
+                       help="largest accepted upload in MB (default: %(default)g)")
+    serve.add_argument('--root', default=None,
+                       help="only serve ?path= files inside this directory, resolving relative paths against it "
+                            "(default: the current directory)")
+    args = parser.parse_args(argv)
+
+    if args.command == 'serve':
+        from datai.server import serve as run_server
+        run_server(host=args.host, port=args.port, workers=args.workers, cache_bytes=int(args.cache_mb * (1 << 20)),
+                   max_pending=args.max_pending, max_body_bytes=int(args.max_upload_mb * (1 << 20)), root=args.root)
+
+
+if __name__ == '__main__':
+    main()
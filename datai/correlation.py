@@ -0,0 +1,238 @@
+# datai/correlation.py
+
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from datai.memory import dtype_columns
+
+# Rows are turned into float blocks of about this many cells, so the temporaries stay bounded on wide data
+BLOCK_CELLS = 1 << 22
+
+NUMERIC_KINDS = ['number']
+
+
+class CorrelationAccumulator:
+    """
+    Pearson correlation matrix computed from row blocks with matrix products (BLAS).
+
+    Chunks can be added one at a time (e.g. from `pd.read_csv(..., chunksize=n)`), so the data never has to be
+    in memory at once; only a few (columns x columns) accumulators are kept. Missing values are handled like
+    `DataFrame.corr()`: each pair of columns uses the rows where both are present.
+    """
+
+    def __init__(self, columns=None):
+        """
+        Initialize an empty accumulator.
+
+        Parameters:
+        - columns: The columns to correlate (defaults to the numeric columns of the first chunk).
+        """
+        self.columns = None if columns is None else list(columns)
+        # Values are shifted by the first block's means, so the sums of squares do not lose precision
+        self.shift = None
+        # Rows of blocks without missing values only need their column sums
+        self.rows = 0
+        self.sums = None
+        self.squares = None
+        # Pairwise sums over blocks with missing values: counts, sums of x_i and of x_i ** 2 where x_j is present
+        self.pair_counts = None
+        self.pair_sums = None
+        self.pair_squares = None
+        self.products = None
+        self.low = None
+        self.high = None
+
+    def _start(self, block):
+        width = block.shape[1]
+        with warnings.catch_warnings():
+            # All-missing columns have no mean; they are shifted by 0
+            warnings.simplefilter('ignore', RuntimeWarning)
+            self.shift = np.nan_to_num(np.nanmean(block, axis=0))
+        self.sums, self.squares = np.zeros(width), np.zeros(width)
+        self.pair_counts, self.pair_sums, self.pair_squares, self.products = (np.zeros((width, width)) for _ in range(4))
+        self.low, self.high = np.full(width, np.inf), np.full(width, -np.inf)
+
+    @staticmethod
+    def _product(left, right):
+        # Some BLAS builds raise spurious floating-point flags on finite input; missing values are zeroed before this
+        with np.errstate(invalid='ignore', over='ignore'):
+            return left.T @ right
+
+    def _update_block(self, block):
+        if self.shift is None:
+            self._start(block)
+        block = block - self.shift
+        mask = np.isnan(block)
+        if mask.any():
+            block[mask] = 0.0
+            present = (~mask).astype('float64')
+            self.pair_counts += self._product(present, present)
+            self.pair_sums += self._product(block, present)
+            self.pair_squares += self._product(block * block, present)
+            # Missing values are 0 in the block; keep them out of the ranges used to detect constant columns
+            self.low = np.fmin(self.low, np.where(mask, np.inf, block).min(axis=0))
+            self.high = np.fmax(self.high, np.where(mask, -np.inf, block).max(axis=0))
+        else:
+            self.rows += len(block)
+            self.sums += block.sum(axis=0)
+            self.squares += np.einsum('ij,ij->j', block, block)
+            self.low = np.fmin(self.low, block.min(axis=0))
+            self.high = np.fmax(self.high, block.max(axis=0))
+        self.products += self._product(block, block)
+
+    def update(self, chunk):
+        """
+        Add a chunk of rows.
+
+        Parameters:
+        - chunk: A DataFrame with the correlated columns.
+
+        Returns:
+        - CorrelationAccumulator: self, so calls can be chained.
+        """
+        if self.columns is None:
+            self.columns = list(dtype_columns(chunk, include=NUMERIC_KINDS))
+        values = chunk[self.columns].to_numpy(dtype='float64', na_value=np.nan)
+        if not values.size:
+            return self
+        block_rows = max(BLOCK_CELLS // values.shape[1], 1)
+        for start in range(0, len(values), block_rows):
+            self._update_block(values[start:start + block_rows])
+        return self
+
+    def matrix(self):
+        """
+        Return the correlation matrix of the rows added so far.
+
+        Returns:
+        - pd.DataFrame: The same matrix as `DataFrame.corr()` (up to rounding).
+        """
+        columns = self.columns or []
+        if self.shift is None:
+            return pd.DataFrame(np.full((len(columns), len(columns)), np.nan), index=columns, columns=columns)
+
+        counts = self.pair_counts + self.rows
+        # sums[i, j] is the sum of column i over the rows where columns i and j are both present
+        sums = self.pair_sums + self.sums[:, None]
+        squares = self.pair_squares + self.squares[:, None]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            covariance = self.products - sums * sums.T / counts
+            variance = squares - sums ** 2 / counts
+            correlation = covariance / np.sqrt(variance * variance.T)
+        # Like pandas, pairs with fewer than two rows and constant columns have no correlation
+        constant = ~(self.high > self.low)
+        correlation[(counts < 2) | constant[:, None] | constant[None, :]] = np.nan
+        np.clip(correlation, -1.0, 1.0, out=correlation)
+        diagonal = np.diagonal(correlation).copy()
+        np.fill_diagonal(correlation, np.where(np.isnan(diagonal), np.nan, 1.0))
+        return pd.DataFrame(correlation, index=columns, columns=columns)
+
+
+def correlation_matrix(data, columns=None):
+    """
+    Compute a Pearson correlation matrix with blocked matrix products.
+
+    Parameters:
+    - data: A DataFrame, or an iterable of DataFrame chunks (e.g. `pd.read_csv(path, chunksize=100_000)`).
+    - columns: The columns to correlate (defaults to the numeric columns).
+
+    Returns:
+    - pd.DataFrame: The correlation matrix.
+    """
+    accumulator = CorrelationAccumulator(columns)
+    for chunk in [data] if isinstance(data, pd.DataFrame) else data:
+        accumulator.update(chunk)
+    return accumulator.matrix()
+
+
+def top_pairs(correlation, k=10, absolute=True):
+    """
+    Return the k most strongly correlated pairs of distinct columns.
+
+    Parameters:
+    - correlation: A correlation matrix, e.g. from `correlation_matrix`.
+    - k: The number of pairs.
+    - absolute: If True, rank by |correlation| (strong negative pairs count too); else by signed correlation.
+
+    Returns:
+    - pd.DataFrame: Columns 'x', 'y' and 'correlation', strongest first.
+    """
+    values = correlation.to_numpy()
+    rows, cols = np.triu_indices(len(values), k=1)
+    strength = values[rows, cols]
+    key = np.abs(strength) if absolute else strength
+    valid = np.flatnonzero(~np.isnan(key))
+    k = min(k, len(valid))
+    # A partial sort finds the k largest of the (columns^2 / 2) pairs in linear time
+    best = valid[np.argpartition(-key[valid], k - 1)[:k]] if k else valid[:0]
+    best = best[np.argsort(-key[best], kind='stable')]
+    return pd.DataFrame({
+        "x": correlation.index[rows[best]],
+        "y": correlation.columns[cols[best]],
+        "correlation": strength[best],
+    })
+
+
+def _cluster_order(similarity):
+    """Order the columns so that similar ones are adjacent (average linkage, or spectral order without SciPy)."""
+    if len(similarity) < 3:
+        return np.arange(len(similarity))
+    try:
+        from scipy.cluster.hierarchy import leaves_list, linkage
+        from scipy.spatial.distance import squareform
+    except ImportError:
+        return np.argsort(np.linalg.eigh(similarity)[1][:, -1], kind='stable')
+    distance = 1.0 - similarity
+    np.fill_diagonal(distance, 0.0)
+    return leaves_list(linkage(squareform(distance, checks=False), method='average'))
+
+
+def clustered_submatrix(correlation, max_columns=50):
+    """
+    Return the most correlated columns of a matrix, reordered so that correlated columns form blocks.
+
+    Parameters:
+    - correlation: A correlation matrix, e.g. from `correlation_matrix`.
+    - max_columns: The number of columns kept (those with the largest total |correlation| to the others).
+
+    Returns:
+    - pd.DataFrame: The clustered submatrix.
+    """
+    similarity = np.abs(np.nan_to_num(correlation.to_numpy()))
+    np.fill_diagonal(similarity, 0.0)
+    keep = np.arange(len(similarity))
+    if len(keep) > max_columns:
+        keep = np.sort(np.argpartition(-similarity.sum(axis=1), max_columns - 1)[:max_columns])
+    similarity = similarity[np.ix_(keep, keep)]
+    np.fill_diagonal(similarity, 1.0)
+    keep = keep[_cluster_order(similarity)]
+    return correlation.iloc[keep, keep]
+
+
+def aggregate_tiles(correlation, max_tiles=100):
+    """
+    Average a large matrix over square tiles of adjacent columns, so it has at most `max_tiles` rows and columns.
+
+    Parameters:
+    - correlation: A correlation matrix.
+    - max_tiles: The largest number of tiles per side.
+
+    Returns:
+    - pd.DataFrame: The tile means, labelled 'first..last' by the columns each tile covers.
+    """
+    size = len(correlation)
+    if size <= max_tiles:
+        return correlation
+    step = int(np.ceil(size / max_tiles))
+    starts = np.arange(0, size, step)
+    values = correlation.to_numpy()
+    present = ~np.isnan(values)
+    totals = np.add.reduceat(np.add.reduceat(np.where(present, values, 0.0), starts, axis=0), starts, axis=1)
+    counts = np.add.reduceat(np.add.reduceat(present.astype('float64'), starts, axis=0), starts, axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        means = totals / counts
+    names = [str(name) for name in correlation.columns]
+    labels = [f"{names[start]}..{names[min(start + step, size) - 1]}" for start in starts]
+    return pd.DataFrame(means, index=labels, columns=labels)
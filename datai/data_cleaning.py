@@ -1,16 +1,464 @@
 # datai/data_cleaning.py
 
+import contextlib
+import json
+from functools import partial, wraps
+
+import numpy as np
 import pandas as pd
 
+from datai.backends import get_backend
+from datai.dedup import SIMILARITY, duplicate_mask, near_duplicate_mask
+from datai.grouped import GroupIndex, clean_groups, fill_groups, group_outlier_mask, key_columns, scale_groups
+from datai.instrumentation import instrumented
+from datai.loaders import read_path
+from datai.memory import MemoryTracker, dtype_columns, fill_inplace, is_categorical, optimize_dtypes, scale_inplace
+from datai.parallel import column_statistics, parallel_quantiles, resolve_n_jobs
+from datai.profile import invalidate_profile, profile_data
+from datai.sketches import approximate_quantiles
+
+# Dtypes treated as numeric by the outlier and normalization steps (every width, but not booleans)
+NUMERIC_DTYPES = ['number']
+
+
+def _exact_quantiles(block, q):
+    """Column-wise exact quantiles of a 1D or 2D block, ignoring NaNs."""
+    return np.nanquantile(block, q, axis=0)
+
+
+def _fill_block(block, medians):
+    """Fill NaNs in a 2D float block in place with the per-column medians."""
+    nan_mask = np.isnan(block)
+    rows, cols = np.nonzero(nan_mask)
+    block[rows, cols] = medians[cols]
+    return nan_mask.any(axis=0)
+
+
+def _iqr_bounds(q1, q3, threshold=1.5):
+    """Return the lower and upper IQR bounds for arrays of first and third quartiles."""
+    iqr = q3 - q1
+    return q1 - threshold * iqr, q3 + threshold * iqr
+
+
+def _outlier_mask(block, threshold=1.5, sequential=True, quantiles=_exact_quantiles):
+    """
+    Build one combined row mask that keeps the rows inside the IQR bounds of every column of a 2D block.
+
+    Parameters:
+    - block: A 2D float array with one column per numeric column, or a list of 1D column arrays.
+    - threshold: The IQR multiplier for outlier bounds.
+    - sequential: If True, compute each column's bounds on the rows kept by the previous columns
+      (the historical behaviour). If False, compute all bounds on the full data at once.
+    - quantiles: The column-wise quantile function (exact or sketch-based).
+
+    Returns:
+    - np.ndarray: A boolean mask of the rows to keep.
+    """
+    columns = list(block.T) if isinstance(block, np.ndarray) else block
+    if not columns:
+        return np.ones(len(block), dtype=bool)
+    keep = np.ones(len(columns[0]), dtype=bool)
+
+    with np.errstate(all='ignore'):
+        if not sequential:
+            # All quartiles from a single call, independent of column order
+            block = block if isinstance(block, np.ndarray) else np.column_stack(columns)
+            q1, q3 = quantiles(block, [0.25, 0.75])
+            lower_bound, upper_bound = _iqr_bounds(q1, q3, threshold)
+            return ((block >= lower_bound) & (block <= upper_bound)).all(axis=1)
+
+        for column in columns:
+            q1, q3 = quantiles(column[keep], [0.25, 0.75])
+            lower_bound, upper_bound = _iqr_bounds(q1, q3, threshold)
+            keep &= (column >= lower_bound) & (column <= upper_bound)
+    return keep
+
+
+def _compute_statistics(data, quantiles=_exact_quantiles, all_fill_values=False):
+    """
+    Compute every statistic the cleaning pipeline needs in one vectorized pass.
+
+    Parameters:
+    - data: The dataset to analyze.
+    - quantiles: The column-wise quantile function (exact or sketch-based).
+    - all_fill_values: If True, compute fill values for every non-numeric column, not only those with gaps.
+
+    Returns:
+    - dict: Column groups, fill values, quartiles and the filled numeric block.
+    """
+    numeric_cols = dtype_columns(data, include=NUMERIC_DTYPES)
+    block = data[numeric_cols].to_numpy(dtype='float64', copy=True)
+
+    # Median and quartiles of every numeric column from a single quantile call
+    if block.shape[1]:
+        with np.errstate(all='ignore'):
+            q1, medians, q3 = quantiles(block, [0.25, 0.5, 0.75])
+    else:
+        q1 = medians = q3 = np.empty(0)
+
+    # Filling with the median shifts the quartiles, so recompute them only for the columns that had gaps
+    had_nulls = _fill_block(block, medians)
+    if had_nulls.any():
+        q1[had_nulls], q3[had_nulls] = quantiles(block[:, had_nulls], [0.25, 0.75])
+
+    fill_values = {}
+    for column in data.columns.difference(numeric_cols, sort=False):
+        series = data[column]
+        if not series.hasnans and not all_fill_values:
+            continue
+        if is_categorical(series.dtype):
+            mode = series.mode()
+            if not mode.empty:
+                fill_values[column] = mode[0]
+        else:
+            try:
+                fill_values[column] = series.median()
+            except TypeError:
+                continue
+
+    return {
+        "numeric_cols": numeric_cols,
+        "block": block,
+        "median": medians,
+        "q1": q1,
+        "q3": q3,
+        "fill_values": fill_values,
+        "missing": int(np.count_nonzero(had_nulls)) + len(fill_values),
+    }
+
+
+def _keep_mask(block, stats, threshold=1.5):
+    """One combined row mask for precomputed quartiles, instead of one filtered copy of the frame per column."""
+    lower_bound, upper_bound = _iqr_bounds(stats["q1"], stats["q3"], threshold)
+    return ((block >= lower_bound) & (block <= upper_bound)).all(axis=1)
+
+
+def _apply_statistics(data, stats, threshold=1.5):
+    """
+    Fill, filter and scale a dataset as one fused step using precomputed statistics.
+
+    Parameters:
+    - data: The dataset the statistics were computed on.
+    - stats: The output of `_compute_statistics`. Optional "shift"/"scale" arrays replace the min-max scaling.
+    - threshold: The IQR multiplier for outlier bounds.
+
+    Returns:
+    - pd.DataFrame: The cleaned dataset.
+    """
+    block = stats["block"]
+    keep = _keep_mask(block, stats, threshold)
+    kept = block[keep]
+
+    # Scale with the min/max of the rows that survived the filter, unless a shift/scale was supplied
+    with np.errstate(all='ignore'):
+        if "shift" in stats:
+            shift, scale = stats["shift"], stats["scale"]
+        elif len(kept):
+            shift = kept.min(axis=0)
+            scale = kept.max(axis=0) - shift
+        else:
+            shift = scale = np.full(kept.shape[1], np.nan)
+        kept -= shift
+        kept /= scale
+
+    numeric_positions = {column: i for i, column in enumerate(stats["numeric_cols"])}
+    columns = {}
+    for column in data.columns:
+        if column in numeric_positions:
+            values = kept[:, numeric_positions[column]]
+            dtype = data[column].dtype
+            # Compact float columns (e.g. from optimize_dtypes) stay compact; integers become float64
+            columns[column] = values.astype(dtype) if dtype.kind == 'f' and dtype.itemsize < 8 else values
+        else:
+            series = data[column][keep]
+            if column in stats["fill_values"]:
+                series = series.fillna(stats["fill_values"][column])
+            # The array keeps extension dtypes (category, Arrow strings) that to_numpy() would turn into objects
+            columns[column] = series.array
+    return pd.DataFrame(columns, index=data.index[keep], columns=data.columns)
+
+
+def _transform(data, stats, threshold=1.5):
+    """Clean a new dataset with statistics fitted elsewhere (without recomputing any of them)."""
+    missing = [column for column in stats["numeric_cols"] if column not in data.columns]
+    if missing:
+        raise ValueError(f"The dataset is missing the fitted numeric columns: {missing}")
+    stats = dict(stats)
+    stats["block"] = data[stats["numeric_cols"]].to_numpy(dtype='float64', copy=True)
+    _fill_block(stats["block"], stats["median"])
+    return _apply_statistics(data, stats, threshold=threshold)
+
+
+def _json_value(value):
+    """Convert a fill value to something JSON can store."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
+
+
+def _estimate_savings(data, stats, rows_kept):
+    """Estimate the full passes and bytes the fused pipeline avoided compared to the step-by-step one."""
+    frame_bytes = int(data.memory_usage(index=True, deep=False).sum())
+    numeric_bytes = stats["block"].nbytes
+    num_numeric = len(stats["numeric_cols"])
+    rows = max(len(data), 1)
+    rows_ratio = rows_kept / rows
+
+    # show_details: info, describe twice and isnull; clean_missing_data: stats and fillna;
+    # remove_outliers: two quantiles and one filter per column; normalize_data: min, max, subtract, divide
+    naive_passes = 4 + 2 + 3 * num_numeric + 4
+    # Filtered copies of the whole frame, plus the intermediates built by normalize_data
+    naive_bytes = frame_bytes * num_numeric + 4 * int(numeric_bytes * rows_ratio)
+
+    # Quantiles, optional quartile refresh, fill, mask, min/max and scale/assemble
+    fused_passes = 5 + (1 if stats["missing"] else 0)
+    fused_bytes = numeric_bytes + int(frame_bytes * rows_ratio)
+
+    return {
+        "naive_passes": naive_passes,
+        "fused_passes": fused_passes,
+        "passes_avoided": max(naive_passes - fused_passes, 0),
+        "bytes_avoided": max(naive_bytes - fused_bytes, 0),
+    }
+
+
+class CleaningTransformer:
+    """
+    Reusable cleaner: `fit` computes the medians, modes, IQR bounds and scaling once, and `transform`
+    applies them to new batches without recomputing anything.
+    """
+
+    # Fitted arrays, one value per numeric column
+    ARRAYS = ("median", "q1", "q3", "shift", "scale")
+
+    def __init__(self, threshold=1.5, remove_outliers=True, normalize=True, approximate=False, epsilon=0.01):
+        """
+        Initialize the transformer.
+
+        Parameters:
+        - threshold: The IQR multiplier for outlier bounds.
+        - remove_outliers: Whether `transform` drops rows outside the fitted IQR bounds.
+        - normalize: Whether `transform` scales numeric columns with the fitted min/max.
+        - approximate: If True, fit medians and quartiles with `approximate_quantiles` (one sort per column).
+        - epsilon: The target normalized rank error when `approximate` is True.
+        """
+        self.threshold = threshold
+        self.remove_outliers = remove_outliers
+        self.normalize = normalize
+        self.quantiles = partial(approximate_quantiles, epsilon=epsilon) if approximate else _exact_quantiles
+        self.statistics = None
+
+    def fit(self, data):
+        """
+        Compute the cleaning statistics from a dataset.
+
+        Parameters:
+        - data: The dataset to learn the statistics from.
+
+        Returns:
+        - CleaningTransformer: The fitted transformer.
+        """
+        stats = _compute_statistics(data, quantiles=self.quantiles, all_fill_values=True)
+        num_numeric = len(stats["numeric_cols"])
+        if not self.remove_outliers:
+            stats["q1"] = np.full(num_numeric, -np.inf)
+            stats["q3"] = np.full(num_numeric, np.inf)
+
+        # Scale with the min/max of the rows the outlier filter keeps, as normalize_data does after remove_outliers
+        block = stats.pop("block")
+        kept = block[_keep_mask(block, stats, self.threshold)]
+        if not self.normalize:
+            stats["shift"], stats["scale"] = np.zeros(num_numeric), np.ones(num_numeric)
+        elif len(kept):
+            stats["shift"] = kept.min(axis=0)
+            stats["scale"] = kept.max(axis=0) - stats["shift"]
+        else:
+            stats["shift"] = stats["scale"] = np.full(num_numeric, np.nan)
+
+        stats.pop("missing")
+        stats["numeric_cols"] = list(stats["numeric_cols"])
+        self.statistics = stats
+        print("\nCleaning statistics have been fitted.")
+        return self
+
+    def transform(self, data):
+        """
+        Clean a dataset with the fitted statistics.
+
+        Parameters:
+        - data: The dataset to clean; it must contain the fitted numeric columns.
+
+        Returns:
+        - pd.DataFrame: The cleaned dataset.
+        """
+        if self.statistics is None:
+            raise ValueError("The transformer has not been fitted. Call fit() or load() first.")
+        return _transform(data, self.statistics, threshold=self.threshold)
+
+    def fit_transform(self, data):
+        """Fit the transformer on a dataset and clean it."""
+        return self.fit(data).transform(data)
+
+    def _state(self):
+        """Return the fitted state as JSON-serializable metadata plus NumPy arrays."""
+        if self.statistics is None:
+            raise ValueError("The transformer has not been fitted. Call fit() first.")
+        meta = {
+            "threshold": self.threshold,
+            "remove_outliers": self.remove_outliers,
+            "normalize": self.normalize,
+            "numeric_cols": self.statistics["numeric_cols"],
+            # Stored as pairs so that non-string column names survive the round trip
+            "fill_values": [[column, _json_value(value)] for column, value in self.statistics["fill_values"].items()],
+        }
+        arrays = {name: np.asarray(self.statistics[name], dtype='float64') for name in self.ARRAYS}
+        return meta, arrays
+
+    def save(self, path):
+        """
+        Save the fitted statistics to a compact file.
+
+        Parameters:
+        - path: A file path ending in '.json' or '.npz'.
+        """
+        meta, arrays = self._state()
+        path = str(path)
+        if path.endswith('.npz'):
+            np.savez_compressed(path, meta=np.array(json.dumps(meta)), **arrays)
+        elif path.endswith('.json'):
+            meta.update({name: values.tolist() for name, values in arrays.items()})
+            with open(path, 'w') as f:
+                json.dump(meta, f)
+        else:
+            raise ValueError("Invalid file type. Use a '.json' or '.npz' path.")
+        print(f"\nCleaning statistics have been saved to {path}.")
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load a fitted transformer saved with `save`.
+
+        Parameters:
+        - path: A file path ending in '.json' or '.npz'.
+
+        Returns:
+        - CleaningTransformer: A transformer ready to `transform` new data.
+        """
+        path = str(path)
+        if path.endswith('.npz'):
+            with np.load(path) as payload:
+                meta = json.loads(payload["meta"].item())
+                arrays = {name: payload[name] for name in cls.ARRAYS}
+        elif path.endswith('.json'):
+            with open(path) as f:
+                meta = json.load(f)
+            arrays = {name: np.asarray(meta.pop(name), dtype='float64') for name in cls.ARRAYS}
+        else:
+            raise ValueError("Invalid file type. Use a '.json' or '.npz' path.")
+
+        transformer = cls(threshold=meta["threshold"], remove_outliers=meta["remove_outliers"],
+                          normalize=meta["normalize"])
+        transformer.statistics = {
+            "numeric_cols": meta["numeric_cols"],
+            "fill_values": {column: value for column, value in meta["fill_values"]},
+            **arrays,
+        }
+        return transformer
+
+
+def _tracked(method):
+    """Record the peak extra allocation of a cleaning step in `memory_report` when memory tracking is on."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not self.track_memory:
+            return method(self, *args, **kwargs)
+        with MemoryTracker() as tracker:
+            result = method(self, *args, **kwargs)
+        self.memory_report[method.__name__] = tracker.peak_bytes
+        return result
+    return wrapper
+
+
 class DataCleaning:
     """Class for cleaning and preprocessing datasets."""
 
-    def __init__(self, data: pd.DataFrame):
-        """Initialize with a dataset."""
+    def __init__(self, data: pd.DataFrame, approximate=False, epsilon=0.01, n_jobs=1, copy=True, track_memory=False,
+                 by=None):
+        """
+        Initialize with a dataset.
+
+        Parameters:
+        - data: The dataset to clean. Polars DataFrames/LazyFrames and pyarrow Tables are cleaned natively by
+          their own engines and stay in their format (`approximate`, `n_jobs` and `copy` then do not apply).
+        - approximate: If True, medians and quartiles are read from one sort per column (`approximate_quantiles`)
+          instead of `np.nanquantile`. The data is in memory, so they are still exact, just faster.
+        - epsilon: The target normalized rank error when `approximate` is True.
+        - n_jobs: The number of workers for per-column statistics (None or -1 for one per CPU core).
+        - copy: If True, work on one copy of the data made up front. If False, fill and scale the caller's
+          frame in place on its NumPy buffers (outlier removal still builds the filtered frame once).
+        - track_memory: If True, record the peak extra allocation of each step in `memory_report`.
+        - by: A key column or list of key columns (e.g. a customer or sensor id). Medians, modes, quartiles and
+          min/max are then computed per group and the key columns are left as they are. The group statistics
+          are always exact, and `n_jobs` threads sort disjoint ranges of groups.
+        """
+        self.track_memory = track_memory
+        self.memory_report = {}
+        self.backend = get_backend(data)
+        self.by = None if by is None else key_columns(by)
+        if self.by is not None:
+            self._require_pandas("Grouped cleaning")
+        # Polars and Arrow data is immutable, so it never needs a defensive copy
+        if copy and self.backend is None:
+            tracker = MemoryTracker() if track_memory else contextlib.nullcontext()
+            with tracker:
+                data = data.copy()
+            if track_memory:
+                self.memory_report["copy"] = tracker.peak_bytes
         self.data = data
-    
+        self.approximate = approximate
+        self.n_jobs = resolve_n_jobs(n_jobs)
+        quantiles = partial(approximate_quantiles, epsilon=epsilon) if approximate else _exact_quantiles
+        self.quantiles = parallel_quantiles(quantiles, self.n_jobs)
+
+    @classmethod
+    def from_path(cls, path, columns=None, filters=None, backend='pandas', n_jobs=1, **kwargs):
+        """
+        Load a CSV, Parquet or Feather file and prepare it for cleaning, reading only the needed columns and rows.
+
+        Parameters:
+        - path: The file (see `datai.loaders.read_path` for the supported formats).
+        - columns: The columns to load (defaults to all).
+        - filters: Row predicates, e.g. [('year', '>=', 2020)], pushed down to Parquet row groups.
+        - backend: 'pandas', or 'arrow' / 'polars' to clean a Parquet or Feather file natively in Arrow memory.
+        - n_jobs: The number of threads parsing a large CSV, also used for the per-column statistics.
+        - kwargs: Other `DataCleaning` options (e.g. `approximate`).
+
+        Returns:
+        - DataCleaning: The cleaner of the loaded data (not copied again, since nothing else holds it).
+        """
+        data = read_path(path, columns=columns, filters=filters, n_jobs=n_jobs, backend=backend)
+        kwargs.setdefault('copy', False)
+        return cls(data, n_jobs=n_jobs, **kwargs)
+
+    def _numeric_columns(self):
+        """Return the numeric columns to clean, leaving out the group keys."""
+        numeric_cols = dtype_columns(self.data, include=NUMERIC_DTYPES)
+        return numeric_cols if self.by is None else numeric_cols.difference(self.by, sort=False)
+
+    def _group_index(self):
+        """Factorize the group keys of the current data and sort its rows by group."""
+        return GroupIndex(self.data, self.by, n_jobs=self.n_jobs)
+
+    @instrumented
     def show_details(self):
         """Display details about the dataset."""
+        if self.backend is not None:
+            return self._show_backend_details()
+        # One cached profile for the summary and the null counts (computed in parallel when `n_jobs` > 1)
+        profile = profile_data(self.data, n_jobs=self.n_jobs)
+        summary = profile.describe
         print("Dataset Information:")
         print(self.data.info())
         print("\nData Types:")
@@ -18,53 +466,285 @@ class DataCleaning:
         print("\nNumber of Rows and Columns:")
         print(self.data.shape)
         print("\nDataset Summary:")
-        print(self.data.describe())
+        print(summary)
         print("\nFirst 5 rows of the dataset:")
         print(self.data.head())
         print("\nMissing values in each column:")
-        print(self.data.isnull().sum())
+        print(profile.nulls)
+        print("\nBasic statistics of the dataset:")
+        print(summary)
+
+    def _show_backend_details(self):
+        """Display details about a Polars or Arrow dataset, from one native summary pass."""
+        summary = self.backend.summarize(self.data)
+        print(f"Dataset Information ({self.backend.name} backend):")
+        print("\nData Types:")
+        print(summary["Data Types"])
+        print("\nNumber of Rows and Columns:")
+        print(summary["Shape"])
+        print("\nFirst 5 rows of the dataset:")
+        print(self.backend.head(self.data))
+        print("\nMissing values in each column:")
+        print(summary["Missing Values"])
         print("\nBasic statistics of the dataset:")
-        print(self.data.describe())
+        print(pd.DataFrame(summary["Summary Statistics"]))
+
+    def _require_pandas(self, step):
+        """Raise for the steps that only exist for pandas data."""
+        if self.backend is not None:
+            raise ValueError(f"{step} needs a pandas DataFrame; convert the data with datai.backends.to_pandas.")
+
+    @_tracked
+    @instrumented
+    def optimize_dtypes(self, max_category_ratio=0.5, arrow_strings=False):
+        """
+        Shrink the dataset's memory: downcast numeric columns to the narrowest safe width and store
+        low-cardinality text columns as `category` (or Arrow strings). The later steps work on the compact dtypes.
+
+        Parameters:
+        - max_category_ratio: The largest distinct-to-non-null ratio for which text columns become `category`.
+        - arrow_strings: If True, store the other text columns as Arrow strings (requires pyarrow).
+        """
+        self._require_pandas("optimize_dtypes")
+        self.dtype_report = optimize_dtypes(self.data, max_category_ratio=max_category_ratio,
+                                            arrow_strings=arrow_strings)
+        invalidate_profile(self.data)
+        print(f"\nMemory usage reduced from {self.dtype_report['bytes_before']} to "
+              f"{self.dtype_report['bytes_after']} bytes.")
+        return self.data
+
+    @_tracked
+    @instrumented
+    def remove_duplicates(self, columns=None, keep='first', exact=False, near_columns=None, threshold=SIMILARITY):
+        """
+        Remove duplicate rows, found from 64-bit row hashes rather than by comparing rows.
 
+        Parameters:
+        - columns: The key columns identifying a row (defaults to all).
+        - keep: Which row of each group of duplicates is kept: 'first', 'last' or False (none).
+        - exact: If True, rows sharing a hash are also compared on their values, ruling out hash collisions.
+        - near_columns: Text columns whose near-duplicates (MinHash similarity of at least `threshold`) are
+          also removed, keeping the first row of each group.
+        - threshold: The Jaccard similarity of near-duplicate texts.
+        """
+        if self.backend is not None:
+            if near_columns:
+                self._require_pandas("Near-duplicate removal")
+            self.data = self.backend.drop_duplicates(self.data, columns=columns, keep=keep)
+            print("\nDuplicate rows have been removed.")
+            return self.data
+        dropped = duplicate_mask(self.data, columns=columns, keep=keep, exact=exact)
+        duplicates = int(dropped.sum())
+        if near_columns:
+            remaining = np.flatnonzero(~dropped)
+            near = near_duplicate_mask(self.data.iloc[remaining], near_columns, threshold=threshold)
+            dropped[remaining[near]] = True
+        self.duplicate_report = {
+            "rows_in": len(self.data),
+            "duplicates": duplicates,
+            "near_duplicates": int(dropped.sum()) - duplicates,
+        }
+        if dropped.any():
+            self.data = self.data[~dropped]
+        print(f"\n{int(dropped.sum())} duplicate rows have been removed.")
+        return self.data
+
+    @_tracked
+    @instrumented
     def clean_missing_data(self):
         """Handle missing data by filling with median for numeric columns and mode for categorical columns."""
+        if self.backend is not None:
+            self.data = self.backend.fill_missing(self.data)
+            print("\nMissing values have been handled.")
+            return self.data
+        if self.by is not None:
+            fill_groups(self.data, self._group_index(), self._numeric_columns())
+            invalidate_profile(self.data)
+            print("\nMissing values have been handled per group.")
+            return self.data
+        if self.n_jobs > 1 and not self.approximate:
+            return self._clean_missing_data_parallel()
         for column in self.data.columns:
-            if self.data[column].dtype == "object":
+            if not self.data[column].hasnans:
+                continue
+            if is_categorical(self.data[column].dtype):
                 # Fill missing values in categorical columns with the mode
-                self.data[column].fillna(self.data[column].mode()[0], inplace=True)
+                fill_inplace(self.data, column, self.data[column].mode()[0])
+            elif self.approximate and pd.api.types.is_numeric_dtype(self.data[column].dtype):
+                # Fill missing values in numeric columns with the median read from the sorted column
+                fill_inplace(self.data, column, self.quantiles(self.data[column].to_numpy(dtype='float64'), 0.5))
             else:
                 # Fill missing values in numeric columns with the median
-                self.data[column].fillna(self.data[column].median(), inplace=True)
+                fill_inplace(self.data, column, self.data[column].median())
+        invalidate_profile(self.data)
         print("\nMissing values have been handled.")
         return self.data
     
-    def remove_outliers(self, threshold=1.5):
-        """Remove outliers using the IQR method."""
-        numeric_cols = self.data.select_dtypes(include=['float64', 'int64']).columns
-        for col in numeric_cols:
-            Q1 = self.data[col].quantile(0.25)
-            Q3 = self.data[col].quantile(0.75)
-            IQR = Q3 - Q1
-            lower_bound = Q1 - threshold * IQR
-            upper_bound = Q3 + threshold * IQR
-            # Filter out outliers
-            self.data = self.data[(self.data[col] >= lower_bound) & (self.data[col] <= upper_bound)]
+    def _clean_missing_data_parallel(self):
+        """Compute the medians and modes of the columns with gaps concurrently, then fill them."""
+        gaps = self.data.columns[self.data.isnull().any().to_numpy()]
+        statistics = column_statistics(self.data, n_jobs=self.n_jobs, columns=gaps)
+        for column in gaps:
+            if column in statistics:
+                # "50%" is the median of numeric columns, "mode" the mode of categorical ones
+                stats = statistics[column]
+                fill_value = stats["50%"] if "50%" in stats else stats["mode"]
+            else:
+                fill_value = self.data[column].median()
+            fill_inplace(self.data, column, fill_value)
+        invalidate_profile(self.data)
+        print("\nMissing values have been handled.")
+        return self.data
+
+    @_tracked
+    @instrumented
+    def remove_outliers(self, threshold=1.5, sequential=True):
+        """
+        Remove outliers using the IQR method.
+
+        Parameters:
+        - threshold: The IQR multiplier for outlier bounds.
+        - sequential: If True, each column's bounds are computed on the rows kept by the previous columns.
+          If False, every column's bounds are computed on the full data, independent of column order.
+        """
+        if self.backend is not None:
+            self.data = self.backend.remove_outliers(self.data, threshold=threshold, sequential=sequential)
+            print("\nOutliers have been removed.")
+            return self.data
+        numeric_cols = self._numeric_columns()
+        if self.by is not None:
+            keep = group_outlier_mask(self.data, self._group_index(), numeric_cols, threshold=threshold,
+                                      sequential=sequential)
+            self.data = self.data[keep]
+            print("\nOutliers have been removed per group.")
+            return self.data
+        # Column views share the frame's buffers; only the order-independent mode stacks them into one block
+        columns = [self.data[column].to_numpy(dtype='float64') for column in numeric_cols]
+        keep = _outlier_mask(columns or np.empty((len(self.data), 0)), threshold=threshold, sequential=sequential, quantiles=self.quantiles)
+        # Filter out outliers with one combined mask and a single slice of the frame
+        self.data = self.data[keep]
         print("\nOutliers have been removed.")
         return self.data
     
+    @_tracked
+    @instrumented
     def normalize_data(self):
-        """Normalize numeric data to a 0-1 scale."""
-        numeric_cols = self.data.select_dtypes(include=['float64', 'int64']).columns
-        self.data[numeric_cols] = (self.data[numeric_cols] - self.data[numeric_cols].min()) / (self.data[numeric_cols].max() - self.data[numeric_cols].min())
+        """Normalize numeric data to a 0-1 scale (within each group when the cleaner has `by` keys)."""
+        if self.backend is not None:
+            self.data = self.backend.normalize(self.data)
+            print("\nNumeric data has been normalized.")
+            return self.data
+        numeric_cols = self._numeric_columns()
+        if self.by is not None:
+            scale_groups(self.data, self._group_index(), numeric_cols)
+            invalidate_profile(self.data)
+            print("\nNumeric data has been normalized per group.")
+            return self.data
+        for column in numeric_cols:
+            col_min, col_max = self.data[column].min(), self.data[column].max()
+            # Scale column by column, so the only temporary is at most one column wide
+            scale_inplace(self.data, column, col_min, col_max - col_min)
+        invalidate_profile(self.data)
         print("\nNumeric data has been normalized.")
         return self.data
     
-    def get_cleaned_data(self):
-        """Return the cleaned and preprocessed dataset."""
+    @_tracked
+    @instrumented
+    def fused_clean(self, threshold=1.5):
+        """
+        Clean the dataset with a planned pipeline: one statistics pass, then fill, filter and scale fused into one step.
+
+        Outlier bounds are computed per column on the filled data, so they do not depend on column order.
+        A report of the passes and bytes avoided is stored in `self.report`.
+        """
+        if self.backend is not None:
+            # The engine plans the whole query itself, so there is no pass accounting to report
+            self.data = self.backend.clean(self.data, threshold=threshold)
+            print(f"\nFused pipeline has been run by the {self.backend.name} engine.")
+            return self.data
+        if self.by is not None:
+            return self._fused_clean_groups(threshold)
+        rows_in = len(self.data)
+        stats = _compute_statistics(self.data, quantiles=self.quantiles)
+        cleaned = _apply_statistics(self.data, stats, threshold=threshold)
+        self.report = {
+            "rows_in": rows_in,
+            "rows_out": len(cleaned),
+            "columns_with_missing": stats["missing"],
+            **_estimate_savings(self.data, stats, len(cleaned)),
+        }
+        self.data = cleaned
+        print(f"\nFused pipeline avoided {self.report['passes_avoided']} passes and "
+              f"{self.report['bytes_avoided']} bytes of intermediate copies.")
+        return self.data
+
+    def _fused_clean_groups(self, threshold=1.5):
+        """The fused pipeline with per-group statistics, from one sort of each numeric column."""
+        index = self._group_index()
+        rows_in = len(self.data)
+        self.data, missing = clean_groups(self.data, index, self._numeric_columns(), threshold=threshold)
+        self.report = {
+            "rows_in": rows_in,
+            "rows_out": len(self.data),
+            "columns_with_missing": missing,
+            "groups": len(index),
+        }
+        print(f"\nFused pipeline has cleaned {len(index)} groups.")
+        return self.data
+
+    def fit(self, threshold=1.5):
+        """
+        Fit a reusable `CleaningTransformer` on this dataset, so new batches can be cleaned without refitting.
+
+        Parameters:
+        - threshold: The IQR multiplier for outlier bounds.
+
+        Returns:
+        - CleaningTransformer: The fitted transformer.
+        """
+        self._require_pandas("fit")
+        if self.by is not None:
+            raise ValueError("A CleaningTransformer holds global statistics; fit it without `by`.")
+        transformer = CleaningTransformer(threshold=threshold)
+        transformer.quantiles = self.quantiles
+        return transformer.fit(self.data)
+
+    @instrumented
+    def get_cleaned_data(self, fused=False, optimize_dtypes=False, deduplicate=False):
+        """
+        Return the cleaned and preprocessed dataset.
+
+        Parameters:
+        - fused: If True, run the single-pass planned pipeline instead of the individual steps.
+        - optimize_dtypes: If True, start by shrinking the dataset to compact dtypes.
+        - deduplicate: If True, start by removing duplicate rows; pass a list of key columns, or a dict of
+          `remove_duplicates` options (e.g. {"near_columns": ["message"]}), to configure it.
+        """
+        if deduplicate is not False and deduplicate is not None:
+            if deduplicate is True:
+                options = {}
+            elif isinstance(deduplicate, dict):
+                options = deduplicate
+            else:
+                options = {"columns": list(deduplicate)}
+            self.remove_duplicates(**options)
+        if optimize_dtypes:
+            self.optimize_dtypes()
+        if fused:
+            if self.backend is None:
+                print("Dataset shape:", self.data.shape)
+            self.fused_clean()
+            if self.track_memory:
+                print(f"\nPeak extra allocation: {max(self.memory_report.values())} bytes.")
+            print("\nDataset has been cleaned and preprocessed.")
+            return self.data
+
         self.show_details()
         self.clean_missing_data()
         self.remove_outliers()
         self.normalize_data()
+        if self.track_memory:
+            print(f"\nPeak extra allocation: {max(self.memory_report.values())} bytes.")
         print("\nDataset has been cleaned and preprocessed.")
 
         return self.data
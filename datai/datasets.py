@@ -0,0 +1,213 @@
+# datai/datasets.py
+
+import json
+import os
+import shutil
+import tempfile
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# The seaborn datasets used by `Examples`
+EXAMPLE_DATASETS = ('flights', 'iris', 'mpg', 'penguins', 'planets', 'tips', 'titanic')
+# The number of datasets kept in memory
+MAX_LOADED = 16
+
+
+def data_home(path=None):
+    """
+    Return the directory of the local dataset store.
+
+    Defaults to the DATAI_DATA_HOME environment variable, else `~/.cache/datai`. Copying this directory
+    to another host makes the datasets available there without a network.
+    """
+    path = path or os.environ.get('DATAI_DATA_HOME') or os.path.join('~', '.cache', 'datai')
+    return os.path.expanduser(path)
+
+
+def _has_pyarrow():
+    """Return True if pyarrow is installed, so datasets are stored as Feather files."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _feather_path(name, home):
+    return os.path.join(home, f"{name}.feather")
+
+
+def _npy_path(name, home):
+    return os.path.join(home, f"{name}.npy.d")
+
+
+def _encode_column(values, prefix, arrays):
+    """Add the arrays storing one column to `arrays` and return its metadata, without pickling objects."""
+    dtype = values.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        arrays[f"{prefix}.codes"] = values.cat.codes.to_numpy()
+        categories = _encode_column(pd.Series(dtype.categories), f"{prefix}.categories", arrays)
+        return {"kind": "category", "ordered": bool(dtype.ordered), "categories": categories}
+    if isinstance(dtype, np.dtype) and dtype.kind in 'biufcmM':
+        arrays[f"{prefix}.values"] = values.to_numpy()
+        return {"kind": "array"}
+    if dtype == object:
+        mask = values.isna().to_numpy()
+        if not values[~mask].map(type).eq(str).all():
+            raise ValueError(f"Column '{values.name}' holds non-string objects, which the store cannot save.")
+        arrays[f"{prefix}.values"] = values.fillna('').to_numpy(dtype=str)
+        arrays[f"{prefix}.mask"] = mask
+        return {"kind": "string"}
+    raise ValueError(f"Column '{values.name}' has the unsupported dtype {dtype}.")
+
+
+def _decode_column(meta, prefix, arrays):
+    """Rebuild one column from its metadata and arrays."""
+    if meta["kind"] == "category":
+        categories = _decode_column(meta["categories"], f"{prefix}.categories", arrays)
+        return pd.Categorical.from_codes(arrays[f"{prefix}.codes"], categories=categories, ordered=meta["ordered"])
+    if meta["kind"] == "string":
+        values = arrays[f"{prefix}.values"].astype(object)
+        values[arrays[f"{prefix}.mask"]] = np.nan
+        return values
+    return arrays[f"{prefix}.values"]
+
+
+def _write_npy(data, path):
+    """Write a dataset as a directory of .npy files (one per array) plus JSON metadata."""
+    arrays = {}
+    columns = [{"name": str(column), "meta": _encode_column(data[column], f"c{i}", arrays)}
+               for i, column in enumerate(data.columns)]
+    for key, values in arrays.items():
+        np.save(os.path.join(path, f"{key}.npy"), values, allow_pickle=False)
+    with open(os.path.join(path, "meta.json"), "w") as file:
+        json.dump({"rows": len(data), "columns": columns}, file)
+
+
+def _read_npy(path):
+    """Read a dataset written by `_write_npy`, memory-mapping its arrays."""
+    with open(os.path.join(path, "meta.json")) as file:
+        meta = json.load(file)
+    arrays = {}
+    for file_name in os.listdir(path):
+        if file_name.endswith(".npy"):
+            arrays[file_name[:-4]] = np.load(os.path.join(path, file_name), mmap_mode='r', allow_pickle=False)
+    columns = {column["name"]: _decode_column(column["meta"], f"c{i}", arrays)
+               for i, column in enumerate(meta["columns"])}
+    return pd.DataFrame(columns, index=pd.RangeIndex(meta["rows"]))
+
+
+def save_dataset(name, data, path=None):
+    """
+    Store a dataset in the local store, where `load_dataset(name)` finds it.
+
+    Datasets are stored as uncompressed Feather files when pyarrow is installed, so reading them is a memory
+    map without decompression, else as a directory of .npy arrays.
+    Both are written to a temporary location first and then moved into place, so concurrent readers
+    never see a partial file.
+
+    Parameters:
+    - name: The dataset name.
+    - data: The dataset (with a default RangeIndex).
+    - path: The store directory (see `data_home`).
+
+    Returns:
+    - str: The path of the stored dataset.
+    """
+    home = data_home(path)
+    os.makedirs(home, exist_ok=True)
+    data = data.reset_index(drop=True)
+    if _has_pyarrow():
+        target = _feather_path(name, home)
+        handle, temporary = tempfile.mkstemp(dir=home, suffix=".tmp")
+        os.close(handle)
+        try:
+            data.to_feather(temporary, compression='uncompressed')
+            os.replace(temporary, target)
+        except BaseException:
+            os.remove(temporary)
+            raise
+    else:
+        target = _npy_path(name, home)
+        temporary = tempfile.mkdtemp(dir=home, suffix=".tmp")
+        try:
+            _write_npy(data, temporary)
+            if os.path.isdir(target):
+                shutil.rmtree(target)
+            os.replace(temporary, target)
+        except BaseException:
+            shutil.rmtree(temporary, ignore_errors=True)
+            raise
+    _load.cache_clear()
+    return target
+
+
+def _read_stored(name, home):
+    """
+    Read a dataset from the store, or return None if it is not stored.
+
+    Feather files are uncompressed, so they come back as memory-mapped Arrow tables that hold no heap copy;
+    `load_dataset` converts them to a fresh DataFrame on each call.
+    """
+    feather = _feather_path(name, home)
+    if os.path.exists(feather) and _has_pyarrow():
+        import pyarrow.feather as pf
+        return pf.read_table(feather, memory_map=True)
+    npy = _npy_path(name, home)
+    if os.path.isdir(npy):
+        return _read_npy(npy)
+    return None
+
+
+@lru_cache(maxsize=MAX_LOADED)
+def _load(name, home):
+    """Load a dataset from the store, downloading it with seaborn and storing it if it is missing."""
+    data = _read_stored(name, home)
+    if data is None:
+        import seaborn as sns
+        data = sns.load_dataset(name)
+        try:
+            save_dataset(name, data, path=home)
+        except (OSError, ValueError):
+            # Datasets the store cannot hold are still returned; they are just fetched again next time
+            return data
+        # Keep the memory-mapped copy rather than the downloaded frame
+        data = _read_stored(name, home)
+    return data
+
+
+def load_dataset(name, path=None):
+    """
+    Load a dataset from the local store, fetching it with `seaborn.load_dataset` only on first use.
+
+    Loaded datasets are kept in an in-process LRU cache, so repeated calls do not touch the disk.
+
+    Parameters:
+    - name: The dataset name (e.g. 'tips').
+    - path: The store directory (see `data_home`).
+
+    Returns:
+    - pd.DataFrame: A copy of the dataset that the caller may modify.
+    """
+    data = _load(name, data_home(path))
+    # An Arrow table is converted once per call, so the caller's frame is never shared with the cache
+    return data.copy() if isinstance(data, pd.DataFrame) else data.to_pandas()
+
+
+def prefetch(names=EXAMPLE_DATASETS, path=None):
+    """
+    Fill the local store with datasets, e.g. on a networked host before copying the store to air-gapped ones.
+
+    Returns:
+    - list: The stored dataset names.
+    """
+    for name in names:
+        _load(name, data_home(path))
+    return list(names)
+
+
+def clear_cache():
+    """Drop the datasets kept in memory (the on-disk store is kept)."""
+    _load.cache_clear()
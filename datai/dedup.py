@@ -0,0 +1,398 @@
+# datai/dedup.py
+
+import math
+
+import numpy as np
+import pandas as pd
+
+# Integers, and floats holding whole numbers, hash the same way, so a column read as int64 in one chunk and as
+# float64 (because of a missing value) in the next still matches. Missing numbers hash as this bit pattern
+NULL_BITS = np.float64('nan').view('int64')
+# Near-duplicate detection: MinHash permutations, character shingle size and the default Jaccard similarity
+NUM_PERM = 64
+SHINGLE_SIZE = 5
+SIMILARITY = 0.8
+# Bloom filter false positive rate (the fraction of new rows wrongly dropped as already seen)
+ERROR_RATE = 1e-6
+# Text columns are hashed per distinct value when at most half of this many leading values are distinct
+CARDINALITY_SAMPLE = 10_000
+METHODS = ('exact', 'bloom')
+KEEP = ('first', 'last', False)
+
+
+def _mix(values):
+    """The splitmix64 finalizer, applied to an array of uint64 (uint64 arrays wrap around on overflow)."""
+    values = values ^ (values >> np.uint64(30))
+    values *= np.uint64(0xBF58476D1CE4E5B9)
+    values ^= values >> np.uint64(27)
+    values *= np.uint64(0x94D049BB133111EB)
+    values ^= values >> np.uint64(31)
+    return values
+
+
+def _hash_input(values):
+    """The array actually hashed for a column: numbers as int64 (whole floats as integers), the rest unchanged."""
+    dtype = values.dtype
+    if pd.api.types.is_bool_dtype(dtype) or not pd.api.types.is_numeric_dtype(dtype) \
+            or pd.api.types.is_complex_dtype(dtype):
+        return values.array
+    if pd.api.types.is_integer_dtype(dtype):
+        if pd.api.types.is_unsigned_integer_dtype(dtype) and values.max() > np.iinfo('int64').max:
+            return values.array
+        return values.to_numpy(dtype='int64', na_value=NULL_BITS)
+    numbers = values.to_numpy(dtype='float64', na_value=np.nan)
+    bits = numbers.view('int64').copy()
+    with np.errstate(invalid='ignore'):
+        whole = (np.mod(numbers, 1) == 0) & (np.abs(numbers) < 2.0 ** 63)
+    bits[whole] = numbers[whole].astype('int64')
+    bits[np.isnan(numbers)] = NULL_BITS
+    return bits
+
+
+def row_hashes(data, columns=None):
+    """
+    Hash every row of a DataFrame to 64 bits, vectorized over the columns.
+
+    Equal rows always get equal hashes, also across chunks of one file (whole numbers hash alike whether the
+    column is int or float). Distinct rows collide with probability about n^2 / 2^65 (3e-4 for 100M rows).
+
+    Parameters:
+    - data: The DataFrame.
+    - columns: The key columns (defaults to all).
+
+    Returns:
+    - np.ndarray: One uint64 hash per row.
+    """
+    subset = data if columns is None else data[list(columns)]
+    if subset.shape[1] == 0:
+        raise ValueError("Duplicate detection needs at least one key column.")
+    hashes = np.zeros(len(subset), dtype='uint64')
+    # By position, so duplicated column names are fine
+    for i in range(subset.shape[1]):
+        hashes ^= _column_hashes(subset.iloc[:, i])
+        hashes = _mix(hashes)
+    return hashes
+
+
+def _column_hashes(values):
+    """Hash one column; values are hashed once per distinct value when a sample shows few distinct values."""
+    values = pd.Series(_hash_input(values), copy=False)
+    categorize = False
+    if pd.api.types.is_string_dtype(values.dtype):
+        sample = values.iloc[:CARDINALITY_SAMPLE]
+        categorize = sample.nunique() <= len(sample) // 2
+    try:
+        hashes = pd.util.hash_pandas_object(values, index=False, categorize=categorize)
+    except TypeError:
+        # Unhashable cells (lists, dicts) are hashed through their text form
+        hashes = pd.util.hash_pandas_object(values.astype(str), index=False)
+    return hashes.to_numpy()
+
+
+def duplicate_mask(data, columns=None, keep='first', exact=False):
+    """
+    Find duplicate rows from their 64-bit hashes instead of comparing the rows themselves.
+
+    Parameters:
+    - data: The DataFrame.
+    - columns: The key columns (defaults to all).
+    - keep: Which row of each group of duplicates is kept: 'first', 'last' or False (none).
+    - exact: If True, rows sharing a hash are also compared on their values, so a hash collision can never
+      drop a distinct row (only the few colliding rows are compared).
+
+    Returns:
+    - np.ndarray: True for the rows to drop.
+    """
+    if keep not in KEEP:
+        raise ValueError("Invalid keep option. Use 'first', 'last' or False.")
+    hashes = pd.Series(row_hashes(data, columns), copy=False)
+    duplicated = hashes.duplicated(keep=keep).to_numpy()
+    if exact and duplicated.any():
+        candidates = np.flatnonzero(hashes.duplicated(keep=False).to_numpy())
+        subset = data.iloc[candidates] if columns is None else data[list(columns)].iloc[candidates]
+        duplicated = np.zeros(len(data), dtype=bool)
+        duplicated[candidates] = subset.duplicated(keep=keep).to_numpy()
+    return duplicated
+
+
+class HashSet:
+    """
+    Exact set of 64-bit hashes stored in sorted runs: 8 bytes per hash, with no per-entry Python objects.
+
+    Runs are merged when they reach a similar size, so there are O(log n) of them, each searched with binary
+    search, and each hash is merged O(log n) times.
+    """
+
+    def __init__(self):
+        self.runs = []
+
+    def contains(self, hashes):
+        """Return a mask of the hashes already in the set."""
+        found = np.zeros(len(hashes), dtype=bool)
+        for run in self.runs:
+            positions = np.searchsorted(run, hashes)
+            np.minimum(positions, len(run) - 1, out=positions)
+            found |= run[positions] == hashes
+        return found
+
+    def add(self, hashes):
+        """Add hashes that are distinct and not yet in the set."""
+        if not len(hashes):
+            return
+        self.runs.append(np.sort(hashes))
+        while len(self.runs) > 1 and len(self.runs[-2]) <= 2 * len(self.runs[-1]):
+            last = self.runs.pop()
+            merged = np.concatenate([self.runs.pop(), last])
+            # Timsort merges the two sorted halves in linear time
+            merged.sort(kind='stable')
+            self.runs.append(merged)
+
+    @property
+    def nbytes(self):
+        return sum(run.nbytes for run in self.runs)
+
+    def __len__(self):
+        return sum(len(run) for run in self.runs)
+
+
+class BloomFilter:
+    """
+    Bloom filter over 64-bit hashes: about 1.4 bytes per row at a 1e-3 error rate, 3.6 bytes at 1e-6.
+
+    Membership is approximate: a new hash is reported as present with probability `error_rate` (once
+    `capacity` hashes were added), and never the other way round.
+    """
+
+    def __init__(self, capacity, error_rate=ERROR_RATE):
+        """
+        Initialize an empty filter.
+
+        Parameters:
+        - capacity: The expected number of distinct hashes.
+        - error_rate: The false positive rate at that capacity.
+        """
+        if capacity <= 0 or not 0 < error_rate < 1:
+            raise ValueError("The Bloom filter needs a positive capacity and an error rate between 0 and 1.")
+        n_bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.words = np.zeros((n_bits + 63) // 64, dtype='uint64')
+        self.n_bits = len(self.words) * 64
+        self.n_hashes = max(round(self.n_bits / capacity * math.log(2)), 1)
+        self.count = 0
+
+    def _positions(self, hashes):
+        """The bit positions of each hash, by double hashing (h1 + i * h2)."""
+        step = _mix(hashes) | np.uint64(1)
+        position = hashes.copy()
+        for _ in range(self.n_hashes):
+            yield position % np.uint64(self.n_bits)
+            position += step
+
+    def contains(self, hashes):
+        """Return a mask of the hashes probably in the filter."""
+        found = np.ones(len(hashes), dtype=bool)
+        for bit in self._positions(hashes):
+            found &= (self.words[bit >> np.uint64(6)] >> (bit & np.uint64(63))) & np.uint64(1) == 1
+        return found
+
+    def add(self, hashes):
+        """Add hashes to the filter."""
+        for bit in self._positions(hashes):
+            np.bitwise_or.at(self.words, bit >> np.uint64(6), np.uint64(1) << (bit & np.uint64(63)))
+        self.count += len(hashes)
+
+    @property
+    def nbytes(self):
+        return self.words.nbytes
+
+    def __len__(self):
+        return self.count
+
+
+class StreamingDeduplicator:
+    """
+    Drop rows already seen in earlier chunks (or earlier in the same chunk), keeping each row's first occurrence.
+
+    Only the 64-bit hash of each distinct row is remembered: exactly in a `HashSet` (8 bytes per distinct row),
+    or in a `BloomFilter` (a few bytes per row, but about `error_rate` of the new rows are wrongly dropped).
+    """
+
+    def __init__(self, columns=None, method='exact', capacity=None, error_rate=ERROR_RATE):
+        """
+        Initialize the deduplicator.
+
+        Parameters:
+        - columns: The key columns (defaults to all).
+        - method: 'exact' for a hash set, or 'bloom' for a Bloom filter.
+        - capacity: The expected number of distinct rows (required by 'bloom').
+        - error_rate: The Bloom filter's false positive rate at that capacity.
+        """
+        if method not in METHODS:
+            raise ValueError(f"Invalid method '{method}'. Use one of: {', '.join(METHODS)}.")
+        if method == 'bloom':
+            if capacity is None:
+                raise ValueError("The 'bloom' method needs the expected number of distinct rows (capacity).")
+            self.seen = BloomFilter(capacity, error_rate=error_rate)
+        else:
+            self.seen = HashSet()
+        self.columns = columns
+        self.rows_in = 0
+        self.rows_dropped = 0
+
+    def transform(self, chunk):
+        """
+        Return the rows of a chunk that were not seen before.
+
+        Parameters:
+        - chunk: A DataFrame.
+
+        Returns:
+        - pd.DataFrame: The new rows, in their order.
+        """
+        hashes = row_hashes(chunk, self.columns)
+        new = ~pd.Series(hashes, copy=False).duplicated().to_numpy()
+        new[new] = ~self.seen.contains(hashes[new])
+        self.seen.add(hashes[new])
+        self.rows_in += len(chunk)
+        self.rows_dropped += int(len(chunk) - new.sum())
+        return chunk if new.all() else chunk[new]
+
+    @property
+    def nbytes(self):
+        """The memory held by the remembered hashes."""
+        return self.seen.nbytes
+
+
+def make_deduplicator(option):
+    """
+    Turn a `deduplicate` option into a StreamingDeduplicator (None when it is off).
+
+    Parameters:
+    - option: False/None, True (every column), a list of key columns, or a dict of StreamingDeduplicator options.
+    """
+    if option is None or option is False:
+        return None
+    if option is True:
+        return StreamingDeduplicator()
+    if isinstance(option, dict):
+        return StreamingDeduplicator(**option)
+    return StreamingDeduplicator(columns=list(option))
+
+
+def _shingles(text, size):
+    """The distinct character shingles of a text (the text itself when shorter than `size`)."""
+    return list({text[i:i + size] for i in range(max(len(text) - size + 1, 1))})
+
+
+def minhash_signatures(texts, num_perm=NUM_PERM, shingle_size=SHINGLE_SIZE, seed=0):
+    """
+    Compute MinHash signatures of texts from their character shingles.
+
+    Each shingle is hashed once; the `num_perm` permutations are multiply-shift hash functions applied to the
+    whole array of shingle hashes, and the minimum per text is taken with one `reduceat` per permutation.
+    The fraction of equal entries of two signatures estimates the Jaccard similarity of their shingle sets.
+
+    Parameters:
+    - texts: A sequence of strings.
+    - num_perm: The length of the signatures.
+    - shingle_size: The number of characters per shingle.
+    - seed: The random seed of the permutations.
+
+    Returns:
+    - np.ndarray: A (len(texts), num_perm) uint32 array.
+    """
+    shingles = [_shingles(text, shingle_size) for text in texts]
+    counts = np.fromiter((len(items) for items in shingles), dtype='int64', count=len(shingles))
+    flat = np.fromiter((item for items in shingles for item in items), dtype=object, count=int(counts.sum()))
+    hashes = pd.util.hash_array(flat) if len(flat) else np.empty(0, dtype='uint64')
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]]).astype('int64')
+
+    rng = np.random.default_rng(seed)
+    multipliers = rng.integers(0, 2 ** 63, size=num_perm, dtype='uint64') * np.uint64(2) + np.uint64(1)
+    offsets = rng.integers(0, 2 ** 63, size=num_perm, dtype='uint64')
+    signatures = np.empty((len(texts), num_perm), dtype='uint32')
+    if not len(texts):
+        return signatures
+    permuted = np.empty_like(hashes)
+    with np.errstate(over='ignore'):
+        for i in range(num_perm):
+            np.multiply(hashes, multipliers[i], out=permuted)
+            permuted += offsets[i]
+            # The high bits of a multiply-shift hash are the well-mixed ones
+            signatures[:, i] = np.minimum.reduceat(permuted >> np.uint64(32), starts)
+    return signatures
+
+
+def _bands(num_perm, threshold):
+    """The LSH banding (bands, rows per band) whose similarity threshold (1/bands)^(1/rows) is closest to `threshold`."""
+    options = [(bands, num_perm // bands) for bands in range(1, num_perm + 1) if num_perm % bands == 0]
+    return min(options, key=lambda option: abs((1 / option[0]) ** (1 / option[1]) - threshold))
+
+
+def _components(n, left, right):
+    """Connected components of a graph given by its edges: each node is labelled with the smallest node it reaches."""
+    labels = np.arange(n)
+    while True:
+        low = np.minimum(labels[left], labels[right])
+        updated = labels.copy()
+        np.minimum.at(updated, left, low)
+        np.minimum.at(updated, right, low)
+        # Pointer jumping: follow each label to its own label
+        updated = updated[updated]
+        if np.array_equal(updated, labels):
+            return labels
+        labels = updated
+
+
+def near_duplicate_mask(data, columns, threshold=SIMILARITY, num_perm=NUM_PERM, shingle_size=SHINGLE_SIZE, seed=0):
+    """
+    Find rows whose text is nearly the same as an earlier row's, with MinHash and locality-sensitive hashing.
+
+    Rows are grouped by bands of their signatures; a row sharing a band with another is compared with that
+    group's first row, and linked to it when their estimated Jaccard similarity reaches `threshold`. Every row
+    linked (directly or through others) to an earlier one is a near-duplicate; the earliest row of each group
+    is kept. Rows without text are never dropped.
+
+    Parameters:
+    - data: The DataFrame.
+    - columns: The text columns compared (joined per row).
+    - threshold: The Jaccard similarity of character shingles from which rows are near-duplicates.
+    - num_perm: The MinHash signature length (more is more accurate and slower).
+    - shingle_size: The number of characters per shingle.
+    - seed: The random seed of the MinHash permutations.
+
+    Returns:
+    - np.ndarray: True for the rows to drop.
+    """
+    if not columns:
+        raise ValueError("Near-duplicate detection needs at least one text column.")
+    text = None
+    for column in columns:
+        values = data[column].astype('string').fillna('').str.lower().str.split().str.join(' ')
+        text = values if text is None else text + '\x1f' + values
+    text = text.to_numpy(dtype=object)
+    # Only rows with text take part
+    rows = np.flatnonzero(text != '\x1f'.join([''] * len(columns)))
+    dropped = np.zeros(len(data), dtype=bool)
+    if len(rows) < 2:
+        return dropped
+
+    signatures = minhash_signatures(text[rows], num_perm=num_perm, shingle_size=shingle_size, seed=seed)
+    bands, width = _bands(num_perm, threshold)
+    left, right = [], []
+    for band in range(bands):
+        keys = pd.util.hash_pandas_object(pd.DataFrame(signatures[:, band * width:(band + 1) * width]), index=False)
+        order = np.argsort(keys.to_numpy(), kind='stable')
+        sorted_keys = keys.to_numpy()[order]
+        # The first row of each bucket, for every row of the bucket
+        starts = np.concatenate([[True], sorted_keys[1:] != sorted_keys[:-1]])
+        first = order[np.flatnonzero(starts)[np.cumsum(starts) - 1]]
+        candidates = np.flatnonzero(first != order)
+        members, heads = order[candidates], first[candidates]
+        similar = (signatures[members] == signatures[heads]).mean(axis=1) >= threshold
+        left.append(members[similar])
+        right.append(heads[similar])
+    left, right = np.concatenate(left), np.concatenate(right)
+    if len(left):
+        labels = _components(len(rows), left, right)
+        dropped[rows] = labels != np.arange(len(rows))
+    return dropped
@@ -0,0 +1,109 @@
+# datai/downsample.py
+
+import numpy as np
+import pandas as pd
+
+
+def _as_float(values):
+    """Return values as a float array; datetimes become their integer timestamps."""
+    values = pd.Series(values) if not isinstance(values, pd.Series) else values
+    if pd.api.types.is_datetime64_any_dtype(values.dtype):
+        return values.to_numpy(dtype='datetime64[ns]').astype('int64').astype('float64')
+    return values.to_numpy(dtype='float64', na_value=np.nan)
+
+
+def minmax_indices(y, n_buckets):
+    """
+    Pick the positions of the minimum and maximum of each of `n_buckets` equal runs of `y`.
+
+    Drawing only these points reproduces the visual envelope of a line at the given horizontal resolution.
+
+    Parameters:
+    - y: The values in drawing order.
+    - n_buckets: The number of buckets, usually the plot width in pixels.
+
+    Returns:
+    - np.ndarray: Sorted positions to keep (always including the first and last point).
+    """
+    y = _as_float(y)
+    n = len(y)
+    if n <= 2 * n_buckets:
+        return np.arange(n)
+    per_bucket = int(np.ceil(n / n_buckets))
+    rows = int(np.ceil(n / per_bucket))
+    padded = np.full(rows * per_bucket, np.nan)
+    padded[:n] = y
+    grid = padded.reshape(rows, per_bucket)
+    offsets = np.arange(rows) * per_bucket
+    lows = np.where(np.isnan(grid), np.inf, grid).argmin(axis=1) + offsets
+    highs = np.where(np.isnan(grid), -np.inf, grid).argmax(axis=1) + offsets
+    return np.unique(np.concatenate([[0, n - 1], lows, highs]))
+
+
+def lttb_indices(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets downsampling: the positions of `n_out` points that best preserve a line's shape.
+
+    Parameters:
+    - x: The x values in drawing order (numeric or datetime).
+    - y: The y values.
+    - n_out: The number of points to keep.
+
+    Returns:
+    - np.ndarray: Sorted positions to keep.
+    """
+    x, y = _as_float(x), _as_float(y)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    selected = np.empty(n_out, dtype=int)
+    selected[0], selected[-1] = 0, n - 1
+    anchor = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], max(edges[i + 1], edges[i] + 1)
+        # The next bucket's average is the third corner of the triangle (the last point for the final bucket)
+        next_stop = edges[i + 2] if i + 2 < len(edges) else n
+        next_x, next_y = np.nanmean(x[stop:next_stop]), np.nanmean(y[stop:next_stop])
+        areas = np.abs((x[anchor] - next_x) * (y[start:stop] - y[anchor])
+                       - (x[anchor] - x[start:stop]) * (next_y - y[anchor]))
+        anchor = start + int(np.nanargmax(areas)) if np.isfinite(areas).any() else start
+        selected[i + 1] = anchor
+    return np.unique(selected)
+
+
+def density_grid(x, y, bins=(400, 240)):
+    """
+    Bin two columns into a 2D count grid, so a scatter of millions of points is drawn as one image.
+
+    Parameters:
+    - x: The x values.
+    - y: The y values.
+    - bins: The grid size (columns, rows), usually about half the plot size in pixels.
+
+    Returns:
+    - tuple: (counts, x_edges, y_edges) as returned by `np.histogram2d`.
+    """
+    x, y = _as_float(x), _as_float(y)
+    valid = ~(np.isnan(x) | np.isnan(y))
+    return np.histogram2d(x[valid], y[valid], bins=bins)
+
+
+def prebin(values, bins=15):
+    """
+    Bin one column with NumPy, so only the bin counts are handed to matplotlib.
+
+    Returns:
+    - tuple: (counts, edges) as returned by `np.histogram`.
+    """
+    values = _as_float(values)
+    return np.histogram(values[~np.isnan(values)], bins=bins)
+
+
+def sample_rows(data, n_rows, seed=0):
+    """Return a reproducible random sample of at most `n_rows` rows, in their original order."""
+    if len(data) <= n_rows:
+        return data
+    positions = np.sort(np.random.default_rng(seed).choice(len(data), size=n_rows, replace=False))
+    return data.iloc[positions]
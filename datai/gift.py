@@ -1,49 +1,199 @@
-# datai/myname.py
+# datai/gift.py
 
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
+import io
+import os
+import shutil
+import subprocess
+import tempfile
 
-# Class to animate the name
-class Gift:
+import numpy as np
 
-    @staticmethod
-    def myName(name):
+from datai.lazy import LazyModule
+
+# Imported on first use, so importing datai does not load matplotlib
+plt = LazyModule('matplotlib.pyplot')
+matplotlib = LazyModule('matplotlib')
+animation = LazyModule('matplotlib.animation')
+figure = LazyModule('matplotlib.figure')
+backend_agg = LazyModule('matplotlib.backends.backend_agg')
+Image = LazyModule('PIL.Image')
+
+# Formats the animation can be exported to without a display
+EXPORT_FORMATS = ('gif', 'mp4', 'frames')
+
+
+def _draw_name(fig, chars):
+    """Lay the name out on a figure: one text artist per character, created once and hidden until revealed."""
+    ax = fig.subplots()
+    ax.set_xlim(-1, len(chars))
+    ax.set_ylim(-1, 1)
+    ax.axis('off')
+    texts = [
+        ax.text(i, 0, char, fontsize=56, ha='center', color='blue', fontstyle='italic', visible=False)
+        for i, char in enumerate(chars)
+    ]
+    return ax, texts
+
+
+def animate_name(fig, texts, interval=400):
+    """
+    Reveal the characters of a name one per frame with a blitted `FuncAnimation`.
+
+    The axes are drawn once and cached as the blit background; each frame only restores that background and
+    draws the revealed characters, instead of clearing the axes and laying out every character again.
+
+    Parameters:
+    - fig: The figure holding the name.
+    - texts: The character artists from `_draw_name`, hidden.
+    - interval: The time between characters in milliseconds.
+
+    Returns:
+    - matplotlib.animation.FuncAnimation: The animation (keep a reference while it runs).
+    """
+    def init():
+        for text in texts:
+            text.set_visible(False)
+        return texts
+
+    def update(frame):
+        texts[frame].set_visible(True)
+        return texts[:frame + 1]
+
+    return animation.FuncAnimation(fig, update, frames=len(texts), init_func=init, interval=interval, blit=True)
+
+
+def render_frames(name, dpi=100):
+    """
+    Render the frames of the animation off-screen with Agg.
+
+    The frames share one RGBA buffer: each frame only rasterizes its new character on top of the previous
+    frame, and the yielded array is a view of that buffer (copy it to keep a frame).
 
-        # Create a list of characters in the name
-        chars = list(name.upper())
+    Parameters:
+    - name: The name to animate.
+    - dpi: The resolution of the frames.
 
-        # Create a list of x-coordinates (one for each character)
-        x = range(len(chars))
+    Returns:
+    - generator: One (height, width, 4) uint8 array per character.
+    """
+    chars = list(name.upper())
+    fig = figure.Figure(figsize=(12, 6), dpi=dpi)
+    canvas = backend_agg.FigureCanvasAgg(fig)
+    ax, texts = _draw_name(fig, chars)
+    canvas.draw()
+    buffer = np.asarray(canvas.buffer_rgba())
+    for text in texts:
+        text.set_visible(True)
+        ax.draw_artist(text)
+        yield buffer
 
-        # Create a list of y-coordinates (all set to 0)
-        y = [0] * len(chars)
 
-        # Create a figure and axis
-        fig, ax = plt.subplots(figsize=(12, 6))
+def _ffmpeg():
+    path = shutil.which(matplotlib.rcParams['animation.ffmpeg_path']) or shutil.which('ffmpeg')
+    if path is None:
+        raise RuntimeError("Exporting MP4 requires ffmpeg on the PATH (or in rcParams['animation.ffmpeg_path']).")
+    return path
+
+
+def _write_mp4(frames, target, fps):
+    """Pipe raw RGBA frames to ffmpeg, which encodes them as H.264."""
+    process = None
+    try:
+        for frame in frames:
+            if process is None:
+                height, width = frame.shape[:2]
+                process = subprocess.Popen(
+                    [_ffmpeg(), '-y', '-loglevel', 'error', '-f', 'rawvideo', '-pix_fmt', 'rgba',
+                     '-s', f'{width}x{height}', '-r', str(fps), '-i', '-',
+                     # H.264 needs even dimensions
+                     '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2', '-pix_fmt', 'yuv420p', '-vcodec', 'libx264', target],
+                    stdin=subprocess.PIPE, stderr=subprocess.PIPE,
+                )
+            process.stdin.write(frame.data)
+    finally:
+        if process is not None:
+            process.stdin.close()
+            error = process.stderr.read()
+            if process.wait():
+                raise RuntimeError(f"ffmpeg failed: {error.decode(errors='replace').strip()}")
+
+
+def export_name(name, output, interval=400, dpi=100):
+    """
+    Export the animation without a display.
+
+    Parameters:
+    - name: The name to animate.
+    - output: 'gif' or 'mp4' for the encoded bytes, 'frames' for a (frames, height, width, 4) array,
+      or a file path ending in '.gif' or '.mp4'.
+    - interval: The time between characters in milliseconds.
+    - dpi: The resolution of the frames.
+
+    Returns:
+    - bytes, np.ndarray or str: The encoded animation, the frames, or the path written.
+    """
+    kind = output if output in EXPORT_FORMATS else os.path.splitext(str(output))[1][1:].lower()
+    if kind not in EXPORT_FORMATS:
+        raise ValueError(f"Invalid output '{output}'. Use one of: {', '.join(EXPORT_FORMATS)}, or a .gif/.mp4 path.")
+    path = None if output in EXPORT_FORMATS else str(output)
+    frames = render_frames(name, dpi=dpi)
+
+    if kind == 'frames':
+        stack = None
+        for i, frame in enumerate(frames):
+            if stack is None:
+                # Allocated once, then filled frame by frame from the shared render buffer
+                stack = np.empty((len(name.upper()),) + frame.shape, dtype=frame.dtype)
+            stack[i] = frame
+        return stack if stack is not None else np.empty((0, 0, 0, 4), dtype='uint8')
+
+    if kind == 'gif':
+        images = [Image.fromarray(frame[..., :3]).quantize(64) for frame in frames]
+        if not images:
+            raise ValueError("The name must not be empty.")
+        target = path or io.BytesIO()
+        images[0].save(target, format='GIF', save_all=True, append_images=images[1:], duration=interval, loop=0)
+        return path or target.getvalue()
+
+    if path is not None:
+        _write_mp4(frames, path, 1000 / interval)
+        return path
+    with tempfile.TemporaryDirectory() as directory:
+        target = os.path.join(directory, 'name.mp4')
+        _write_mp4(frames, target, 1000 / interval)
+        with open(target, 'rb') as file:
+            return file.read()
+
+
+# Class to animate the name
+class Gift:
+
+    @staticmethod
+    def myName(name, output=None, interval=400):
+        """
+        Animate a name, one character at a time.
+
+        Parameters:
+        - name: The name to animate.
+        - output: None to show the animation, or an export target: 'gif', 'mp4', 'frames', or a .gif/.mp4 path
+          (rendered off-screen, no display needed).
+        - interval: The time between characters in milliseconds.
 
-        # Initialize the plot with no characters
-        ax.set_xlim(-1, len(chars))
-        ax.set_ylim(-1, 1)
-        ax.axis('off')
+        Returns:
+        - matplotlib.animation.FuncAnimation when shown (keep a reference while it runs; it supports `save()` and
+          `to_jshtml()`), else the result of `export_name`.
+        """
+        if output is not None:
+            return export_name(name, output, interval=interval)
 
-        # Function to update the plot for each frame
-        def update(frame):
-            ax.clear()
-            ax.set_xlim(-1, len(chars))
-            ax.set_ylim(-1, 1)
-            ax.axis('off')
-            for i in range(frame+1):
-                ax.text(x[i], y[i], chars[i], 
-                    fontsize=56, 
-                    ha='center', 
-                    color='blue', 
-                    fontstyle='italic')
+        # Create a figure with every character already laid out (hidden)
+        fig = plt.figure(figsize=(12, 6))
+        _, texts = _draw_name(fig, list(name.upper()))
 
-        # Create the animation
-        anim = animation.FuncAnimation(fig, update, frames=len(chars), interval=400)
+        # Reveal one more character each frame, blitting over the cached background
+        anim = animate_name(fig, texts, interval=interval)
 
         # Show the animation
         plt.show()
 
         return anim
-    
\ No newline at end of file
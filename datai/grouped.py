@@ -0,0 +1,378 @@
+# datai/grouped.py
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from datai.memory import fill_inplace, scale_inplace
+from datai.parallel import resolve_n_jobs
+
+# Groups are only split across threads when every thread gets at least this many rows
+MIN_ROWS_PER_THREAD = 50_000
+
+
+def key_columns(by):
+    """Return the group key columns as a list, from one column name or a list of them."""
+    if isinstance(by, (list, tuple, pd.Index)):
+        columns = list(by)
+    else:
+        columns = [by]
+    if not columns:
+        raise ValueError("Give at least one column to group by.")
+    return columns
+
+
+def group_codes(data, by):
+    """
+    Factorize the key columns into one integer group code per row.
+
+    Parameters:
+    - data: The dataset.
+    - by: A key column or a list of key columns. Missing keys form a group of their own.
+
+    Returns:
+    - tuple: The codes (int64 array, numbered 0..n_groups-1 in order of appearance) and the number of groups.
+    """
+    columns = key_columns(by)
+    missing = [column for column in columns if column not in data.columns]
+    if missing:
+        raise ValueError(f"The dataset has no columns named {missing} to group by.")
+    codes, uniques = pd.factorize(data[columns[0]], use_na_sentinel=False)
+    n_groups = len(uniques)
+    for column in columns[1:]:
+        column_codes, uniques = pd.factorize(data[column], use_na_sentinel=False)
+        # Combine with the previous keys and renumber, so the codes stay below the number of rows
+        codes, combined = pd.factorize(codes.astype('int64') * len(uniques) + column_codes)
+        n_groups = len(combined)
+    return codes.astype('int64', copy=False), n_groups
+
+
+def _stable_order(codes, n_groups):
+    """The stable argsort of group codes, from one sort of unique integer keys (faster than a stable sort)."""
+    if n_groups * len(codes) >= np.iinfo('int64').max // 2:
+        return np.argsort(codes, kind='stable')
+    keys = codes * len(codes) + np.arange(len(codes))
+    keys.sort()
+    return keys % len(codes)
+
+
+class GroupIndex:
+    """
+    Rows grouped by key columns, for computing per-group statistics without a Python loop over the groups.
+
+    The keys are factorized once and the rows are sorted by group once. Every statistic is then computed
+    for all groups together from that order (medians and quartiles from one sort per column, minimum,
+    maximum, mean and standard deviation from segmented reductions, modes from counted (group, value)
+    pairs), and `expand` broadcasts the per-group results back to the rows by indexing with the codes.
+    """
+
+    def __init__(self, data, by, n_jobs=1):
+        """
+        Group a dataset.
+
+        Parameters:
+        - data: The dataset.
+        - by: A key column or a list of key columns.
+        - n_jobs: The number of threads sorting the values of disjoint ranges of groups (None or -1 for one per CPU core).
+        """
+        self.columns = key_columns(by)
+        self.codes, self.n_groups = group_codes(data, self.columns)
+        self.n_jobs = resolve_n_jobs(n_jobs)
+        self.order = _stable_order(self.codes, self.n_groups)
+        self.sorted_codes = self.codes[self.order]
+        self.counts = np.bincount(self.codes, minlength=self.n_groups)
+        self.starts = np.concatenate([[0], np.cumsum(self.counts)])
+
+    def __len__(self):
+        return self.n_groups
+
+    def expand(self, stats):
+        """Broadcast one value per group back to one value per row."""
+        return stats[self.codes]
+
+    def _sorted_rows(self, values, keep=None):
+        """Return the values and codes in group order (restricted to the `keep` rows) and the group boundaries."""
+        values, codes = values[self.order], self.sorted_codes
+        if keep is None:
+            return values, codes, self.starts
+        kept = keep[self.order]
+        values, codes = values[kept], codes[kept]
+        return values, codes, np.concatenate([[0], np.cumsum(np.bincount(codes, minlength=self.n_groups))])
+
+    def _segments(self, starts):
+        """Split the groups into contiguous ranges of similar row counts, one per thread."""
+        n_threads = min(self.n_jobs, self.n_groups, max(int(starts[-1]) // MIN_ROWS_PER_THREAD, 1))
+        if n_threads <= 1:
+            return [(0, self.n_groups)]
+        bounds = np.searchsorted(starts, np.linspace(0, starts[-1], n_threads + 1))
+        bounds[0], bounds[-1] = 0, self.n_groups
+        bounds = np.unique(bounds)
+        return list(zip(bounds[:-1], bounds[1:]))
+
+    def _sort_within_groups(self, values, codes, starts):
+        """Sort each group's values in place (missing values last), with disjoint ranges of groups sorted by threads."""
+        def sort_segment(segment):
+            start, stop = starts[segment[0]], starts[segment[1]]
+            size = stop - start
+            # One sort of the values gives their ranks; sorting the integer keys (group, rank) then sorts
+            # every group at once, which is faster than a two-key lexsort
+            ranked = np.argsort(values[start:stop])
+            by_value = values[start:stop][ranked]
+            keys = np.empty(size, dtype='int64')
+            keys[ranked] = np.arange(size)
+            keys += (codes[start:stop] - segment[0]) * size
+            keys.sort()
+            values[start:stop] = by_value[keys % size]
+
+        segments = self._segments(starts)
+        if len(segments) == 1:
+            sort_segment(segments[0])
+        else:
+            with ThreadPoolExecutor(max_workers=len(segments)) as pool:
+                list(pool.map(sort_segment, segments))
+
+    def _sorted_groups(self, values, keep=None):
+        """Return the values sorted within each group (missing values last), their codes and the group boundaries."""
+        values, codes, starts = self._sorted_rows(values, keep)
+        if len(values):
+            self._sort_within_groups(values, codes, starts)
+        return values, codes, starts
+
+    def _read_quantiles(self, groups, q, fill=None):
+        """Per-group quantiles of values already sorted by `_sorted_groups`, of shape (len(q), n_groups)."""
+        values, codes, starts = groups
+        q = np.asarray(q, dtype='float64')[:, None]
+        if not len(values):
+            return np.full((len(q), self.n_groups), np.nan)
+
+        valid = np.bincount(codes, weights=~np.isnan(values), minlength=self.n_groups).astype('int64')
+        if fill is None:
+            size, missing, below = valid, 0, valid
+        else:
+            size = np.diff(starts)
+            missing = size - valid
+            # The rank at which the fill values are inserted among the group's sorted values
+            with np.errstate(invalid='ignore'):
+                below = np.bincount(codes, weights=values < fill[codes], minlength=self.n_groups).astype('int64')
+
+        def value_at(rank):
+            # Ranks past the inserted fill values come from `missing` places earlier in the sorted values
+            position = starts[:-1] + np.where(rank < below, rank, rank - missing)
+            found = values[np.clip(position, 0, len(values) - 1)]
+            if fill is None:
+                return found
+            return np.where((rank >= below) & (rank < below + missing), fill, found)
+
+        position = q * np.maximum(size - 1, 0)
+        low = np.floor(position).astype('int64')
+        high = np.ceil(position).astype('int64')
+        with np.errstate(invalid='ignore'):
+            lower, upper = value_at(low), value_at(high)
+            result = lower + (upper - lower) * (position - low)
+        result[:, size == 0] = np.nan
+        return result
+
+    def quantiles(self, values, q, keep=None, fill=None):
+        """
+        Per-group quantiles of a numeric column, with linear interpolation like `np.quantile`.
+
+        Parameters:
+        - values: A float array with one value per row; NaNs are ignored.
+        - q: A quantile or a list of quantiles.
+        - keep: An optional boolean row mask; only the kept rows are used.
+        - fill: Optional per-group fill values. The quantiles are then those of the column after its missing
+          values are filled, computed from the same sort (the fill values are inserted at their rank).
+
+        Returns:
+        - np.ndarray: The quantiles, of shape (len(q), n_groups), or (n_groups,) for a single quantile.
+        """
+        result = self._read_quantiles(self._sorted_groups(values, keep), np.atleast_1d(q), fill=fill)
+        return result[0] if np.ndim(q) == 0 else result
+
+    def filled_quantiles(self, values, q):
+        """
+        Per-group medians of a numeric column, and its quantiles once its missing values are filled with them.
+
+        Both come from one sort of each group, where `medians` followed by `quantiles(..., fill=...)` sorts twice.
+
+        Returns:
+        - tuple: The medians (n_groups,) and the quantiles of the filled column (len(q), n_groups).
+        """
+        groups = self._sorted_groups(values)
+        medians = self._read_quantiles(groups, [0.5])[0]
+        return medians, self._read_quantiles(groups, np.atleast_1d(q), fill=medians)
+
+    def medians(self, values, keep=None):
+        """Per-group medians of a numeric column, ignoring NaNs."""
+        return self.quantiles(values, 0.5, keep=keep)
+
+    def min_max(self, values, keep=None):
+        """Per-group minimum and maximum of a numeric column, ignoring NaNs (NaN for groups without values)."""
+        values, codes, starts = self._sorted_rows(values, keep)
+        low, high = np.full(self.n_groups, np.nan), np.full(self.n_groups, np.nan)
+        present = starts[:-1] < starts[1:]
+        if present.any():
+            # Segmented reductions over the group-ordered rows; empty groups are left out of the boundaries
+            boundaries = starts[:-1][present]
+            with np.errstate(invalid='ignore'):
+                low[present] = np.fmin.reduceat(values, boundaries)
+                high[present] = np.fmax.reduceat(values, boundaries)
+        return low, high
+
+    def mean_std(self, values, keep=None):
+        """Per-group mean and sample standard deviation (ddof=1) of a numeric column, ignoring NaNs."""
+        valid = ~np.isnan(values)
+        if keep is not None:
+            valid &= keep
+        codes, values = self.codes[valid], values[valid]
+        with np.errstate(all='ignore'):
+            count = np.bincount(codes, minlength=self.n_groups)
+            mean = np.bincount(codes, weights=values, minlength=self.n_groups) / count
+            deviation = values - mean[codes]
+            variance = np.bincount(codes, weights=deviation * deviation, minlength=self.n_groups) / (count - 1)
+        variance[count < 2] = np.nan
+        return mean, np.sqrt(variance)
+
+    def modes(self, series):
+        """
+        Per-group most frequent value of a column (the smallest one on ties, like `Series.mode()[0]`).
+
+        Returns:
+        - np.ndarray: An object array with one mode per group, NaN for groups without values.
+        """
+        value_codes, uniques = pd.factorize(series, sort=True)
+        valid = value_codes >= 0
+        modes = np.full(self.n_groups, np.nan, dtype=object)
+        if not valid.any():
+            return modes
+        # Count every (group, value) pair at once, then take the most frequent value of each group
+        pairs, counts = np.unique(self.codes[valid] * len(uniques) + value_codes[valid], return_counts=True)
+        groups, values = np.divmod(pairs, len(uniques))
+        ranked = np.lexsort((values, -counts, groups))
+        first = ranked[np.r_[True, groups[ranked][1:] != groups[ranked][:-1]]]
+        modes[groups[first]] = np.asarray(uniques, dtype=object)[values[first]]
+        return modes
+
+
+def fill_groups(data, index, numeric_cols, columns=None):
+    """
+    Fill missing values in place with the median (numeric columns) or mode (other columns) of each row's group.
+
+    Parameters:
+    - data: The dataset (modified in place).
+    - index: The `GroupIndex` of the dataset.
+    - numeric_cols: The columns filled with group medians.
+    - columns: The columns to fill (defaults to every column except the keys).
+
+    Returns:
+    - list: The columns that had missing values.
+    """
+    columns = data.columns.difference(index.columns, sort=False) if columns is None else columns
+    filled = []
+    for column in columns:
+        if not data[column].hasnans:
+            continue
+        if column in numeric_cols:
+            values = data[column].to_numpy(dtype='float64', na_value=np.nan)
+            fill_inplace(data, column, index.expand(index.medians(values)))
+        else:
+            fill_inplace(data, column, index.expand(index.modes(data[column])))
+        filled.append(column)
+    return filled
+
+
+def group_outlier_mask(data, index, numeric_cols, threshold=1.5, sequential=True):
+    """
+    Build one row mask keeping the rows inside the IQR bounds of their group, for every numeric column.
+
+    Parameters:
+    - data: The dataset.
+    - index: The `GroupIndex` of the dataset.
+    - numeric_cols: The columns checked for outliers.
+    - threshold: The IQR multiplier for outlier bounds.
+    - sequential: If True, compute each column's bounds on the rows kept by the previous columns.
+
+    Returns:
+    - np.ndarray: A boolean mask of the rows to keep.
+    """
+    keep = np.ones(len(data), dtype=bool)
+    for column in numeric_cols:
+        values = data[column].to_numpy(dtype='float64', na_value=np.nan)
+        q1, q3 = index.quantiles(values, [0.25, 0.75], keep=keep if sequential else None)
+        lower, upper = q1 - threshold * (q3 - q1), q3 + threshold * (q3 - q1)
+        with np.errstate(invalid='ignore'):
+            keep &= (values >= index.expand(lower)) & (values <= index.expand(upper))
+    return keep
+
+
+def scale_groups(data, index, numeric_cols, method='min-max', keep=None):
+    """
+    Scale numeric columns in place with the statistics of each row's group.
+
+    Parameters:
+    - data: The dataset (modified in place).
+    - index: The `GroupIndex` of the dataset.
+    - numeric_cols: The columns to scale.
+    - method: 'min-max' to scale each group to 0-1, or 'z-score' to standardize each group.
+    - keep: An optional row mask; the statistics then only come from the kept rows.
+    """
+    for column in numeric_cols:
+        values = data[column].to_numpy(dtype='float64', na_value=np.nan)
+        if method == 'min-max':
+            low, high = index.min_max(values, keep=keep)
+            shift, scale = low, high - low
+        else:
+            shift, scale = index.mean_std(values, keep=keep)
+        scale_inplace(data, column, index.expand(shift), index.expand(scale))
+
+
+def clean_groups(data, index, numeric_cols, threshold=1.5):
+    """
+    Fill, filter and scale a dataset per group, the grouped counterpart of the fused pipeline.
+
+    Each numeric column is sorted once per group: its medians and the quartiles of the filled column come
+    from that one sort (`GroupIndex.filled_quantiles`). Bounds are computed per column on the filled data, independent of column order,
+    and the min-max scaling uses the rows that survive the filter.
+
+    Parameters:
+    - data: The dataset (left untouched).
+    - index: The `GroupIndex` of the dataset.
+    - numeric_cols: The columns filled with group medians, filtered and scaled.
+    - threshold: The IQR multiplier for outlier bounds.
+
+    Returns:
+    - tuple: The cleaned dataset and the number of columns that had missing values.
+    """
+    keep = np.ones(len(data), dtype=bool)
+    filled, missing = {}, 0
+    for column in numeric_cols:
+        values = data[column].to_numpy(dtype='float64', na_value=np.nan, copy=True)
+        nulls = np.isnan(values)
+        if nulls.any():
+            missing += 1
+            medians, (q1, q3) = index.filled_quantiles(values, [0.25, 0.75])
+            values[nulls] = index.expand(medians)[nulls]
+        else:
+            q1, q3 = index.quantiles(values, [0.25, 0.75])
+        lower, upper = q1 - threshold * (q3 - q1), q3 + threshold * (q3 - q1)
+        with np.errstate(invalid='ignore'):
+            keep &= (values >= index.expand(lower)) & (values <= index.expand(upper))
+        filled[column] = values
+
+    # Scale with the min/max of each group's rows that survived the filter
+    kept_codes = index.codes[keep]
+    columns = {}
+    for column in data.columns:
+        if column in filled:
+            low, high = index.min_max(filled[column], keep=keep)
+            with np.errstate(all='ignore'):
+                columns[column] = (filled[column][keep] - low[kept_codes]) / (high - low)[kept_codes]
+            continue
+        series = data[column]
+        if column not in index.columns and series.hasnans:
+            missing += 1
+            series = series.where(series.notna(), index.expand(index.modes(series)))
+        # The array keeps categorical, nullable and Arrow dtypes
+        columns[column] = series[keep].array
+    return pd.DataFrame(columns, index=data.index[keep], columns=data.columns), missing
@@ -0,0 +1,232 @@
+# datai/inference.py
+
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from datai.correlation import correlation_matrix
+from datai.downsample import sample_rows
+
+# Column types are inferred from at most this many rows, so the decision time does not grow with the data
+SAMPLE_ROWS = 10_000
+# Columns with at most this many distinct values (or under CATEGORICAL_FRACTION of the sample) are categorical
+CATEGORICAL_LIMIT = 20
+CATEGORICAL_FRACTION = 0.05
+# Integer columns with at most this many distinct values, repeated over at least DISCRETE_MIN_ROWS rows
+# (distinct values under CATEGORICAL_FRACTION of them), are codes (e.g. a class number), not measurements
+DISCRETE_LIMIT = 10
+DISCRETE_MIN_ROWS = 100
+# Text columns where at least this fraction of the values parse as numbers or dates are treated as such
+PARSE_FRACTION = 0.95
+# Text columns where at least this fraction of the sampled values are distinct are identifiers
+IDENTIFIER_FRACTION = 0.95
+
+BOOLEAN_WORDS = {'true': True, 'false': False, 'yes': True, 'no': False, 'y': True, 'n': False, 't': True, 'f': False}
+
+KINDS = ('numeric', 'categorical', 'boolean', 'datetime', 'identifier', 'text', 'empty', 'other')
+
+
+class ReservoirSample:
+    """
+    Uniform sample of at most `size` rows from a stream of DataFrame chunks (Algorithm R, vectorized per chunk).
+
+    Memory is bounded by `size` rows whatever the length of the stream. `frame()` returns the sampled rows
+    in their original order, so ordering properties such as monotonicity can be judged on the sample.
+    """
+
+    def __init__(self, size=SAMPLE_ROWS, seed=0):
+        self.size = size
+        self.seen = 0
+        self.sample = None
+        self.positions = np.empty(0, dtype='int64')
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, chunk):
+        """Offer a chunk of rows to the sample."""
+        rows = np.arange(self.seen, self.seen + len(chunk))
+        self.seen += len(chunk)
+        # Rows arriving while the reservoir is not full are all kept
+        free = max(min(self.size - len(self.positions), len(chunk)), 0)
+        if free:
+            head = chunk.iloc[:free]
+            self.sample = head if self.sample is None else pd.concat([self.sample, head])
+            self.positions = np.concatenate([self.positions, rows[:free]])
+        # Row i then replaces a random slot with probability size / (i + 1)
+        slots = self._rng.integers(0, rows[free:] + 1) if len(rows) > free else np.empty(0, dtype='int64')
+        accepted = np.flatnonzero(slots < self.size)
+        if accepted.size:
+            # When several rows land in one slot the last one wins, as in the sequential algorithm
+            slots = slots[accepted]
+            last = len(slots) - 1 - np.unique(slots[::-1], return_index=True)[1]
+            slots, accepted = slots[last], accepted[last] + free
+            order = np.arange(len(self.positions))
+            order[slots] = len(self.positions) + np.arange(len(slots))
+            self.sample = pd.concat([self.sample, chunk.iloc[accepted]]).iloc[order]
+            self.positions[slots] = rows[accepted]
+        return self
+
+    def frame(self):
+        """Return the sampled rows in their original order."""
+        if self.sample is None:
+            return pd.DataFrame()
+        return self.sample.iloc[np.argsort(self.positions, kind='stable')]
+
+
+def sample_frame(data, size=SAMPLE_ROWS, seed=0):
+    """
+    Return a uniform sample of at most `size` rows, in their original order.
+
+    Parameters:
+    - data: A DataFrame, or an iterable of DataFrame chunks (sampled with a reservoir).
+    - size: The largest number of rows in the sample.
+    - seed: The random seed.
+
+    Returns:
+    - pd.DataFrame: The sampled rows.
+    """
+    if isinstance(data, pd.DataFrame):
+        return sample_rows(data, size, seed=seed)
+    reservoir = ReservoirSample(size=size, seed=seed)
+    for chunk in data:
+        reservoir.update(chunk)
+    return reservoir.frame()
+
+
+def _is_monotonic(values):
+    return len(values) > 2 and (values.is_monotonic_increasing or values.is_monotonic_decreasing)
+
+
+def _numeric_kind(values):
+    """Kind of a column of numbers: row identifiers, flags, codes or measurements."""
+    numbers = values.to_numpy(dtype='float64')
+    unique = len(np.unique(numbers))
+    integral = bool(np.all(np.mod(numbers, 1) == 0))
+    if integral and unique <= 2 and set(np.unique(numbers)) <= {0.0, 1.0}:
+        return 'boolean'
+    if integral and unique == len(numbers) > CATEGORICAL_LIMIT and _is_monotonic(values):
+        # Distinct, ordered integers are a row number or an id sequence
+        return 'identifier'
+    # A few distinct integers are only codes when each repeats many times; a short column of ages is numeric
+    repeated = len(numbers) >= DISCRETE_MIN_ROWS and unique < CATEGORICAL_FRACTION * len(numbers)
+    if integral and unique <= DISCRETE_LIMIT and repeated:
+        return 'categorical'
+    return 'numeric'
+
+
+def _parse_dates(strings):
+    with warnings.catch_warnings():
+        # Formats that cannot be inferred fall back to per-value parsing, which is fine on a sample
+        warnings.simplefilter('ignore', UserWarning)
+        try:
+            return pd.to_datetime(strings, errors='coerce', format='mixed')
+        except (TypeError, ValueError):
+            return pd.to_datetime(strings, errors='coerce')
+
+
+def infer_column_type(values):
+    """
+    Infer the semantic type of a column from its (sampled) values.
+
+    Parameters:
+    - values: A Series.
+
+    Returns:
+    - dict: "kind" (one of KINDS), "parsed" (the values are text to convert with `convert_column`),
+      "unique" (distinct values in the sample), "null_fraction" and "monotonic".
+    """
+    series = pd.Series(values)
+    present = series.dropna()
+    info = {
+        "kind": 'other',
+        "parsed": False,
+        "unique": int(present.nunique()),
+        "null_fraction": 1 - len(present) / len(series) if len(series) else 1.0,
+        "monotonic": False,
+    }
+    if present.empty:
+        info["kind"] = 'empty'
+    elif pd.api.types.is_bool_dtype(present):
+        info["kind"] = 'boolean'
+    elif pd.api.types.is_datetime64_any_dtype(present):
+        info["kind"] = 'datetime'
+        info["monotonic"] = _is_monotonic(present)
+    elif pd.api.types.is_numeric_dtype(present) and not pd.api.types.is_complex_dtype(present):
+        info["kind"] = _numeric_kind(present)
+        info["monotonic"] = _is_monotonic(present)
+    elif isinstance(present.dtype, pd.CategoricalDtype) and info["unique"] > 2:
+        info["kind"] = 'categorical'
+    else:
+        strings = present.astype(str).str.strip()
+        if info["unique"] <= 2 and set(strings.str.lower().unique()) <= set(BOOLEAN_WORDS):
+            info["kind"], info["parsed"] = 'boolean', True
+            return info
+        numbers = pd.to_numeric(strings, errors='coerce')
+        if numbers.notna().mean() >= PARSE_FRACTION:
+            info["kind"], info["parsed"] = _numeric_kind(numbers.dropna()), True
+            info["monotonic"] = _is_monotonic(numbers.dropna())
+            return info
+        # Month or weekday names parse as dates too; real timestamps contain digits
+        if strings.str.contains(r'\d').mean() >= PARSE_FRACTION:
+            dates = _parse_dates(strings)
+            if dates.notna().mean() >= PARSE_FRACTION:
+                info["kind"], info["parsed"] = 'datetime', True
+                info["monotonic"] = _is_monotonic(dates.dropna())
+                return info
+        if info["unique"] <= max(CATEGORICAL_LIMIT, CATEGORICAL_FRACTION * len(present)):
+            info["kind"] = 'categorical'
+        elif info["unique"] >= IDENTIFIER_FRACTION * len(present) and not strings.str.contains(r'\s').any():
+            info["kind"] = 'identifier'
+        else:
+            info["kind"] = 'text'
+    return info
+
+
+def infer_types(data, size=SAMPLE_ROWS, seed=0):
+    """
+    Infer the semantic type of every column from a bounded sample of rows.
+
+    Parameters:
+    - data: A DataFrame, or an iterable of DataFrame chunks.
+    - size: The largest number of rows inspected.
+    - seed: The random seed of the sample.
+
+    Returns:
+    - dict: The `infer_column_type` result of each column.
+    """
+    sample = sample_frame(data, size=size, seed=seed)
+    return {column: infer_column_type(sample[column]) for column in sample.columns}
+
+
+def convert_column(values, info):
+    """Convert a column inferred from text (`info["parsed"]`) to numbers, dates or booleans."""
+    if not info["parsed"]:
+        return values
+    # Plain str (not the 'string' dtype), so numbers come back as float64 rather than nullable Float64
+    strings = values.where(values.isna(), values.astype(str)).str.strip()
+    if info["kind"] == 'boolean':
+        return strings.str.lower().map(BOOLEAN_WORDS)
+    if info["kind"] == 'datetime':
+        return _parse_dates(strings)
+    return pd.to_numeric(strings, errors='coerce')
+
+
+def informative_columns(sample, columns, limit):
+    """
+    Pick at most `limit` numeric columns worth pairing in a pairplot: those most strongly correlated with another.
+
+    Parameters:
+    - sample: A sample of the dataset (converted to numbers where needed).
+    - columns: The candidate numeric columns.
+    - limit: The largest number of columns returned.
+
+    Returns:
+    - list: The chosen columns, in their original order.
+    """
+    columns = list(columns)
+    if len(columns) <= limit:
+        return columns
+    strength = np.abs(np.nan_to_num(correlation_matrix(sample, columns=columns).to_numpy()))
+    np.fill_diagonal(strength, 0.0)
+    best = np.argsort(-strength.max(axis=1), kind='stable')[:limit]
+    return [columns[i] for i in sorted(best)]
@@ -0,0 +1,236 @@
+# datai/instrumentation.py
+
+import contextlib
+import inspect
+import logging
+import threading
+import time
+import warnings
+from functools import wraps
+
+import pandas as pd
+
+from datai.memory import MemoryTracker
+
+# Registered hooks as (hook, wants_memory) pairs; empty means instrumentation is off
+_hooks = []
+# Per thread, the records of the stages currently running, innermost last
+_local = threading.local()
+
+# Arguments naming the columns a plot or step works on
+COLUMN_ARGUMENTS = ('col', 'cols', 'x_col', 'y_col', 'x', 'y', 'columns', 'by')
+
+
+def add_hook(hook, memory=False):
+    """
+    Register a hook that receives a record for every instrumented stage.
+
+    A hook is either a callable, called with the record when a stage ends, or an object with
+    `on_start(record)` and/or `on_end(record)` methods (e.g. to open and close tracing spans).
+    A record is a dict with:
+    - "stage": The qualified name, e.g. 'DataCleaning.remove_outliers'.
+    - "parent" / "depth": The enclosing stage (None at the top level) and the nesting depth.
+    - "rows_in" / "rows_out": The rows of the input and output datasets (None when there is no dataset).
+    - "columns": The columns the stage was asked to work on, or every column of its input dataset.
+    - "seconds": The wall time.
+    - "bytes_allocated": The peak traced allocation, when a hook registered with `memory=True` (else None).
+    - "error": The exception's repr if the stage failed (else None).
+
+    Parameters:
+    - hook: The hook.
+    - memory: If True, also measure the peak allocation of each stage with tracemalloc (slower).
+
+    Returns:
+    - The hook, so it can be passed to `remove_hook` later.
+    """
+    _hooks.append((hook, memory))
+    return hook
+
+
+def remove_hook(hook):
+    """Unregister a hook; instrumentation is off again once no hooks remain."""
+    _hooks[:] = [(registered, memory) for registered, memory in _hooks if registered is not hook]
+
+
+@contextlib.contextmanager
+def instrument(*hooks, memory=False):
+    """
+    Enable hooks for the duration of a `with` block.
+
+    Example:
+        collector = Collector()
+        with instrument(collector, memory=True):
+            DataCleaning(data).get_cleaned_data()
+        print(collector.to_frame())
+    """
+    for hook in hooks:
+        add_hook(hook, memory=memory)
+    try:
+        yield hooks[0] if len(hooks) == 1 else hooks
+    finally:
+        for hook in hooks:
+            remove_hook(hook)
+
+
+class Collector:
+    """In-memory hook that keeps every stage record."""
+
+    def __init__(self):
+        self.records = []
+
+    def __call__(self, record):
+        self.records.append(record)
+
+    def clear(self):
+        """Drop the collected records."""
+        self.records = []
+
+    def to_frame(self):
+        """Return the records as a DataFrame, one row per stage run."""
+        return pd.DataFrame(self.records)
+
+    def totals(self):
+        """Return the number of calls and the total wall time of each stage, slowest first."""
+        frame = self.to_frame()
+        if frame.empty:
+            return frame
+        totals = frame.groupby("stage")["seconds"].agg(["count", "sum"])
+        return totals.rename(columns={"sum": "seconds"}).sort_values("seconds", ascending=False)
+
+
+def logging_hook(logger=None, level=logging.INFO):
+    """
+    Return a hook that logs one line per stage.
+
+    Parameters:
+    - logger: The logger (defaults to the 'datai' logger).
+    - level: The logging level.
+    """
+    logger = logger or logging.getLogger("datai")
+
+    def log(record):
+        message = f"{record['stage']} took {record['seconds']:.4f}s"
+        if record["rows_in"] is not None:
+            message += f", rows {record['rows_in']} -> {record['rows_out']}"
+        if record["bytes_allocated"] is not None:
+            message += f", peak {record['bytes_allocated']} bytes"
+        if record["error"] is not None:
+            message += f", failed with {record['error']}"
+        logger.log(level, message)
+
+    return log
+
+
+def _input_frame(args, kwargs):
+    """Return the dataset a stage works on: a DataCleaning's data, or the first DataFrame argument."""
+    if args and isinstance(getattr(args[0], "data", None), pd.DataFrame):
+        return args[0].data
+    for value in list(args) + list(kwargs.values()):
+        if isinstance(value, pd.DataFrame):
+            return value
+    return None
+
+
+def _named_columns(signature, args, kwargs):
+    """Return the columns named by the call's column arguments (x_col, cols, ...), if any."""
+    try:
+        bound = signature.bind_partial(*args, **kwargs).arguments
+    except TypeError:
+        return []
+    columns = []
+    for name in COLUMN_ARGUMENTS:
+        value = bound.get(name)
+        if isinstance(value, str):
+            columns.append(value)
+        elif isinstance(value, (list, tuple, pd.Index)):
+            columns.extend(value)
+    return columns
+
+
+def _call_hooks(method, record):
+    """Call one phase ('on_start' or 'on_end') of every hook, warning instead of failing the stage."""
+    for hook, _ in list(_hooks):
+        callback = getattr(hook, method, None)
+        if callback is None and method == 'on_end' and callable(hook):
+            callback = hook
+        if callback is None:
+            continue
+        try:
+            callback(record)
+        except Exception as error:
+            warnings.warn(f"Instrumentation hook {hook!r} failed: {error!r}")
+
+
+def _stack():
+    """The calling thread's running stages, so concurrent calls record their own parents and depths."""
+    try:
+        return _local.stack
+    except AttributeError:
+        _local.stack = []
+        return _local.stack
+
+
+def _run_instrumented(stage, signature, func, args, kwargs):
+    """Run a stage while recording its timing, rows, columns and (optionally) allocations."""
+    frame = _input_frame(args, kwargs)
+    columns = _named_columns(signature, args, kwargs) or (list(frame.columns) if frame is not None else [])
+    stack = _stack()
+    record = {
+        "stage": stage,
+        "parent": stack[-1]["stage"] if stack else None,
+        "depth": len(stack),
+        "rows_in": len(frame) if frame is not None else None,
+        "rows_out": None,
+        "columns": columns,
+        "seconds": None,
+        "bytes_allocated": None,
+        "error": None,
+    }
+    _call_hooks('on_start', record)
+    stack.append(record)
+    tracker = MemoryTracker() if any(memory for _, memory in _hooks) else contextlib.nullcontext()
+    start = time.perf_counter()
+    try:
+        with tracker:
+            result = func(*args, **kwargs)
+    except Exception as error:
+        record["error"] = repr(error)
+        raise
+    else:
+        # A DataCleaning step leaves its output in `self.data`; other stages return a dataset or nothing
+        if isinstance(result, pd.DataFrame):
+            output = result
+        elif args and isinstance(getattr(args[0], "data", None), pd.DataFrame):
+            output = args[0].data
+        else:
+            output = None
+        record["rows_out"] = len(output) if output is not None else None
+        return result
+    finally:
+        record["seconds"] = time.perf_counter() - start
+        if isinstance(tracker, MemoryTracker):
+            record["bytes_allocated"] = tracker.peak_bytes
+        stack.pop()
+        _call_hooks('on_end', record)
+
+
+def instrumented(func):
+    """
+    Decorator recording a stage for the registered hooks.
+
+    With no hooks registered the wrapper only checks an empty list before calling the function,
+    so instrumentation costs close to nothing when disabled.
+    """
+    stage = func.__qualname__
+    signature = []
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _hooks:
+            return func(*args, **kwargs)
+        if not signature:
+            # Only inspected once instrumentation is first used, so importing stays cheap
+            signature.append(inspect.signature(func))
+        return _run_instrumented(stage, signature[0], func, args, kwargs)
+
+    return wrapper
@@ -0,0 +1,36 @@
+# datai/lazy.py
+
+import importlib
+
+
+class LazyModule:
+    """
+    Stand-in for a module that is only imported when one of its attributes is first used.
+
+    The plotting modules use it for matplotlib, seaborn and pandas.plotting, so importing datai
+    (or a cleaning module) does not load the plotting stack.
+
+    Example:
+        plt = LazyModule('matplotlib.pyplot')
+        plt.figure()  # matplotlib.pyplot is imported here
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def _load(self):
+        """Import the module on first use and return it."""
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attribute):
+        return getattr(self._load(), attribute)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module '{self._name}' ({state})>"
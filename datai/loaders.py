@@ -0,0 +1,325 @@
+# datai/loaders.py
+
+import io
+import operator
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from datai.parallel import resolve_n_jobs
+
+# File extension -> format
+FORMATS = {
+    '.csv': 'csv', '.tsv': 'csv', '.txt': 'csv',
+    '.parquet': 'parquet', '.pq': 'parquet',
+    '.feather': 'feather', '.arrow': 'feather', '.ipc': 'feather',
+}
+COMPRESSIONS = ('.gz', '.bz2', '.zip', '.xz', '.zst')
+# CSVs smaller than this are parsed in one piece; larger ones are split into at least this many bytes per range
+MIN_RANGE_BYTES = 8 << 20
+# Quote characters are counted in blocks of this many bytes when placing the range boundaries
+QUOTE_SCAN_BYTES = 1 << 20
+# `pd.read_csv` options that change which lines are the header or the rows; files read with them are
+# parsed in one piece, since they cannot be applied to each byte range
+SINGLE_PIECE_OPTIONS = ('header', 'names', 'nrows', 'skiprows', 'skipfooter')
+BACKENDS = ('pandas', 'arrow', 'polars')
+
+_OPERATORS = {
+    '=': operator.eq, '==': operator.eq, '!=': operator.ne,
+    '<': operator.lt, '<=': operator.le, '>': operator.gt, '>=': operator.ge,
+    'in': lambda values, options: values.isin(options),
+    'not in': lambda values, options: ~values.isin(options),
+}
+
+
+def file_format(path):
+    """Return the format of a file ('csv', 'parquet' or 'feather') from its extension."""
+    name = os.fspath(path).lower()
+    for suffix in COMPRESSIONS:
+        if name.endswith(suffix):
+            name = name[:-len(suffix)]
+    extension = os.path.splitext(name)[1]
+    if extension not in FORMATS:
+        raise ValueError(f"Unsupported file type '{extension}'. Use one of: {', '.join(FORMATS)}.")
+    return FORMATS[extension]
+
+
+def _conjunctions(filters):
+    """Normalize filters to disjunctive normal form: a list of lists of (column, op, value) tuples."""
+    if not filters:
+        return []
+    if isinstance(filters[0], tuple):
+        filters = [filters]
+    for conjunction in filters:
+        for column, op, _ in conjunction:
+            if op not in _OPERATORS:
+                raise ValueError(f"Unsupported filter operator '{op}'. Use one of: {', '.join(_OPERATORS)}.")
+    return [list(conjunction) for conjunction in filters]
+
+
+def _filter_columns(filters):
+    return {column for conjunction in _conjunctions(filters) for column, _, _ in conjunction}
+
+
+def filter_frame(data, filters):
+    """
+    Keep the rows of a DataFrame matching `filters`.
+
+    Parameters:
+    - data: The DataFrame.
+    - filters: Predicates in the pyarrow/pandas `read_parquet` form: a list of (column, op, value) tuples that
+      must all hold, or a list of such lists of which one must hold. Operators: =, ==, !=, <, <=, >, >=, in, not in.
+
+    Returns:
+    - pd.DataFrame: The matching rows.
+    """
+    conjunctions = _conjunctions(filters)
+    if not conjunctions:
+        return data
+    keep = np.zeros(len(data), dtype=bool)
+    for conjunction in conjunctions:
+        match = np.ones(len(data), dtype=bool)
+        for column, op, value in conjunction:
+            match &= np.asarray(_OPERATORS[op](data[column], value), dtype=bool)
+        keep |= match
+    return data[keep]
+
+
+def _projection(columns, filters):
+    """The columns to parse: the requested ones plus those the filters need (None reads every column)."""
+    if columns is None:
+        return None
+    return list(columns) + sorted(_filter_columns(filters) - set(columns))
+
+
+def _count_bytes(file, size, char):
+    """Count `char` in the next `size` bytes of a file, reading it in blocks."""
+    count = 0
+    while size > 0:
+        block = file.read(min(size, QUOTE_SCAN_BYTES))
+        if not block:
+            break
+        count += block.count(char)
+        size -= len(block)
+    return count
+
+
+def _csv_ranges(path, start, size, n_ranges, quotechar=b'"'):
+    """
+    Split the bytes [start, size) of a file into ranges that begin on record boundaries.
+
+    Quoted fields may hold newlines, so a line only ends a record when the number of quote characters
+    before it is even (escaped quotes come in pairs and keep the parity).
+    """
+    bounds = np.linspace(start, size, n_ranges + 1).astype(int)
+    starts = [start]
+    quotes = 0
+    with open(path, 'rb') as file:
+        file.seek(start)
+        position = start
+        for bound in bounds[1:-1]:
+            if bound > position:
+                quotes += _count_bytes(file, bound - position, quotechar)
+                line = file.readline()
+                quotes += line.count(quotechar)
+                while quotes % 2 and line:
+                    line = file.readline()
+                    quotes += line.count(quotechar)
+                position = file.tell()
+            starts.append(position)
+    starts.append(size)
+    return [(begin, end) for begin, end in zip(starts[:-1], starts[1:]) if end > begin]
+
+
+def _read_csv_range(path, start, stop, names, usecols, options):
+    """Parse one byte range of a CSV (without its header), converting only the projected columns."""
+    with open(path, 'rb') as file:
+        file.seek(start)
+        payload = file.read(stop - start)
+    return pd.read_csv(io.BytesIO(payload), header=None, names=names, usecols=usecols, **options)
+
+
+def _is_flag_chunk(values):
+    """True if a parsed range of a column holds only booleans and missing values."""
+    if values.dtype.kind == 'b':
+        return True
+    if values.dtype.kind == 'f':
+        return bool(values.isna().all())
+    return values.dtype == object and bool(values.dropna().map(type).eq(bool).all())
+
+
+def _reconcile_types(chunks):
+    """
+    Give the columns that the ranges inferred as different types the type of one `pd.read_csv` of the file.
+
+    Integers and floats already concatenate to floats. Booleans mixed with missing values become objects
+    holding Python booleans, which is done in place. Any other mix (e.g. numbers in one range and text in
+    another) has to be read as text; those columns are returned so their ranges can be parsed again.
+    """
+    mixed = []
+    for column in chunks[0].columns:
+        dtypes = [chunk[column].dtype for chunk in chunks]
+        if all(dtype == dtypes[0] for dtype in dtypes) or all(dtype.kind in 'iuf' for dtype in dtypes):
+            continue
+        if all(_is_flag_chunk(chunk[column]) for chunk in chunks):
+            for chunk in chunks:
+                chunk[column] = chunk[column].astype(object)
+            continue
+        mixed.append(column)
+    return mixed
+
+
+def _read_csv_ranges(path, ranges, names, usecols, options):
+    """Parse the byte ranges of a CSV in threads, reading the columns they disagree on again as text."""
+    with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+        chunks = list(pool.map(lambda bounds: _read_csv_range(path, *bounds, names, usecols, options), ranges))
+        mixed = _reconcile_types(chunks)
+        if not mixed:
+            return chunks
+        dtype = options.get('dtype')
+        text = {**(dtype if isinstance(dtype, dict) else {}), **dict.fromkeys(mixed, object)}
+        again = [i for i, chunk in enumerate(chunks) if any(chunk[column].dtype != object for column in mixed)]
+        parsed = pool.map(lambda i: _read_csv_range(path, *ranges[i], names, usecols, {**options, 'dtype': text}),
+                          again)
+        for i, chunk in zip(again, parsed):
+            chunks[i] = chunk
+    # The ranges parsed again reconcile their boolean columns like the others
+    _reconcile_types(chunks)
+    return chunks
+
+
+def read_csv(path, columns=None, filters=None, n_jobs=1, **options):
+    """
+    Read a CSV file, parsing byte ranges of it in parallel threads.
+
+    Only the projected `columns` are converted, and rows failing `filters` are dropped from each range before
+    the ranges are concatenated. Range boundaries are never placed inside quoted fields. Each range infers
+    its own types, and columns that the ranges read as different types are reconciled (numbers followed by
+    text are parsed again as text in the ranges that disagree), so the result has the types of one
+    `pd.read_csv` of the whole file. Compressed files, and files read with options in SINGLE_PIECE_OPTIONS, are parsed in one piece,
+    as are files whose ranges fail to parse on their own. `.tsv` files default to tab separators.
+
+    Parameters:
+    - path: The CSV file.
+    - columns: The columns to keep (defaults to all).
+    - filters: Row predicates (see `filter_frame`).
+    - n_jobs: The number of parsing threads (None or -1 for one per CPU core).
+    - options: Other `pd.read_csv` options (e.g. `sep`, `dtype`).
+
+    Returns:
+    - pd.DataFrame: The dataset.
+    """
+    n_jobs = resolve_n_jobs(n_jobs)
+    usecols = _projection(columns, filters)
+    name = os.fspath(path).lower()
+    if name.endswith(tuple('.tsv' + suffix for suffix in ('',) + COMPRESSIONS)):
+        options.setdefault('sep', '\t')
+    size = os.path.getsize(path)
+    n_ranges = min(n_jobs, size // MIN_RANGE_BYTES)
+    parallel = (n_ranges > 1 and not name.endswith(COMPRESSIONS)
+                and not any(option in options for option in SINGLE_PIECE_OPTIONS))
+    if parallel:
+        names = pd.read_csv(path, nrows=0, **options).columns.tolist()
+        with open(path, 'rb') as file:
+            header = file.readline()
+        quotechar = options.get('quotechar', '"').encode()
+        ranges = _csv_ranges(path, len(header), size, n_ranges, quotechar=quotechar)
+        try:
+            chunks = _read_csv_ranges(path, ranges, names, usecols, options)
+        except pd.errors.ParserError:
+            # e.g. a header spanning several lines; the file is parsed in one piece instead
+            pass
+        else:
+            chunks = [filter_frame(chunk, filters) for chunk in chunks]
+            return pd.concat([chunk if columns is None else chunk[list(columns)] for chunk in chunks],
+                             ignore_index=True)
+    data = filter_frame(pd.read_csv(path, usecols=usecols, **options), filters)
+    return data if columns is None else data[list(columns)]
+
+
+def _arrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Reading Feather files, and filtering Parquet files, requires pyarrow.") from None
+    return pa, pq
+
+
+def _arrow_filter(filters):
+    """Turn DNF filters into a pyarrow compute expression."""
+    _, pq = _arrow()
+    to_expression = getattr(pq, 'filters_to_expression', None) or pq._filters_to_expression
+    return to_expression(_conjunctions(filters))
+
+
+def read_parquet(path, columns=None, filters=None):
+    """
+    Read a Parquet file, reading only the projected columns and skipping row groups that the filters rule out.
+
+    Returns:
+    - pyarrow.Table: The dataset, or a DataFrame when pyarrow is not installed.
+    """
+    try:
+        _, pq = _arrow()
+    except ImportError:
+        # fastparquet also pushes the projection and the row-group filters down
+        return pd.read_parquet(path, columns=columns, filters=_conjunctions(filters) or None)
+    # Row groups whose statistics cannot match are skipped; the remaining rows are filtered exactly
+    return pq.read_table(path, columns=columns, filters=_conjunctions(filters) or None, memory_map=True)
+
+
+def read_feather(path, columns=None, filters=None):
+    """
+    Read a Feather (Arrow IPC) file through a memory map, so only the pages of the projected columns are read.
+
+    Returns:
+    - pyarrow.Table: The dataset.
+    """
+    _arrow()
+    import pyarrow.feather as feather
+    table = feather.read_table(path, columns=_projection(columns, filters), memory_map=True)
+    if filters:
+        table = table.filter(_arrow_filter(filters))
+    return table if columns is None else table.select(list(columns))
+
+
+def read_path(path, columns=None, filters=None, n_jobs=1, backend='pandas', **options):
+    """
+    Load a CSV, Parquet or Feather file, reading only what is needed.
+
+    Parameters:
+    - path: The file; the format comes from its extension (.csv/.tsv/.txt, optionally compressed, .parquet/.pq,
+      .feather/.arrow/.ipc).
+    - columns: The columns to load (defaults to all). Parquet and Feather files only read those columns' bytes.
+    - filters: Row predicates, e.g. [('year', '>=', 2020), ('country', 'in', ['FR', 'DE'])] (see `filter_frame`).
+      Parquet row groups that cannot match are skipped.
+    - n_jobs: The number of threads parsing a large CSV in byte ranges (None or -1 for one per CPU core).
+    - backend: 'pandas' for a DataFrame, or 'arrow' / 'polars' to keep a Parquet or Feather file in Arrow memory
+      (memory-mapped for Feather) and clean it with that engine.
+    - options: Other `pd.read_csv` options for CSV files.
+
+    Returns:
+    - The dataset as a pandas DataFrame, pyarrow Table or Polars DataFrame.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Invalid backend '{backend}'. Use one of: {', '.join(BACKENDS)}.")
+    kind = file_format(path)
+    if kind == 'csv':
+        data = read_csv(path, columns=columns, filters=filters, n_jobs=n_jobs, **options)
+    elif kind == 'parquet':
+        data = read_parquet(path, columns=columns, filters=filters)
+    else:
+        data = read_feather(path, columns=columns, filters=filters)
+
+    if backend == 'pandas':
+        return data if isinstance(data, pd.DataFrame) else data.to_pandas()
+    if isinstance(data, pd.DataFrame):
+        pa, _ = _arrow()
+        data = pa.Table.from_pandas(data, preserve_index=False)
+    if backend == 'polars':
+        import polars as pl
+        return pl.from_arrow(data)
+    return data
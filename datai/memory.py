@@ -0,0 +1,213 @@
+# datai/memory.py
+
+import threading
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+
+class MemoryTracker:
+    """
+    Context manager that reports the peak extra memory allocated inside its block.
+
+    NumPy and pandas buffers are traced by `tracemalloc`, so the peak covers the temporary arrays and
+    copies a cleaning step creates. Trackers can be nested: an outer tracker's peak includes the peaks
+    reached inside the inner ones. Each thread nests its own trackers; since `tracemalloc` traces the
+    whole process, a tracker's peak also covers what other threads allocate while it is open.
+
+    Example:
+        with MemoryTracker() as tracker:
+            Utils.normalize_data(data)
+        print(tracker.peak_bytes)
+    """
+
+    # Every open tracker, across threads, and whether tracing was started by a tracker
+    _open = set()
+    _lock = threading.Lock()
+    _started = False
+    # The open trackers of each thread, innermost last
+    _local = threading.local()
+
+    def __init__(self):
+        self.peak_bytes = 0
+        self.retained_bytes = 0
+        self._baseline = 0
+        self._inner_peak = 0
+
+    @classmethod
+    def _stack(cls):
+        """The calling thread's open trackers."""
+        if not hasattr(cls._local, 'stack'):
+            cls._local.stack = []
+        return cls._local.stack
+
+    def __enter__(self):
+        with MemoryTracker._lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                MemoryTracker._started = True
+            current, peak = tracemalloc.get_traced_memory()
+            # Resetting the peak below would lose the peak the open trackers have seen so far, so hand it over first
+            for tracker in MemoryTracker._open:
+                tracker._note_peak(peak)
+            tracemalloc.reset_peak()
+            self._baseline = current
+            self._inner_peak = 0
+            MemoryTracker._open.add(self)
+        self._stack().append(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        stack = self._stack()
+        stack.remove(self)
+        with MemoryTracker._lock:
+            current, peak = tracemalloc.get_traced_memory()
+            peak = max(peak, self._inner_peak)
+            MemoryTracker._open.discard(self)
+            if stack:
+                stack[-1]._note_peak(peak)
+            self.peak_bytes = max(peak - self._baseline, 0)
+            self.retained_bytes = max(current - self._baseline, 0)
+            if not MemoryTracker._open and MemoryTracker._started:
+                tracemalloc.stop()
+                MemoryTracker._started = False
+        return False
+
+    def _note_peak(self, peak):
+        """Record a traced peak reached while this tracker was open."""
+        self._inner_peak = max(self._inner_peak, peak)
+
+
+def dtype_columns(data, include=None, exclude=None):
+    """
+    Return the columns `data.select_dtypes(include, exclude)` would keep, without copying any data.
+
+    `select_dtypes` builds a new frame holding the selected columns; running it on an empty slice
+    gives the same columns for free.
+    """
+    return data.iloc[:0].select_dtypes(include=include, exclude=exclude).columns
+
+
+def is_categorical(dtype):
+    """Return True for dtypes filled with the mode rather than the median (object, category and string)."""
+    return dtype == object or isinstance(dtype, (pd.CategoricalDtype, pd.StringDtype))
+
+
+def _writable_view(data, column):
+    """Return the column's NumPy buffer if writing to it updates the frame in place, else None."""
+    dtype = data[column].dtype
+    # Extension dtypes (category, nullable, Arrow) hand out converted copies, so writes would be lost
+    if not isinstance(dtype, np.dtype) or dtype.kind not in 'fO':
+        return None
+    values = data[column].to_numpy()
+    return values if values.flags.writeable else None
+
+
+def fill_inplace(data, column, value):
+    """
+    Fill the missing values of one column, writing into the frame's own buffer when possible.
+
+    `value` is a scalar, or an array holding one fill value per row (e.g. the median of each row's group).
+    Falls back to replacing the single column (one column-sized allocation) for extension dtypes
+    or when copy-on-write makes the buffer read-only.
+    """
+    per_row = isinstance(value, np.ndarray)
+    values = _writable_view(data, column)
+    if values is not None:
+        mask = pd.isna(values)
+        if not mask.any():
+            return
+        try:
+            values[mask] = value[mask] if per_row else value
+            return
+        except (TypeError, ValueError):
+            pass
+    if per_row:
+        data[column] = data[column].where(data[column].notna(), value)
+    else:
+        data[column] = data[column].fillna(value)
+
+
+def scale_inplace(data, column, shift, scale):
+    """
+    Replace a numeric column with `(column - shift) / scale`, in place for float columns.
+
+    Integer columns become float columns, which needs one new column-sized array.
+    """
+    values = _writable_view(data, column)
+    with np.errstate(all='ignore'):
+        if values is not None and values.dtype.kind == 'f':
+            np.subtract(values, shift, out=values)
+            np.divide(values, scale, out=values)
+        else:
+            data[column] = (data[column].to_numpy(dtype='float64', na_value=np.nan) - shift) / scale
+
+
+def _smallest_integer(values):
+    """Return the narrowest integer dtype that holds every value of an integer array."""
+    if not values.size:
+        return values.dtype
+    low, high = values.min(), values.max()
+    candidates = ('uint8', 'uint16', 'uint32', 'uint64') if low >= 0 else ('int8', 'int16', 'int32', 'int64')
+    for candidate in candidates:
+        info = np.iinfo(candidate)
+        if info.min <= low and high <= info.max:
+            return np.dtype(candidate)
+    return values.dtype
+
+
+def compact_column(series, max_category_ratio=0.5, arrow_strings=False):
+    """
+    Return a memory-compact version of one column, or the column itself if nothing smaller is safe.
+
+    - Integers are downcast to the narrowest (unsigned if possible) width holding every value.
+    - Floats become float32 only when every value survives the round trip exactly.
+    - Object columns whose distinct values are at most `max_category_ratio` of the rows become `category`;
+      the others become Arrow-backed strings when `arrow_strings` is True and pyarrow is installed.
+    """
+    dtype = series.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in 'iu':
+        target = _smallest_integer(series.to_numpy())
+        return series.astype(target) if target != dtype else series
+
+    if isinstance(dtype, np.dtype) and dtype == 'float64':
+        values = series.to_numpy()
+        narrow = values.astype('float32')
+        with np.errstate(all='ignore'):
+            exact = np.array_equal(narrow.astype('float64'), values, equal_nan=True)
+        return pd.Series(narrow, index=series.index, name=series.name) if exact else series
+
+    if dtype == object:
+        non_null = series.count()
+        if non_null and series.nunique(dropna=True) <= max_category_ratio * non_null:
+            return series.astype('category')
+        if arrow_strings and non_null and series.dropna().map(type).eq(str).all():
+            try:
+                return series.astype('string[pyarrow]')
+            except ImportError:
+                return series
+    return series
+
+
+def optimize_dtypes(data, max_category_ratio=0.5, arrow_strings=False):
+    """
+    Shrink every column of a dataset to its most compact safe dtype, replacing columns in place.
+
+    Parameters:
+    - data: The dataset to optimize (modified in place).
+    - max_category_ratio: The largest distinct-to-non-null ratio for which object columns become `category`.
+    - arrow_strings: If True, store the other string columns as Arrow strings (requires pyarrow).
+
+    Returns:
+    - dict: The `memory_usage(deep=True)` totals before and after, and the dtype changes per column.
+    """
+    before = int(data.memory_usage(deep=True).sum())
+    changes = {}
+    for column in data.columns:
+        compact = compact_column(data[column], max_category_ratio=max_category_ratio, arrow_strings=arrow_strings)
+        if compact.dtype != data[column].dtype:
+            changes[column] = (str(data[column].dtype), str(compact.dtype))
+            data[column] = compact
+    after = int(data.memory_usage(deep=True).sum())
+    return {"bytes_before": before, "bytes_after": after, "bytes_saved": before - after, "changes": changes}
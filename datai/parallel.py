@@ -0,0 +1,220 @@
+# datai/parallel.py
+
+import atexit
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from datai.memory import dtype_columns
+
+# Object columns go to worker processes only when they hold at least this many values in total. Below it,
+# pickling the columns to the workers costs more than counting them, so threads are used instead.
+PROCESS_MIN_VALUES = 1_000_000
+
+# The worker processes are started on first use and reused by later calls
+_process_pool = None
+_process_pool_workers = 0
+_process_pool_lock = threading.Lock()
+
+
+def resolve_n_jobs(n_jobs):
+    """Turn an `n_jobs` option into a worker count (None or -1 means one worker per CPU core)."""
+    if n_jobs is None or n_jobs < 0:
+        return os.cpu_count() or 1
+    return max(int(n_jobs), 1)
+
+
+def split_blocks(items, n_blocks):
+    """Split a sequence into at most `n_blocks` contiguous blocks of similar size."""
+    items = list(items)
+    n_blocks = max(min(n_blocks, len(items)), 1)
+    bounds = np.linspace(0, len(items), n_blocks + 1).astype(int)
+    return [items[start:stop] for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+
+
+def map_block_columns(func, block, n_jobs=1):
+    """
+    Apply a column-wise NumPy function to a 2D block, splitting the columns across threads.
+
+    Each thread gets a column slice of the block, which is a view, so no data is copied.
+    `func(block)` must return an array whose last axis has one entry per column
+    (like `np.nanquantile(block, q, axis=0)`).
+
+    Parameters:
+    - func: The column-wise function.
+    - block: A 1D or 2D array.
+    - n_jobs: The number of threads.
+
+    Returns:
+    - np.ndarray: The results concatenated along the column axis.
+    """
+    n_jobs = resolve_n_jobs(n_jobs)
+    if block.ndim == 1 or n_jobs == 1 or block.shape[1] < 2:
+        return func(block)
+    slices = [slice(cols[0], cols[-1] + 1) for cols in split_blocks(range(block.shape[1]), n_jobs)]
+    with ThreadPoolExecutor(max_workers=len(slices)) as pool:
+        results = list(pool.map(lambda cols: func(block[:, cols]), slices))
+    return np.concatenate(results, axis=-1)
+
+
+def parallel_quantiles(quantiles, n_jobs=1):
+    """Wrap a column-wise quantile function so that 2D blocks are processed by `n_jobs` threads."""
+    if resolve_n_jobs(n_jobs) == 1:
+        return quantiles
+    return lambda block, q: map_block_columns(lambda part: quantiles(part, q), block, n_jobs)
+
+
+def _numeric_statistics(values):
+    """`Series.describe()`-style statistics of a 1D float array, plus the null count."""
+    mask = np.isnan(values)
+    valid = values[~mask]
+    count = valid.size
+    if count:
+        q1, median, q3 = np.quantile(valid, [0.25, 0.5, 0.75])
+        stats = {"count": float(count), "mean": valid.mean(), "std": valid.std(ddof=1) if count > 1 else np.nan,
+                 "min": valid.min(), "25%": q1, "50%": median, "75%": q3, "max": valid.max()}
+    else:
+        stats = dict.fromkeys(["mean", "std", "min", "25%", "50%", "75%", "max"], np.nan)
+        stats = {"count": 0.0, **stats}
+    stats["nulls"] = int(mask.sum())
+    return stats
+
+
+def _numeric_block_statistics(columns):
+    """Statistics for a block of (name, array) numeric columns; runs in a worker thread."""
+    return {name: _numeric_statistics(np.asarray(values, dtype='float64')) for name, values in columns}
+
+
+def _mode(counts):
+    """The value `Series.mode()[0]` returns: the smallest of the most frequent values (in category order)."""
+    tied = counts.index[counts.to_numpy() == counts.iloc[0]]
+    try:
+        return tied.sort_values()[0]
+    except TypeError:
+        # Values that cannot be ordered are left in order of appearance, as `Series.mode()` does
+        return tied[0]
+
+
+def _object_statistics(values):
+    """`Series.describe()`-style statistics of an object column, plus the null count and mode."""
+    series = pd.Series(values, copy=False)
+    counts = series.value_counts(dropna=True)
+    # Categorical columns also count their unused categories
+    counts = counts[counts.to_numpy() > 0]
+    nulls = int(series.isna().sum())
+    return {
+        "count": len(series) - nulls,
+        "unique": len(counts),
+        "top": counts.index[0] if len(counts) else np.nan,
+        "freq": int(counts.iloc[0]) if len(counts) else np.nan,
+        # `top` is the first most frequent value, like describe(); the mode breaks ties like Series.mode()
+        "mode": _mode(counts) if len(counts) else np.nan,
+        "nulls": nulls,
+    }
+
+
+def _object_block_statistics(columns):
+    """Statistics for a block of (name, array) object columns; runs in a worker process."""
+    return {name: _object_statistics(values) for name, values in columns}
+
+
+def _object_pool(n_jobs):
+    """Return the shared worker process pool, (re)starting it if it has fewer than `n_jobs` workers."""
+    global _process_pool, _process_pool_workers
+    with _process_pool_lock:
+        if _process_pool is None or _process_pool_workers < n_jobs:
+            if _process_pool is not None:
+                _process_pool.shutdown()
+            _process_pool = ProcessPoolExecutor(max_workers=n_jobs)
+            _process_pool_workers = n_jobs
+        return _process_pool
+
+
+@atexit.register
+def shutdown_pool():
+    """Stop the shared worker processes (called automatically at exit)."""
+    global _process_pool, _process_pool_workers
+    with _process_pool_lock:
+        if _process_pool is not None:
+            _process_pool.shutdown()
+        _process_pool, _process_pool_workers = None, 0
+
+
+def column_statistics(data, n_jobs=1, columns=None):
+    """
+    Compute per-column statistics concurrently.
+
+    Numeric columns are split into blocks and processed by threads, which share the column buffers
+    with the caller (NumPy releases the GIL during the heavy work). Object columns, which hold Python
+    objects and cannot use the NumPy fast paths, are processed in worker processes once they hold at least
+    `PROCESS_MIN_VALUES` values (and in threads below that). The processes are started once and reused;
+    only the columns themselves are sent, never the whole frame.
+
+    Parameters:
+    - data: The dataset to analyze.
+    - n_jobs: The number of workers (None or -1 for one per CPU core).
+    - columns: The columns to analyze (defaults to every numeric and object column).
+
+    Returns:
+    - dict: One statistics dict per column, keyed like `describe()` plus "nulls" (and "mode" for object columns).
+    """
+    n_jobs = resolve_n_jobs(n_jobs)
+    subset = data if columns is None else data[list(columns)]
+    numeric_cols = dtype_columns(subset, include=[np.number], exclude=['bool'])
+    object_cols = dtype_columns(subset, include=['object', 'category', 'string', 'bool'])
+
+    numeric_blocks = split_blocks(
+        [(c, subset[c].to_numpy(dtype='float64', na_value=np.nan)) for c in numeric_cols], n_jobs
+    )
+    # Categorical columns are sent as Categoricals, so the mode breaks ties in category order
+    object_blocks = split_blocks([(c, subset[c].array) for c in object_cols], n_jobs)
+
+    results = {}
+    if n_jobs == 1:
+        for block in numeric_blocks:
+            results.update(_numeric_block_statistics(block))
+        for block in object_blocks:
+            results.update(_object_block_statistics(block))
+    else:
+        with ThreadPoolExecutor(max_workers=n_jobs) as threads:
+            numeric_futures = [threads.submit(_numeric_block_statistics, block) for block in numeric_blocks]
+            if len(object_cols) * len(subset) >= PROCESS_MIN_VALUES:
+                object_results = _object_pool(n_jobs).map(_object_block_statistics, object_blocks)
+            else:
+                object_results = threads.map(_object_block_statistics, object_blocks)
+            for block_results in object_results:
+                results.update(block_results)
+            for future in numeric_futures:
+                results.update(future.result())
+
+    return {column: results[column] for column in subset.columns if column in results}
+
+
+def describe_columns(data, n_jobs=1):
+    """
+    Parallel equivalent of `data.describe().to_dict()`.
+
+    Parameters:
+    - data: The dataset to describe.
+    - n_jobs: The number of workers (None or -1 for one per CPU core).
+
+    Returns:
+    - dict: The summary statistics of each described column.
+    """
+    numeric_cols = dtype_columns(data, include=[np.number], exclude=['bool'])
+    datetime_cols = dtype_columns(data, include=['datetime'])
+    # Like DataFrame.describe(), only describe the other columns when there are no numeric ones
+    if len(numeric_cols) or len(datetime_cols):
+        described = column_statistics(data, n_jobs=n_jobs, columns=numeric_cols)
+        if len(datetime_cols):
+            described.update(data[datetime_cols].describe().to_dict())
+        order = [column for column in data.columns if column in described]
+    else:
+        described = column_statistics(data, n_jobs=n_jobs)
+        order = list(described)
+
+    return {column: {key: value for key, value in described[column].items() if key not in ("nulls", "mode")}
+            for column in order}
@@ -0,0 +1,248 @@
+# datai/profile.py
+
+import hashlib
+import weakref
+from collections import OrderedDict
+from functools import cached_property
+
+import numpy as np
+import pandas as pd
+
+from datai.correlation import correlation_matrix
+from datai.inference import SAMPLE_ROWS, infer_column_type, sample_frame
+from datai.memory import dtype_columns
+from datai.parallel import describe_columns, resolve_n_jobs
+
+# The number of profiles kept in the cache
+MAX_PROFILES = 16
+
+NUMERIC_KINDS = ['number']
+CATEGORICAL_KINDS = ['object', 'category', 'string', 'bool']
+DATETIME_KINDS = ['datetime', 'datetimetz']
+
+# Cache key -> profile, most recently used last
+_profiles = OrderedDict()
+# Ids of the datasets whose garbage collection drops their profiles
+_watched = set()
+
+
+# Cache keys include the values of this many evenly spaced rows (and the identity of the column buffers)
+FINGERPRINT_ROWS = 1024
+# If True, cache keys hash every value instead, so any in-place edit is noticed (costs a full pass per lookup)
+FULL_FINGERPRINT = False
+
+
+def _hash_values(values):
+    """The bytes of a Series or Index with a NumPy dtype, or vectorized 64-bit hashes of its values."""
+    if isinstance(values.dtype, np.dtype) and values.dtype.kind in 'biufcmM':
+        # Fixed-width values are fed to the digest as they are, without hashing each one first
+        return np.ascontiguousarray(values.to_numpy())
+    try:
+        return pd.util.hash_pandas_object(values, index=False).to_numpy()
+    except TypeError:
+        # Unhashable cells (lists, dicts) are hashed through their text form
+        return pd.util.hash_pandas_object(values.astype(str), index=False).to_numpy()
+
+
+def _buffer_ids(data):
+    """The identity of each column buffer, which changes whenever a column is replaced or its dtype changes."""
+    try:
+        return tuple(id(block.values) for block in data._mgr.blocks)
+    except AttributeError:
+        return tuple(id(data[column].array) for column in data.columns)
+
+
+def fingerprint(data, full=None):
+    """
+    Compute a fingerprint of a dataset's shape, column names, dtypes, column buffers and values.
+
+    By default only the values of `FINGERPRINT_ROWS` evenly spaced rows are hashed, together with the
+    identity of the column buffers, so the cost does not grow with the number of rows. Replacing,
+    adding or converting a column changes the fingerprint; an in-place edit of single values between
+    the sampled rows may not, so call `invalidate_profile` after one (datai's own in-place steps do).
+    With `full=True` every value is hashed and any edit changes the fingerprint.
+
+    Parameters:
+    - data: The dataset.
+    - full: If True, hash every value (defaults to `FULL_FINGERPRINT`).
+
+    Returns:
+    - tuple: A hashable fingerprint.
+    """
+    if full is None:
+        full = FULL_FINGERPRINT
+    if not full and len(data) > FINGERPRINT_ROWS:
+        rows = np.linspace(0, len(data) - 1, FINGERPRINT_ROWS).astype(np.intp)
+        sampled = data.iloc[rows]
+    else:
+        sampled = data
+    # SHA-256 runs on the CPU's SHA instructions where available, faster than blake2b on large buffers
+    digest = hashlib.sha256()
+    index = data.index
+    if isinstance(index, pd.RangeIndex):
+        digest.update(repr((index.start, index.stop, index.step)).encode())
+    else:
+        digest.update(_hash_values(sampled.index))
+    for position in range(sampled.shape[1]):
+        digest.update(_hash_values(sampled.iloc[:, position]))
+    buffers = () if full else (id(index),) + _buffer_ids(data)
+    return data.shape, tuple(map(str, data.columns)), tuple(map(str, data.dtypes)), buffers, digest.hexdigest()
+
+
+class DatasetProfile:
+    """
+    Statistics of one dataset, each computed the first time it is used and then reused.
+
+    Profiles are shared through `profile_data`, so `Utils.summarize_data` and `DataCleaning.show_details`
+    scan a dataset once between them. A profile only keeps a weak reference to its dataset.
+    """
+
+    def __init__(self, data, n_jobs=1):
+        """
+        Initialize the profile of a dataset.
+
+        Parameters:
+        - data: The dataset to profile.
+        - n_jobs: The number of workers computing the column statistics (None or -1 for one per CPU core).
+        """
+        self._data = weakref.ref(data)
+        self.n_jobs = resolve_n_jobs(n_jobs)
+        self.shape = data.shape
+        self.dtypes = data.dtypes
+
+    def _frame(self):
+        """Return the profiled dataset."""
+        data = self._data()
+        if data is None:
+            raise ValueError("The profiled dataset no longer exists.")
+        return data
+
+    @cached_property
+    def numeric_columns(self):
+        """The numeric columns."""
+        return dtype_columns(self._frame(), include=NUMERIC_KINDS)
+
+    @cached_property
+    def categorical_columns(self):
+        """The object, category, string and boolean columns."""
+        return dtype_columns(self._frame(), include=CATEGORICAL_KINDS)
+
+    @cached_property
+    def datetime_columns(self):
+        """The datetime columns."""
+        return dtype_columns(self._frame(), include=DATETIME_KINDS)
+
+    @cached_property
+    def kinds(self):
+        """The kind of each column: 'numeric', 'categorical', 'datetime' or 'other'."""
+        kinds = dict.fromkeys(self._frame().columns, 'other')
+        for kind, columns in (('numeric', self.numeric_columns), ('categorical', self.categorical_columns),
+                              ('datetime', self.datetime_columns)):
+            kinds.update(dict.fromkeys(columns, kind))
+        return kinds
+
+    @cached_property
+    def sample(self):
+        """A uniform sample of at most `SAMPLE_ROWS` rows, in their original order."""
+        return sample_frame(self._frame(), size=SAMPLE_ROWS)
+
+    @cached_property
+    def semantic_types(self):
+        """The semantic type of each column (see `datai.inference.infer_column_type`), inferred from the sample."""
+        return {column: infer_column_type(self.sample[column]) for column in self.sample.columns}
+
+    @cached_property
+    def nulls(self):
+        """The number of missing values in each column."""
+        return self._frame().isnull().sum()
+
+    @cached_property
+    def describe(self):
+        """The `describe()` table of the dataset."""
+        if self.n_jobs == 1:
+            return self._frame().describe()
+        return pd.DataFrame(self.statistics)
+
+    @cached_property
+    def statistics(self):
+        """The `describe()` statistics as a dict of columns (moments, quantiles and, for text, the top value)."""
+        if self.n_jobs == 1:
+            return self.describe.to_dict()
+        return describe_columns(self._frame(), n_jobs=self.n_jobs)
+
+    @cached_property
+    def cardinality(self):
+        """The number of distinct non-missing values in each column."""
+        return self._frame().nunique()
+
+    @cached_property
+    def correlation(self):
+        """The correlation matrix of the numeric columns (blocked matrix products instead of pairwise loops)."""
+        return correlation_matrix(self._frame(), columns=self.numeric_columns)
+
+    def summary(self):
+        """Return the summary dict of `Utils.summarize_data`."""
+        return {
+            "Shape": self.shape,
+            "Columns": self._frame().columns.tolist(),
+            "Data Types": self.dtypes.to_dict(),
+            "Missing Values": self.nulls.to_dict(),
+            # Copied, so callers cannot alter the cached statistics
+            "Summary Statistics": {column: dict(stats) for column, stats in self.statistics.items()},
+        }
+
+
+def _forget(data_id):
+    """Drop every cached profile of the dataset with the given id."""
+    for key in [key for key in _profiles if key[0] == data_id]:
+        del _profiles[key]
+
+
+def _collected(data_id):
+    """Drop the profiles of a garbage-collected dataset, before its id can be reused."""
+    _watched.discard(data_id)
+    _forget(data_id)
+
+
+def profile_data(data, n_jobs=1, full_fingerprint=None):
+    """
+    Return the cached profile of a dataset, profiling it on first use.
+
+    A profile is reused for as long as the dataset's fingerprint is unchanged (see `fingerprint`); it is
+    dropped when the dataset is garbage collected or passed to `invalidate_profile`.
+
+    Parameters:
+    - data: The dataset.
+    - n_jobs: The number of workers used if the profile has to be computed.
+    - full_fingerprint: If True, check every value for changes before reusing a profile
+      (defaults to `FULL_FINGERPRINT`).
+
+    Returns:
+    - DatasetProfile: The dataset's profile.
+    """
+    key = (id(data),) + fingerprint(data, full=full_fingerprint)
+    profile = _profiles.get(key)
+    if profile is not None and profile._data() is data:
+        _profiles.move_to_end(key)
+        return profile
+
+    # A changed fingerprint means the dataset changed, so its older profiles are stale
+    _forget(id(data))
+    profile = DatasetProfile(data, n_jobs=n_jobs)
+    _profiles[key] = profile
+    if id(data) not in _watched:
+        _watched.add(id(data))
+        weakref.finalize(data, _collected, id(data))
+    while len(_profiles) > MAX_PROFILES:
+        _profiles.popitem(last=False)
+    return profile
+
+
+def invalidate_profile(data):
+    """Drop the cached profile of a dataset, e.g. after modifying it in place."""
+    _forget(id(data))
+
+
+def clear_profiles():
+    """Drop every cached profile."""
+    _profiles.clear()
@@ -0,0 +1,143 @@
+# datai/rendering.py
+
+import contextlib
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from datai.lazy import LazyModule
+from datai.parallel import resolve_n_jobs
+
+# Imported on first use, so importing datai does not load matplotlib
+matplotlib = LazyModule('matplotlib')
+plt = LazyModule('matplotlib.pyplot')
+
+FORMATS = ('png', 'svg', 'pdf')
+
+
+def save_figure(fig, output, dpi=None):
+    """
+    Render a figure to bytes or to a file.
+
+    Parameters:
+    - fig: The matplotlib figure.
+    - output: A format name ('png', 'svg' or 'pdf') to get the rendered bytes, or a file path
+      (the format is taken from its extension).
+    - dpi: The resolution (defaults to the figure's own).
+
+    Returns:
+    - bytes or str: The rendered bytes, or the path written.
+    """
+    if output in FORMATS:
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format=output, dpi=dpi)
+        return buffer.getvalue()
+    path = os.fspath(output)
+    fig.savefig(path, dpi=dpi)
+    return path
+
+
+def show_or_save(output=None, fig=None):
+    """
+    Finish a plot: show it when `output` is None, otherwise render it with `save_figure` and close it.
+
+    The figure is closed even if rendering fails, so headless callers never accumulate open figures.
+    """
+    fig = plt.gcf() if fig is None else fig
+    if output is None:
+        plt.show()
+        return None
+    try:
+        return save_figure(fig, output)
+    finally:
+        plt.close(fig)
+
+
+def numbered_output(output, index):
+    """Return the output for the `index`-th figure of a multi-figure plot ('report.png' -> 'report_1.png')."""
+    if output is None or output in FORMATS:
+        return output
+    root, extension = os.path.splitext(os.fspath(output))
+    return f"{root}_{index}{extension}"
+
+
+def _resolve_plot(plot):
+    """Turn a plot name ('histogram', 'AutoPlot.histogram', 'Examples.bar_chart') into the plotting function."""
+    if callable(plot):
+        return plot
+    from datai.auto_plot import AutoPlot
+    from datai.visualization import Examples
+
+    owner, _, name = plot.rpartition('.')
+    classes = {"AutoPlot": AutoPlot, "Examples": Examples}
+    if owner:
+        candidates = [classes[owner]] if owner in classes else []
+    else:
+        candidates = [AutoPlot, Examples]
+    for cls in candidates:
+        if hasattr(cls, name):
+            return getattr(cls, name)
+    raise ValueError(f"Unknown plot '{plot}'. Use an AutoPlot or Examples method name.")
+
+
+def render(spec, output='png', quiet=True):
+    """
+    Render one plot spec without displaying it.
+
+    Parameters:
+    - spec: A dict with a "plot" entry (a method name such as 'scatter_plot' or 'Examples.heatmap', or a function)
+      and the plot's keyword arguments. An "output" entry overrides the `output` argument.
+    - output: A format name ('png', 'svg' or 'pdf') to get bytes, or a file path.
+    - quiet: If True, the descriptions the plots print are suppressed.
+
+    Returns:
+    - bytes, str or list: What the plot returns for that output (a list for multi-figure plots like auto_plot).
+    """
+    kwargs = dict(spec)
+    plot = _resolve_plot(kwargs.pop("plot"))
+    kwargs["output"] = kwargs.get("output", output)
+    stdout = contextlib.redirect_stdout(io.StringIO()) if quiet else contextlib.nullcontext()
+    try:
+        with stdout:
+            return plot(**kwargs)
+    finally:
+        # Also closes figures a plot created but did not render
+        plt.close('all')
+
+
+def _init_worker():
+    """Switch a worker process to the non-interactive Agg backend."""
+    matplotlib.use('Agg', force=True)
+
+
+def render_batch(specs, n_jobs=1, output='png', quiet=True):
+    """
+    Render many plot specs headlessly, spread across worker processes.
+
+    Each worker uses the Agg backend and renders whole specs, so throughput scales with the number of cores.
+    Every figure is closed as soon as it is rendered.
+
+    Example:
+        render_batch([{"plot": "histogram", "data": df, "col": "age", "output": "age.png"},
+                      {"plot": "scatter_plot", "data": df, "x_col": "age", "y_col": "fare"}], n_jobs=4)
+
+    Parameters:
+    - specs: The plot specs (see `render`). Their data is sent to the workers, so keep it to the columns needed.
+    - n_jobs: The number of worker processes (None or -1 for one per CPU core).
+    - output: The default output of specs without their own "output" entry.
+    - quiet: If True, the descriptions the plots print are suppressed.
+
+    Returns:
+    - list: The result of each spec, in order.
+    """
+    specs = list(specs)
+    n_jobs = min(resolve_n_jobs(n_jobs), max(len(specs), 1))
+    if n_jobs == 1:
+        return [render(spec, output=output, quiet=quiet) for spec in specs]
+
+    outputs = [output] * len(specs)
+    quiet_flags = [quiet] * len(specs)
+    # A few specs per task amortizes the pickling overhead without starving the pool
+    chunksize = max(len(specs) // (n_jobs * 4), 1)
+    with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker) as pool:
+        return list(pool.map(render, specs, outputs, quiet_flags, chunksize=chunksize))
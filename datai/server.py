@@ -0,0 +1,610 @@
+# datai/server.py
+
+import asyncio
+import base64
+import contextlib
+import hashlib
+import inspect
+import io
+import json
+import math
+import os
+import signal
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+
+from datai.parallel import resolve_n_jobs
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8000
+# Bytes of results kept in the cache (least recently used first out)
+CACHE_BYTES = 256 << 20
+# Uploads larger than this are refused with 413
+MAX_BODY_BYTES = 1 << 30
+# Jobs allowed to run or wait per worker; beyond that requests are refused with 503 instead of queuing forever
+QUEUE_PER_WORKER = 4
+# Files whose content hash is remembered, keyed by path, size and modification time
+MAX_FILE_DIGESTS = 1024
+# Chunk size when hashing files
+HASH_CHUNK_BYTES = 1 << 20
+
+OPERATIONS = ('summary', 'clean', 'plot')
+INPUT_TYPES = ('csv', 'parquet', 'feather')
+CLEAN_OUTPUTS = ('csv', 'parquet', 'json')
+PLOT_FORMATS = ('png', 'svg', 'pdf')
+# The names plots give their dataset parameter
+PLOT_DATA_ARGUMENTS = ('data', 'dataset')
+
+CONTENT_TYPES = {
+    'csv': 'text/csv',
+    'parquet': 'application/vnd.apache.parquet',
+    'feather': 'application/vnd.apache.arrow.file',
+    'json': 'application/json',
+    'png': 'image/png',
+    'svg': 'image/svg+xml',
+    'pdf': 'application/pdf',
+}
+# Upload Content-Type -> input type (other content types are read as CSV)
+UPLOAD_TYPES = {
+    'text/csv': 'csv', 'application/csv': 'csv', 'text/plain': 'csv',
+    'application/vnd.apache.parquet': 'parquet', 'application/x-parquet': 'parquet',
+    'application/vnd.apache.arrow.file': 'feather', 'application/x-feather': 'feather',
+}
+TRUE_WORDS = ('1', 'true', 'yes', 'on')
+FALSE_WORDS = ('0', 'false', 'no', 'off')
+
+
+class HTTPError(Exception):
+    """An error answered to the client with `status` and a JSON {"error": message} body."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = HTTPStatus(status)
+
+
+# ---------------------------------------------------------------------------------------------------------------
+# Worker side: these functions run in the pool's processes, which stay alive between requests
+
+def _init_worker():
+    """Warm a worker: use the headless Agg backend and import the cleaning, summary and plotting stack once."""
+    import matplotlib
+    matplotlib.use('Agg', force=True)
+    import matplotlib.pyplot  # noqa: F401
+    import seaborn  # noqa: F401
+
+    import datai.auto_plot  # noqa: F401
+    import datai.data_cleaning  # noqa: F401
+    import datai.utils  # noqa: F401
+
+
+def _ping():
+    return os.getpid()
+
+
+def _jsonable(value):
+    """Convert a summary (NumPy scalars, dtypes, timestamps, NaN) to plain JSON values."""
+    if isinstance(value, dict):
+        return {str(key): _jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(item) for item in value]
+    if hasattr(value, 'item') and getattr(value, 'ndim', None) == 0:
+        value = value.item()
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, (str, int, bool)) or value is None:
+        return value
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return str(value)
+
+
+def _load(source, columns):
+    """Read the dataset of a job: an uploaded payload or a file on the server's disk."""
+    import pandas as pd
+
+    from datai.loaders import read_path
+
+    kind, value, input_type = source
+    if kind == 'path':
+        return read_path(value, columns=columns)
+    buffer = io.BytesIO(value)
+    if input_type == 'parquet':
+        return pd.read_parquet(buffer, columns=columns)
+    if input_type == 'feather':
+        return pd.read_feather(buffer, columns=columns)
+    data = pd.read_csv(buffer, usecols=columns)
+    return data if columns is None else data[columns]
+
+
+def _summary(data, params):
+    from datai.utils import Utils
+    summary = Utils.summarize_data(data, approximate=params['approximate'])
+    return CONTENT_TYPES['json'], json.dumps(_jsonable(summary)).encode()
+
+
+def _clean(data, params):
+    from datai.data_cleaning import DataCleaning
+    cleaned = DataCleaning(data, copy=False).get_cleaned_data(fused=params['fused'])
+    output = params['output']
+    if output == 'csv':
+        body = cleaned.to_csv(index=False).encode()
+    elif output == 'json':
+        body = cleaned.to_json(orient='records', date_format='iso').encode()
+    else:
+        buffer = io.BytesIO()
+        cleaned.to_parquet(buffer, index=False)
+        body = buffer.getvalue()
+    return CONTENT_TYPES[output], body
+
+
+def _plot_arguments(plot, arguments):
+    """Convert query-string arguments to the types of the plot's defaults (e.g. max_columns=40 -> int)."""
+    defaults = {name: parameter.default for name, parameter in inspect.signature(plot).parameters.items()}
+    converted = {}
+    for name, value in arguments.items():
+        default = defaults.get(name)
+        if isinstance(default, bool) and isinstance(value, str):
+            value = _parse_flag(name, value)
+        elif isinstance(default, (int, float)) and isinstance(value, str):
+            value = type(default)(value)
+        converted[name] = value
+    return converted
+
+
+def served_plot(name):
+    """
+    Return the AutoPlot method a /plot request names, and the name of its dataset parameter.
+
+    Only methods that plot a dataset given as their first parameter ('data', or 'dataset' for auto_plot)
+    are served: the Examples plots ignore the upload and download their own datasets.
+    """
+    from datai.auto_plot import AutoPlot
+
+    owner, _, method = name.rpartition('.')
+    plot = getattr(AutoPlot, method, None) if owner in ('', 'AutoPlot') and not method.startswith('_') else None
+    parameters = list(inspect.signature(plot).parameters) if callable(plot) else []
+    if not parameters or parameters[0] not in PLOT_DATA_ARGUMENTS:
+        raise ValueError(f"Unknown plot '{name}'. Use an AutoPlot method that takes the dataset, e.g. histogram.")
+    return plot, parameters[0]
+
+
+def _plot(data, params):
+    from datai.rendering import render
+    plot, data_argument = served_plot(params['plot'])
+    spec = {"plot": plot, data_argument: data, **_plot_arguments(plot, params['arguments'])}
+    rendered = render(spec, output=params['format'])
+    if isinstance(rendered, list):
+        # Multi-figure plots (auto_plot) answer with every figure, base64-encoded
+        figures = [base64.b64encode(figure).decode('ascii') for figure in rendered]
+        return CONTENT_TYPES['json'], json.dumps({"format": params['format'], "figures": figures}).encode()
+    return CONTENT_TYPES[params['format']], rendered
+
+
+_JOBS = {'summary': _summary, 'clean': _clean, 'plot': _plot}
+
+
+def run_job(operation, source, params):
+    """
+    Run one request in a worker process.
+
+    Parameters:
+    - operation: 'summary', 'clean' or 'plot'.
+    - source: ('upload', payload bytes, input type) or ('path', file path, None).
+    - params: The validated request parameters (see `parse_params`).
+
+    Returns:
+    - tuple: The content type and the body of the response.
+    """
+    # The progress messages of the cleaning and plotting steps are not part of the response
+    with contextlib.redirect_stdout(io.StringIO()):
+        data = _load(source, params['columns'])
+        return _JOBS[operation](data, params)
+
+
+# ---------------------------------------------------------------------------------------------------------------
+# Server side
+
+def _parse_flag(name, value):
+    if value.lower() in TRUE_WORDS:
+        return True
+    if value.lower() in FALSE_WORDS:
+        return False
+    raise ValueError(f"Invalid value '{value}' for '{name}'. Use true or false.")
+
+
+def _choice(query, name, choices, default):
+    value = query.pop(name, [default])[-1]
+    if value not in choices:
+        raise ValueError(f"Invalid {name} '{value}'. Use one of: {', '.join(choices)}.")
+    return value
+
+
+def parse_params(operation, query):
+    """
+    Validate the query parameters of a request, so malformed requests never reach the workers.
+
+    Parameters:
+    - operation: 'summary', 'clean' or 'plot'.
+    - query: The parsed query string (name -> list of values).
+
+    Returns:
+    - dict: The normalized parameters (also part of the cache key).
+    """
+    query = {name: list(values) for name, values in query.items()}
+    query.pop('path', None)
+    query.pop('type', None)
+    columns = query.pop('columns', None)
+    params = {"columns": [column for value in columns for column in value.split(',')] if columns else None}
+    if operation == 'summary':
+        params["approximate"] = _parse_flag('approximate', query.pop('approximate', ['false'])[-1])
+    elif operation == 'clean':
+        params["fused"] = _parse_flag('fused', query.pop('fused', ['false'])[-1])
+        params["output"] = _choice(query, 'output', CLEAN_OUTPUTS, 'csv')
+    else:
+        params["plot"] = query.pop('plot', ['auto_plot'])[-1]
+        served_plot(params["plot"])
+        params["format"] = _choice(query, 'format', PLOT_FORMATS, 'png')
+        # The remaining parameters are the plot's arguments; repeated ones become lists (cols=a&cols=b)
+        params["arguments"] = {name: values[-1] if len(values) == 1 else values for name, values in query.items()}
+        # The data comes from the request, and the rendered plot goes back in the response, never to a file
+        query = {name: values for name, values in query.items() if name in PLOT_DATA_ARGUMENTS + ('output',)}
+    if query:
+        raise ValueError(f"Unknown parameters for '{operation}': {', '.join(sorted(query))}.")
+    return params
+
+
+class ResultCache:
+    """Least-recently-used cache of response bodies, bounded by their total size in bytes."""
+
+    def __init__(self, max_bytes=CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key, entry):
+        size = len(entry[1])
+        if size > self.max_bytes or key in self.entries:
+            return
+        self.entries[key] = entry
+        self.size += size
+        while self.size > self.max_bytes:
+            _, (_, body) = self.entries.popitem(last=False)
+            self.size -= len(body)
+
+    def stats(self):
+        return {"entries": len(self.entries), "bytes": self.size, "hits": self.hits, "misses": self.misses}
+
+
+def _hash_file(path):
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(HASH_CHUNK_BYTES), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _hash_bytes(payload):
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+async def _read_body(reader, headers, writer, max_bytes):
+    """Read a request body sent with Content-Length or chunked transfer encoding."""
+    if headers.get('expect', '').lower() == '100-continue':
+        # curl waits for this before sending large uploads
+        writer.write(b'HTTP/1.1 100 Continue\r\n\r\n')
+        await writer.drain()
+    if headers.get('transfer-encoding', '').lower() == 'chunked':
+        parts, size = [], 0
+        while True:
+            length = int((await reader.readline()).split(b';')[0], 16)
+            if length == 0:
+                while (await reader.readline()).strip():
+                    pass
+                return b''.join(parts)
+            size += length
+            if size > max_bytes:
+                raise HTTPError(413, f"The upload exceeds {max_bytes} bytes.")
+            parts.append(await reader.readexactly(length))
+            await reader.readexactly(2)
+    length = int(headers.get('content-length', 0))
+    if length > max_bytes:
+        raise HTTPError(413, f"The upload exceeds {max_bytes} bytes.")
+    return await reader.readexactly(length) if length else b''
+
+
+async def _read_request(reader, writer, max_body_bytes):
+    """Read one HTTP/1.1 request; returns None when the client closed the connection."""
+    line = await reader.readline()
+    if not line.strip():
+        return None
+    try:
+        method, target, version = line.decode('latin-1').split()
+    except ValueError:
+        raise HTTPError(400, "Malformed request line.") from None
+    headers = {}
+    while True:
+        header = await reader.readline()
+        if not header.strip():
+            break
+        name, _, value = header.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    body = await _read_body(reader, headers, writer, max_body_bytes)
+    return method.upper(), target, version, headers, body
+
+
+def _response(status, content_type, body, keep_alive, extra_headers=()):
+    status = HTTPStatus(status)
+    lines = [f'HTTP/1.1 {status.value} {status.phrase}', f'Content-Type: {content_type}',
+             f'Content-Length: {len(body)}', f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+    lines += [f'{name}: {value}' for name, value in extra_headers]
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body
+
+
+class DataServer:
+    """
+    Asyncio HTTP service answering summary, cleaning and plotting requests.
+
+    The event loop only parses requests, hashes inputs and answers from the cache. The work runs in a bounded
+    pool of worker processes that are started and warmed (matplotlib, seaborn and datai imported) before the
+    first request, and stay alive between requests. Results are cached by the hash of the input's content
+    and the request parameters, and identical requests in flight share one job.
+
+    Endpoints (the dataset is the request body, or a file inside `root` given by `?path=`):
+    - POST /summary: The `Utils.summarize_data` dict as JSON (`approximate=true` for sketches).
+    - POST /clean: The `DataCleaning.get_cleaned_data` output (`fused=true`, `output=csv|parquet|json`).
+    - POST /plot: A rendered plot (`plot=histogram&col=tip`, `format=png|svg|pdf`); `auto_plot`, the default,
+      answers with a JSON list of base64-encoded figures.
+    - GET /health: The workers, queued jobs and cache statistics.
+
+    Every data endpoint accepts `columns=a,b` to load only some columns, and `type=csv|parquet|feather` for
+    uploads (otherwise taken from the Content-Type, defaulting to CSV).
+    """
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, workers=None, cache_bytes=CACHE_BYTES,
+                 max_pending=None, max_body_bytes=MAX_BODY_BYTES, root=None):
+        """
+        Initialize the server.
+
+        Parameters:
+        - host: The interface to listen on (local only by default).
+        - port: The port (0 picks a free one).
+        - workers: The number of worker processes (None or -1 for one per CPU core).
+        - cache_bytes: The size of the result cache in bytes (0 disables it).
+        - max_pending: The jobs allowed to run or wait at once (defaults to QUEUE_PER_WORKER per worker).
+        - max_body_bytes: The largest accepted upload.
+        - root: The directory `?path=` files must be inside; relative paths are resolved against it
+          (defaults to the current working directory).
+        """
+        self.host = host
+        self.port = port
+        self.workers = resolve_n_jobs(workers)
+        self.cache = ResultCache(cache_bytes)
+        self.max_pending = max_pending or QUEUE_PER_WORKER * self.workers
+        self.max_body_bytes = max_body_bytes
+        # Without a root, any file the process can read would be served to any local client
+        self.root = os.path.realpath(root if root is not None else os.getcwd())
+        self.pending = 0
+        self.pool = None
+        self._server = None
+        self._inflight = {}
+        self._file_digests = OrderedDict()
+
+    async def _start_pool(self):
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker)
+        loop = asyncio.get_running_loop()
+        # Processes are spawned on demand: submitting one task per worker at once starts (and warms) them all
+        await asyncio.gather(*[loop.run_in_executor(self.pool, _ping) for _ in range(self.workers)])
+
+    async def start(self):
+        """Start the worker processes, then listen for requests."""
+        await self._start_pool()
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        print(f"Serving on http://{self.host}:{self.port} with {self.workers} worker processes.")
+
+    async def serve_forever(self):
+        """Start the server and answer requests until cancelled."""
+        if self._server is None:
+            await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self):
+        """Stop listening and shut the worker processes down."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self.pool is not None:
+            # Running jobs finish, queued ones are dropped, then the workers exit
+            self.pool.shutdown(wait=True, cancel_futures=True)
+            self.pool = None
+
+    def health(self):
+        return {"status": "ok", "workers": self.workers, "pending": self.pending,
+                "max_pending": self.max_pending, "cache": self.cache.stats()}
+
+    def _file_digest(self, path, stat):
+        """Content hash of a file, recomputed only when its size or modification time changes."""
+        key = (path, stat.st_size, stat.st_mtime_ns)
+        digest = self._file_digests.get(key)
+        if digest is None:
+            digest = _hash_file(path)
+            self._file_digests[key] = digest
+            if len(self._file_digests) > MAX_FILE_DIGESTS:
+                self._file_digests.popitem(last=False)
+        return digest
+
+    async def _source(self, query, headers, body):
+        """The job's data source and the hash of its content."""
+        loop = asyncio.get_running_loop()
+        if 'path' in query:
+            path = os.path.realpath(os.path.join(self.root, query['path'][-1]))
+            if os.path.commonpath([self.root, path]) != self.root:
+                raise HTTPError(403, f"'{query['path'][-1]}' is outside the served directory.")
+            try:
+                stat = os.stat(path)
+            except OSError:
+                raise HTTPError(404, f"File '{query['path'][-1]}' was not found.") from None
+            digest = await loop.run_in_executor(None, self._file_digest, path, stat)
+            return ('path', path, None), digest
+        if not body:
+            raise HTTPError(400, "Send the dataset as the request body, or give a file with ?path=.")
+        content_type = headers.get('content-type', '').split(';')[0].strip().lower()
+        input_type = query.get('type', [UPLOAD_TYPES.get(content_type, 'csv')])[-1]
+        if input_type not in INPUT_TYPES:
+            raise HTTPError(400, f"Invalid type '{input_type}'. Use one of: {', '.join(INPUT_TYPES)}.")
+        # hashlib releases the GIL, so large uploads are hashed off the event loop
+        digest = await loop.run_in_executor(None, _hash_bytes, body) if len(body) > HASH_CHUNK_BYTES \
+            else _hash_bytes(body)
+        return ('upload', body, input_type), f'{input_type}:{digest}'
+
+    async def _run(self, key, operation, source, params):
+        self.pending += 1
+        pool = self.pool
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(pool, run_job, operation, source, params)
+        except BrokenProcessPool:
+            # A worker died (e.g. out of memory); replace the pool once, so later requests still work
+            if self.pool is pool:
+                pool.shutdown(wait=False)
+                await self._start_pool()
+            raise HTTPError(500, "A worker process died while handling the request.") from None
+        finally:
+            self.pending -= 1
+            self._inflight.pop(key, None)
+        self.cache.put(key, result)
+        return result
+
+    async def compute(self, operation, source, digest, params):
+        """
+        Answer a job from the cache, from an identical job in flight, or by running it in the pool.
+
+        Returns:
+        - tuple: The content type, the body, and whether it came from the cache.
+        """
+        key = hashlib.blake2b(json.dumps([operation, digest, params], sort_keys=True).encode(),
+                              digest_size=16).hexdigest()
+        cached = self.cache.get(key)
+        if cached is not None:
+            return (*cached, True)
+        job = self._inflight.get(key)
+        if job is None:
+            if self.pending >= self.max_pending:
+                raise HTTPError(503, "The server is busy; retry later.")
+            job = self._inflight[key] = asyncio.ensure_future(self._run(key, operation, source, params))
+            # Retrieve the outcome even if every client waiting for it disconnected
+            job.add_done_callback(lambda done: done.cancelled() or done.exception())
+        # Shielded: a client disconnecting does not cancel a job other clients may share
+        return (*await asyncio.shield(job), False)
+
+    async def dispatch(self, method, target, headers, body):
+        """Route one request; returns the status, content type, body and extra headers."""
+        url = urlsplit(target)
+        route = url.path.strip('/')
+        if route == 'health':
+            return 200, CONTENT_TYPES['json'], json.dumps(self.health()).encode(), ()
+        if route not in OPERATIONS:
+            raise HTTPError(404, f"Unknown endpoint '/{route}'. Use /summary, /clean, /plot or /health.")
+        if method not in ('GET', 'POST'):
+            raise HTTPError(405, f"Use GET or POST, not {method}.")
+        query = parse_qs(url.query)
+        try:
+            params = parse_params(route, query)
+        except ValueError as error:
+            raise HTTPError(400, str(error)) from None
+        source, digest = await self._source(query, headers, body)
+        try:
+            content_type, result, hit = await self.compute(route, source, digest, params)
+        except HTTPError:
+            raise
+        except (ValueError, KeyError, TypeError, ImportError) as error:
+            # Bad columns, plot arguments or file contents are the client's to fix
+            raise HTTPError(400, f"{type(error).__name__}: {error}") from None
+        return 200, content_type, result, (('X-Cache', 'hit' if hit else 'miss'),)
+
+    async def _handle_connection(self, reader, writer):
+        """Answer the requests of one connection, keeping it open between requests (HTTP/1.1 keep-alive)."""
+        try:
+            while True:
+                keep_alive = False
+                try:
+                    request = await _read_request(reader, writer, self.max_body_bytes)
+                    if request is None:
+                        break
+                    method, target, version, headers, body = request
+                    connection = headers.get('connection', '').lower()
+                    keep_alive = connection == 'keep-alive' or (version == 'HTTP/1.1' and connection != 'close')
+                    status, content_type, payload, extra = await self.dispatch(method, target, headers, body)
+                except HTTPError as error:
+                    status, content_type = error.status, CONTENT_TYPES['json']
+                    extra = (('Retry-After', '1'),) if error.status == 503 else ()
+                    payload = json.dumps({"error": str(error)}).encode()
+                except (ValueError, asyncio.LimitOverrunError):
+                    status, content_type, extra = 400, CONTENT_TYPES['json'], ()
+                    payload, keep_alive = json.dumps({"error": "Malformed request."}).encode(), False
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    break
+                except Exception as error:
+                    status, content_type, extra = 500, CONTENT_TYPES['json'], ()
+                    payload = json.dumps({"error": f"{type(error).__name__}: {error}"}).encode()
+                writer.write(_response(status, content_type, payload, keep_alive, extra))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.CancelledError):
+            # Cancelled when the server stops with the connection still open; ending quietly is all there is to do
+            pass
+        finally:
+            writer.close()
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, workers=None, cache_bytes=CACHE_BYTES, max_pending=None,
+          max_body_bytes=MAX_BODY_BYTES, root=None):
+    """
+    Run the profiling and plotting service until interrupted (see `DataServer` for the endpoints).
+
+    Example:
+        serve(port=8000, workers=4)
+        # curl --data-binary @tips.csv 'http://127.0.0.1:8000/summary'
+        # curl 'http://127.0.0.1:8000/plot?path=tips.parquet&plot=histogram&col=tip' -o tip.png
+
+    Parameters:
+    - host: The interface to listen on (local only by default).
+    - port: The port.
+    - workers: The number of worker processes (None or -1 for one per CPU core).
+    - cache_bytes: The size of the result cache in bytes.
+    - max_pending: The jobs allowed to run or wait at once before requests are refused with 503.
+    - max_body_bytes: The largest accepted upload.
+    - root: The directory `?path=` files must be inside (defaults to the current working directory).
+    """
+    server = DataServer(host=host, port=port, workers=workers, cache_bytes=cache_bytes, max_pending=max_pending,
+                        max_body_bytes=max_body_bytes, root=root)
+
+    async def run():
+        # SIGTERM stops the server like Ctrl+C, so the worker processes are shut down instead of orphaned
+        with contextlib.suppress(NotImplementedError):
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
+    print("\nServer stopped.")
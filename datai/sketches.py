@@ -0,0 +1,387 @@
+# datai/sketches.py
+
+import io
+import json
+
+import numpy as np
+import pandas as pd
+
+from datai.memory import dtype_columns
+
+# Values are fed to the quantile sketch in batches of this size, so memory stays bounded on huge columns
+UPDATE_BATCH_SIZE = 65536
+
+
+def k_for_error(epsilon):
+    """Return the sketch size `k` whose normalized rank error is roughly `epsilon` (e.g. 0.01 for 1%)."""
+    if not 0 < epsilon < 1:
+        raise ValueError("The sketch error must be between 0 and 1.")
+    return max(8, int(np.ceil(2.3 / epsilon)))
+
+
+class QuantileSketch:
+    """
+    Mergeable approximate quantile sketch (KLL) with memory bounded by `k`.
+
+    Values are kept exactly until the sketch fills up, so small columns get exact quantiles.
+    """
+
+    def __init__(self, k=200, seed=None, epsilon=None):
+        self.k = k_for_error(epsilon) if epsilon is not None else k
+        self.count = 0
+        self.compactors = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level):
+        depth = len(self.compactors) - level - 1
+        return max(int(np.ceil(self.k * (2 / 3) ** depth)), 2)
+
+    def _compress(self):
+        # Compact full levels, lowest first, only until the sketch is back under its total budget
+        while sum(len(c) for c in self.compactors) > sum(self._capacity(h) for h in range(len(self.compactors))):
+            for level in range(len(self.compactors)):
+                items = self.compactors[level]
+                if len(items) < self._capacity(level):
+                    continue
+                if level + 1 == len(self.compactors):
+                    self.compactors.append(np.empty(0))
+                items = np.sort(items)
+                # An odd item out stays at this level; every other item moves up with double weight
+                even = len(items) - len(items) % 2
+                self.compactors[level] = items[even:]
+                self.compactors[level + 1] = np.concatenate(
+                    [self.compactors[level + 1], items[self._rng.integers(2):even:2]]
+                )
+                break
+
+    def update(self, values):
+        """Add an array of values to the sketch, ignoring NaNs."""
+        values = np.asarray(values, dtype='float64').ravel()
+        for start in range(0, values.size, UPDATE_BATCH_SIZE):
+            batch = values[start:start + UPDATE_BATCH_SIZE]
+            batch = batch[~np.isnan(batch)]
+            if batch.size:
+                self.count += batch.size
+                self.compactors[0] = np.concatenate([self.compactors[0], batch])
+                self._compress()
+        return self
+
+    def update_repeated(self, value, count):
+        """Add `count` copies of one value in O(log count) memory by placing them at the levels of its binary weights."""
+        count = int(count)
+        if count <= 0 or np.isnan(value):
+            return self
+        self.count += count
+        level = 0
+        while count:
+            if count & 1:
+                while len(self.compactors) <= level:
+                    self.compactors.append(np.empty(0))
+                self.compactors[level] = np.append(self.compactors[level], value)
+            count >>= 1
+            level += 1
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """Merge another sketch into this one."""
+        while len(self.compactors) < len(other.compactors):
+            self.compactors.append(np.empty(0))
+        for level, items in enumerate(other.compactors):
+            self.compactors[level] = np.concatenate([self.compactors[level], items])
+        self.count += other.count
+        self._compress()
+        return self
+
+    def quantile(self, q):
+        """
+        Estimate one or more quantiles.
+
+        Parameters:
+        - q: A quantile or array of quantiles between 0 and 1.
+
+        Returns:
+        - float or np.ndarray: The estimated quantiles (NaN if the sketch is empty).
+        """
+        q = np.asarray(q, dtype='float64')
+        if not self.count:
+            return np.full(q.shape, np.nan) if q.ndim else np.nan
+        if len(self.compactors) == 1:
+            # Nothing has been compacted yet, so the answer is exact
+            return np.quantile(self.compactors[0], q)
+
+        items = np.concatenate(self.compactors)
+        weights = np.concatenate([np.full(len(c), 2.0 ** level) for level, c in enumerate(self.compactors)])
+        order = np.argsort(items, kind='stable')
+        items, cumulative = items[order], np.cumsum(weights[order])
+        ranks = q * (cumulative[-1] - 1) + 1
+        result = items[np.minimum(np.searchsorted(cumulative, ranks), len(items) - 1)]
+        return result if q.ndim else float(result)
+
+    def to_dict(self):
+        """Return a JSON-serializable representation of the sketch."""
+        return {"k": self.k, "count": self.count, "compactors": [c.tolist() for c in self.compactors]}
+
+    @classmethod
+    def from_dict(cls, state):
+        """Rebuild a sketch from `to_dict` output."""
+        sketch = cls(k=state["k"])
+        sketch.count = state["count"]
+        sketch.compactors = [np.asarray(c, dtype='float64') for c in state["compactors"]]
+        return sketch
+
+    def to_bytes(self):
+        """Serialize the sketch to a compact binary (NPZ) payload."""
+        buffer = io.BytesIO()
+        levels = {f"level_{i}": c for i, c in enumerate(self.compactors)}
+        np.savez_compressed(buffer, header=np.array([self.k, self.count], dtype='int64'), **levels)
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, payload):
+        """Rebuild a sketch from `to_bytes` output."""
+        with np.load(io.BytesIO(payload)) as arrays:
+            k, count = arrays["header"].tolist()
+            sketch = cls(k=k)
+            sketch.count = count
+            sketch.compactors = [arrays[f"level_{i}"] for i in range(len(arrays.files) - 1)]
+        return sketch
+
+
+class FrequencySketch:
+    """Mergeable category counter that keeps at most `max_items` of the most frequent values."""
+
+    def __init__(self, max_items=1000):
+        self.max_items = max_items
+        self.counts = pd.Series(dtype='int64')
+
+    def _trim(self):
+        if len(self.counts) > self.max_items:
+            self.counts = self.counts.nlargest(self.max_items)
+
+    def update(self, values):
+        """Count the non-null values of a Series or array."""
+        counts = pd.Series(values).value_counts(dropna=True)
+        self.counts = self.counts.add(counts, fill_value=0).astype('int64')
+        self._trim()
+        return self
+
+    def merge(self, other):
+        """Merge another frequency sketch into this one."""
+        self.counts = self.counts.add(other.counts, fill_value=0).astype('int64')
+        self._trim()
+        return self
+
+    def mode(self):
+        """Return the most frequent value, or None if nothing was counted."""
+        if self.counts.empty:
+            return None
+        return self.counts.idxmax()
+
+    def to_dict(self):
+        """Return a JSON-serializable representation of the sketch."""
+        return {"max_items": self.max_items, "items": [[_to_python(v), int(c)] for v, c in self.counts.items()]}
+
+    @classmethod
+    def from_dict(cls, state):
+        """Rebuild a sketch from `to_dict` output."""
+        sketch = cls(max_items=state["max_items"])
+        if state["items"]:
+            values, counts = zip(*state["items"])
+            sketch.counts = pd.Series(counts, index=pd.Index(values, dtype='object'), dtype='int64')
+        return sketch
+
+
+class ColumnSketch:
+    """Mergeable summary of one column: count, nulls, mean/variance, min/max, quantiles and frequencies."""
+
+    def __init__(self, numeric=True, k=200, max_items=1000, epsilon=None):
+        if epsilon is not None:
+            k = k_for_error(epsilon)
+        self.numeric = numeric
+        self.count = 0
+        self.nulls = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.nan
+        self.max = np.nan
+        self.quantiles = QuantileSketch(k=k) if numeric else None
+        self.frequencies = None if numeric else FrequencySketch(max_items=max_items)
+
+    def _merge_moments(self, count, mean, m2, col_min, col_max):
+        # Chan et al. parallel update of the running mean and sum of squared deviations
+        if not count:
+            return
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta ** 2 * self.count * count / total
+        self.count = total
+        self.min = np.fmin(self.min, col_min)
+        self.max = np.fmax(self.max, col_max)
+
+    def update(self, series):
+        """Add a chunk of the column to the sketch."""
+        series = pd.Series(series)
+        nulls = int(series.isna().sum())
+        self.nulls += nulls
+        if not self.numeric:
+            self.count += len(series) - nulls
+            self.frequencies.update(series)
+            return self
+
+        values = series.to_numpy(dtype='float64', na_value=np.nan)
+        values = values[~np.isnan(values)]
+        if values.size:
+            mean = values.mean()
+            self._merge_moments(values.size, mean, ((values - mean) ** 2).sum(), values.min(), values.max())
+            self.quantiles.update(values)
+        return self
+
+    def merge(self, other):
+        """Merge another column sketch into this one."""
+        self.nulls += other.nulls
+        if not self.numeric:
+            self.count += other.count
+            self.frequencies.merge(other.frequencies)
+            return self
+        self._merge_moments(other.count, other.mean, other.m2, other.min, other.max)
+        self.quantiles.merge(other.quantiles)
+        return self
+
+    @property
+    def variance(self):
+        """Sample variance (ddof=1), matching pandas."""
+        return self.m2 / (self.count - 1) if self.count > 1 else np.nan
+
+    @property
+    def std(self):
+        """Sample standard deviation (ddof=1), matching pandas."""
+        return np.sqrt(self.variance)
+
+    def describe(self):
+        """Return the approximate equivalent of `Series.describe()` as a dict."""
+        if not self.numeric:
+            return {
+                "count": self.count,
+                "unique": len(self.frequencies.counts),
+                "top": self.frequencies.mode(),
+                "freq": int(self.frequencies.counts.max()) if self.count else np.nan,
+            }
+        q1, median, q3 = self.quantiles.quantile([0.25, 0.5, 0.75]) if self.count else [np.nan] * 3
+        return {
+            "count": float(self.count),
+            "mean": self.mean if self.count else np.nan,
+            "std": self.std,
+            "min": float(self.min),
+            "25%": float(q1),
+            "50%": float(median),
+            "75%": float(q3),
+            "max": float(self.max),
+        }
+
+    def to_dict(self):
+        """Return a JSON-serializable representation of the sketch."""
+        state = {key: _to_python(getattr(self, key)) for key in ("numeric", "count", "nulls", "mean", "m2", "min", "max")}
+        state["quantiles"] = self.quantiles.to_dict() if self.numeric else None
+        state["frequencies"] = None if self.numeric else self.frequencies.to_dict()
+        return state
+
+    @classmethod
+    def from_dict(cls, state):
+        """Rebuild a sketch from `to_dict` output."""
+        sketch = cls(numeric=state["numeric"])
+        for key in ("count", "nulls", "mean", "m2"):
+            setattr(sketch, key, state[key])
+        sketch.min = np.nan if state["min"] is None else state["min"]
+        sketch.max = np.nan if state["max"] is None else state["max"]
+        if sketch.numeric:
+            sketch.quantiles = QuantileSketch.from_dict(state["quantiles"])
+        else:
+            sketch.frequencies = FrequencySketch.from_dict(state["frequencies"])
+        return sketch
+
+    def to_json(self):
+        """Serialize the sketch to a JSON string."""
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, payload):
+        """Rebuild a sketch from `to_json` output."""
+        return cls.from_dict(json.loads(payload))
+
+
+def _to_python(value):
+    """Convert NumPy scalars (and NaN) to plain Python values for JSON."""
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    return value
+
+
+def sketch_frame(data, epsilon=0.01, numeric_dtypes=None):
+    """
+    Summarize every column of a DataFrame with a mergeable sketch.
+
+    Parameters:
+    - data: The dataset to summarize.
+    - epsilon: The target normalized rank error of the quantile sketches.
+    - numeric_dtypes: The dtypes to sketch as numeric (defaults to all numbers except booleans).
+
+    Returns:
+    - dict: One `ColumnSketch` per column.
+    """
+    numeric_cols = dtype_columns(data, include=numeric_dtypes or [np.number], exclude=['bool'])
+    return {
+        column: ColumnSketch(numeric=column in numeric_cols, epsilon=epsilon).update(data[column])
+        for column in data.columns
+    }
+
+
+def sorted_quantiles(block, q):
+    """
+    Column-wise exact quantiles of a 1D or 2D array, equal to `np.nanquantile(block, q, axis=0)`.
+
+    Each column is sorted once (NaNs sort last) and the quantiles are read at their ranks, which is faster
+    than `np.nanquantile` on large columns.
+
+    Parameters:
+    - block: The values, one column per variable.
+    - q: A quantile or list of quantiles.
+    """
+    block = np.asarray(block, dtype='float64')
+    q = np.asarray(q, dtype='float64')
+    columns = block[:, None] if block.ndim == 1 else block
+    result = np.full(q.shape + (columns.shape[1],), np.nan)
+    for j in range(columns.shape[1]):
+        values = np.sort(columns[:, j])
+        count = int(np.searchsorted(values, np.nan))
+        if not count:
+            continue
+        position = q * (count - 1)
+        lower = np.floor(position).astype(np.intp)
+        low, high = values[lower], values[np.minimum(lower + 1, count - 1)]
+        fraction = position - lower
+        # The same linear interpolation as NumPy, so the results match it exactly
+        result[..., j] = np.where(fraction >= 0.5, high - (high - low) * (1 - fraction), low + (high - low) * fraction)
+    if block.ndim == 1:
+        result = result[..., 0]
+        return result if q.ndim else float(result)
+    return result
+
+
+def approximate_quantiles(block, q, epsilon=0.01):
+    """
+    Column-wise quantiles of a 1D or 2D array, with the same output shape as `np.nanquantile(..., axis=0)`.
+
+    The block is already in memory, so a sketch would sort every value as well and only lose accuracy: the
+    quantiles are read from one sort per column instead (exact, and faster than `np.nanquantile`). The
+    sketches are used where the data arrives in chunks (`ChunkedCleaning`, `IncrementalSummary`).
+
+    Parameters:
+    - block: The values, one column per variable.
+    - q: A quantile or list of quantiles.
+    - epsilon: The target normalized rank error (an upper bound; in-memory blocks get exact quantiles).
+    """
+    return sorted_quantiles(block, q)
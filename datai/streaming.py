@@ -0,0 +1,308 @@
+# datai/streaming.py
+
+import copy
+
+import numpy as np
+import pandas as pd
+
+from datai.data_cleaning import NUMERIC_DTYPES, CleaningTransformer, _transform
+from datai.dedup import make_deduplicator
+from datai.instrumentation import instrumented
+from datai.memory import dtype_columns
+from datai.sketches import ColumnSketch
+from datai.utils import Utils
+
+
+def _iter_chunks(chunks):
+    """Return a fresh iterator over the chunks, failing on one-shot iterators that cannot be read twice."""
+    if callable(chunks):
+        return iter(chunks())
+    if iter(chunks) is chunks:
+        raise ValueError(
+            "Chunked cleaning reads the data twice. Pass a callable returning a new iterator "
+            "(e.g. lambda: pd.read_csv(path, chunksize=100_000)) or a list of DataFrames."
+        )
+    return iter(chunks)
+
+
+def _chunk_writer(writer):
+    """Turn a writer argument into a (write, close) pair of callables."""
+    if callable(writer):
+        return writer, lambda: None
+
+    path = str(writer)
+    if path.endswith('.parquet'):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        state = {}
+
+        def write(chunk):
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if "writer" not in state:
+                state["writer"] = pq.ParquetWriter(path, table.schema)
+            state["writer"].write_table(table)
+
+        def close():
+            if "writer" in state:
+                state["writer"].close()
+
+        return write, close
+
+    state = {"header": True}
+
+    def write(chunk):
+        chunk.to_csv(path, mode='w' if state["header"] else 'a', header=state["header"], index=False)
+        state["header"] = False
+
+    return write, lambda: None
+
+
+class ChunkedCleaning:
+    """
+    Clean datasets larger than memory by streaming them in chunks.
+
+    The first pass collects global statistics with mergeable sketches; the second pass cleans each chunk
+    with those statistics, so peak memory is bounded by the chunk size rather than the dataset size
+    (plus 8 bytes per distinct row when duplicates are removed).
+    """
+
+    def __init__(self, chunks, threshold=1.5, remove_outliers=True, normalize='min-max', epsilon=0.01,
+                 deduplicate=False, verbose=True):
+        """
+        Initialize with a source of chunks.
+
+        Parameters:
+        - chunks: A callable returning an iterator of DataFrames (e.g. `lambda: pd.read_csv(path, chunksize=n)`),
+          or a re-iterable collection of DataFrames.
+        - threshold: The IQR multiplier for outlier bounds.
+        - remove_outliers: Whether to drop rows outside the IQR bounds.
+        - normalize: The normalization method ('min-max', 'z-score' or None).
+        - epsilon: The target normalized rank error of the quantile sketches; smaller is more accurate and uses more memory.
+        - deduplicate: If True, drop rows already seen in earlier chunks (by their 64-bit hash) before computing the
+          statistics and cleaning; pass a list of key columns, or a dict of `StreamingDeduplicator` options
+          (e.g. {"method": "bloom", "capacity": 10**8}), to configure it.
+        - verbose: If True, print a progress message after each pass, like the `DataCleaning` steps.
+        """
+        if normalize not in ('min-max', 'z-score', None):
+            raise ValueError("Invalid normalization method. Use 'min-max', 'z-score' or None.")
+        self.chunks = chunks
+        self.threshold = threshold
+        self.remove_outliers = remove_outliers
+        self.normalize = normalize
+        self.epsilon = epsilon
+        self.deduplicate = deduplicate
+        self.verbose = verbose
+        self.duplicates = None
+        self.sketches = None
+        self.statistics = None
+
+    def fit(self):
+        """First pass: collect global statistics for every column."""
+        sketches = {}
+        numeric_cols = None
+        for chunk in self._unique_chunks():
+            if numeric_cols is None:
+                numeric_cols = dtype_columns(chunk, include=NUMERIC_DTYPES)
+            for column in chunk.columns:
+                if column not in sketches:
+                    sketches[column] = ColumnSketch(numeric=column in numeric_cols, epsilon=self.epsilon)
+                sketches[column].update(chunk[column])
+
+        if numeric_cols is None:
+            raise ValueError("The chunk source did not yield any data.")
+        self.sketches = sketches
+        self.statistics = self._finalize(numeric_cols)
+        self._report("\nGlobal statistics have been collected.")
+        return self
+
+    def _report(self, message):
+        """Print a progress message unless the cleaner is quiet."""
+        if self.verbose:
+            print(message)
+
+    def _finalize(self, numeric_cols):
+        """Turn the sketches into the fill values, bounds and scaling used by the fused cleaning step."""
+        numeric = [self.sketches[column] for column in numeric_cols]
+        medians = np.array([sketch.quantiles.quantile(0.5) for sketch in numeric])
+
+        q1 = np.full(len(numeric), -np.inf)
+        q3 = np.full(len(numeric), np.inf)
+        if self.remove_outliers:
+            for i, sketch in enumerate(numeric):
+                # Missing values are filled with the median before filtering, so count them at the median
+                quantiles = copy.deepcopy(sketch.quantiles).update_repeated(medians[i], sketch.nulls)
+                q1[i], q3[i] = quantiles.quantile([0.25, 0.75])
+
+        lower_bound = q1 - self.threshold * (q3 - q1)
+        upper_bound = q3 + self.threshold * (q3 - q1)
+        col_min = np.array([sketch.min for sketch in numeric])
+        col_max = np.array([sketch.max for sketch in numeric])
+        if self.normalize == 'min-max':
+            # The kept rows lie within the bounds, so clip the global range to them
+            shift = np.clip(col_min, lower_bound, upper_bound)
+            scale = np.clip(col_max, lower_bound, upper_bound) - shift
+        elif self.normalize == 'z-score':
+            shift = np.array([sketch.mean for sketch in numeric])
+            scale = np.array([sketch.std for sketch in numeric])
+        else:
+            shift, scale = np.zeros(len(numeric)), np.ones(len(numeric))
+
+        fill_values = {}
+        for column, sketch in self.sketches.items():
+            if not sketch.numeric and sketch.frequencies.mode() is not None:
+                fill_values[column] = sketch.frequencies.mode()
+
+        return {
+            "numeric_cols": list(numeric_cols),
+            "median": medians,
+            "q1": q1,
+            "q3": q3,
+            "shift": shift,
+            "scale": scale,
+            "fill_values": fill_values,
+        }
+
+    def transform(self, chunk):
+        """Clean a single chunk with the global statistics."""
+        if self.statistics is None:
+            raise ValueError("Call fit() before cleaning chunks.")
+        return _transform(chunk, self.statistics, threshold=self.threshold)
+
+    def to_transformer(self):
+        """Return a `CleaningTransformer` holding the global statistics, e.g. to save them for later batches."""
+        if self.statistics is None:
+            raise ValueError("Call fit() before exporting the statistics.")
+        transformer = CleaningTransformer(threshold=self.threshold, remove_outliers=self.remove_outliers,
+                                          normalize=self.normalize is not None)
+        transformer.statistics = dict(self.statistics)
+        return transformer
+
+    def _unique_chunks(self):
+        """Iterate over the chunks, without the rows seen before when deduplicating."""
+        deduplicator = make_deduplicator(self.deduplicate)
+        for chunk in _iter_chunks(self.chunks):
+            yield chunk if deduplicator is None else deduplicator.transform(chunk)
+        if deduplicator is not None:
+            self.duplicates = deduplicator.rows_dropped
+
+    def iter_cleaned(self):
+        """Second pass: yield cleaned chunks one at a time."""
+        if self.statistics is None:
+            self.fit()
+        for chunk in self._unique_chunks():
+            yield self.transform(chunk)
+
+    def write(self, writer):
+        """
+        Stream the cleaned chunks to a writer.
+
+        Parameters:
+        - writer: A callable taking each cleaned chunk, or a path ending in '.csv' or '.parquet'.
+
+        Returns:
+        - int: The number of rows written.
+        """
+        write, close = _chunk_writer(writer)
+        rows = 0
+        try:
+            for chunk in self.iter_cleaned():
+                write(chunk)
+                rows += len(chunk)
+        finally:
+            close()
+        if self.duplicates:
+            self._report(f"\n{self.duplicates} duplicate rows have been dropped.")
+        self._report(f"\n{rows} cleaned rows have been written.")
+        return rows
+
+
+def _common_dtype(old, new):
+    """Return the dtype of the appended column: the common NumPy dtype, else object."""
+    if old == new:
+        return old
+    try:
+        return np.promote_types(old, new)
+    except TypeError:
+        return np.dtype('object')
+
+
+class IncrementalSummary:
+    """
+    `Utils.summarize_data` for data that grows by appended batches.
+
+    Every column keeps a running count, null count, mean and M2 (Welford/Chan), min and max, plus a mergeable
+    quantile sketch (numeric columns) or frequency sketch (other columns). `update` therefore costs time
+    proportional to the batch, not to the data seen so far. The counts, means, deviations and extremes are
+    exact; the quartiles are exact until a column outgrows its quantile sketch and approximate (within
+    `epsilon` in rank) after that, and the unique/top counts are exact up to `max_items` distinct values.
+    """
+
+    def __init__(self, epsilon=0.01, max_items=1000):
+        """
+        Initialize an empty summary.
+
+        Parameters:
+        - epsilon: The target normalized rank error of the quantile sketches.
+        - max_items: The number of most frequent values counted per non-numeric column.
+        """
+        self.epsilon = epsilon
+        self.max_items = max_items
+        self.rows = 0
+        self.sketches = {}
+        self.dtypes = {}
+
+    def _add_column(self, column, numeric):
+        sketch = ColumnSketch(numeric=numeric, max_items=self.max_items, epsilon=self.epsilon)
+        # The column was missing from the earlier batches, so those rows count as nulls
+        sketch.nulls = self.rows
+        self.sketches[column] = sketch
+        return sketch
+
+    @instrumented
+    def update(self, batch):
+        """
+        Add a batch of appended rows.
+
+        Parameters:
+        - batch: A DataFrame with the new rows. Columns absent from the batch count as missing values.
+
+        Returns:
+        - IncrementalSummary: self, so calls can be chained (e.g. `summary.update(batch).summary()`).
+        """
+        if not isinstance(batch, pd.DataFrame):
+            raise ValueError("The batch must be a pandas DataFrame.")
+        numeric_cols = dtype_columns(batch, include=[np.number], exclude=['bool'])
+        for column in batch.columns:
+            sketch = self.sketches.get(column) or self._add_column(column, column in numeric_cols)
+            sketch.update(batch[column])
+            dtype = batch[column].dtype
+            self.dtypes[column] = _common_dtype(self.dtypes[column], dtype) if column in self.dtypes else dtype
+        for column in self.sketches.keys() - set(batch.columns):
+            self.sketches[column].nulls += len(batch)
+        self.rows += len(batch)
+        return self
+
+    def merge(self, other):
+        """Merge the summary of other rows (e.g. another partition) into this one."""
+        for column in other.sketches.keys() - self.sketches.keys():
+            self._add_column(column, other.sketches[column].numeric)
+        for column, sketch in self.sketches.items():
+            if column in other.sketches:
+                sketch.merge(other.sketches[column])
+            else:
+                sketch.nulls += other.rows
+        for column, dtype in other.dtypes.items():
+            self.dtypes[column] = _common_dtype(self.dtypes[column], dtype) if column in self.dtypes else dtype
+        self.rows += other.rows
+        return self
+
+    def summary(self):
+        """
+        Return the summary of every row added so far.
+
+        Returns:
+        - dict: A summary with the same keys as `Utils.summarize_data`.
+        """
+        summary = Utils.summarize_sketches(self.sketches, dtypes=dict(self.dtypes))
+        summary["Shape"] = (self.rows, len(self.sketches))
+        return summary
@@ -3,6 +3,14 @@
 import pandas as pd
 import numpy as np
 
+from datai.backends import backend_name, get_backend
+from datai.grouped import GroupIndex, key_columns, scale_groups
+from datai.instrumentation import instrumented
+from datai.loaders import read_path
+from datai.memory import dtype_columns, fill_inplace, scale_inplace
+from datai.profile import invalidate_profile, profile_data
+from datai.sketches import sketch_frame
+
 class Utils:
     """Utility functions for data preprocessing and validation."""
 
@@ -12,19 +20,47 @@ class Utils:
         Validate the input dataset to ensure it's a proper DataFrame.
 
         Parameters:
-        - data: The dataset to validate.
+        - data: The dataset to validate (a pandas DataFrame, a Polars DataFrame/LazyFrame or a pyarrow Table).
 
         Returns:
         - bool: True if valid, raises an error if not.
         """
-        if not isinstance(data, pd.DataFrame):
-            raise ValueError("The provided data is not a pandas DataFrame.")
-        if data.empty:
+        try:
+            backend = backend_name(data)
+        except ValueError:
+            raise ValueError("The provided data is not a pandas DataFrame, Polars DataFrame or pyarrow Table.")
+        if backend == 'pandas':
+            empty = data.empty
+        elif type(data).__name__ == 'LazyFrame':
+            # Counting the rows of a lazy query would run it, so only check that it has columns
+            empty = not len(data.collect_schema())
+        else:
+            empty = data.shape[0] == 0 or data.shape[1] == 0
+        if empty:
             raise ValueError("The provided DataFrame is empty.")
         return True
 
     @staticmethod
-    def handle_missing_values(data, method='drop', fill_value=None):
+    @instrumented
+    def load_data(path, columns=None, filters=None, n_jobs=1, backend='pandas'):
+        """
+        Load a CSV, Parquet or Feather file, reading only the needed columns and rows.
+
+        Parameters:
+        - path: The file (see `datai.loaders.read_path` for the supported formats).
+        - columns: The columns to load (defaults to all).
+        - filters: Row predicates, e.g. [('year', '>=', 2020)], pushed down to Parquet row groups.
+        - n_jobs: The number of threads parsing a large CSV in byte ranges.
+        - backend: 'pandas', 'arrow' or 'polars'.
+
+        Returns:
+        - The dataset.
+        """
+        return read_path(path, columns=columns, filters=filters, n_jobs=n_jobs, backend=backend)
+
+    @staticmethod
+    @instrumented
+    def handle_missing_values(data, method='drop', fill_value=None, copy=True):
         """
         Handle missing values in the dataset.
 
@@ -32,60 +68,160 @@ class Utils:
         - data: The dataset with potential missing values.
         - method: The method to handle missing values ('drop', 'fill').
         - fill_value: The value to fill missing values with if method is 'fill' (optional).
+        - copy: If True, return a new dataset and leave the input untouched. If False, modify the input in place.
 
         Returns:
-        - pd.DataFrame: The dataset with missing values handled.
+        - pd.DataFrame: The dataset with missing values handled (Polars and Arrow inputs stay in their format).
         """
+        backend = get_backend(data)
+        if backend is not None:
+            if method not in ('drop', 'fill'):
+                raise ValueError("Invalid method for handling missing values. Use 'drop' or 'fill'.")
+            if method == 'fill' and fill_value is None:
+                raise ValueError("Fill value must be provided when method is 'fill'.")
+            return backend.drop_missing(data) if method == 'drop' else backend.fill_value(data, fill_value)
+
         if method == 'drop':
-            data = data.dropna()
+            if copy:
+                data = data.dropna()
+            else:
+                data.dropna(inplace=True)
+                invalidate_profile(data)
         elif method == 'fill':
             if fill_value is None:
                 raise ValueError("Fill value must be provided when method is 'fill'.")
-            data = data.fillna(fill_value)
+            if copy:
+                data = data.fillna(fill_value)
+            else:
+                # A dict or Series gives one fill value per column, like `fillna`
+                per_column = isinstance(fill_value, (dict, pd.Series))
+                for column in data.columns:
+                    if not per_column:
+                        fill_inplace(data, column, fill_value)
+                    elif column in fill_value:
+                        fill_inplace(data, column, fill_value[column])
+                invalidate_profile(data)
         else:
             raise ValueError("Invalid method for handling missing values. Use 'drop' or 'fill'.")
         
         return data
 
     @staticmethod
-    def summarize_data(data):
+    @instrumented
+    def summarize_data(data, approximate=False, epsilon=0.01, n_jobs=1):
         """
         Generate a summary of the dataset.
 
         Parameters:
         - data: The dataset to summarize.
+        - approximate: If True, compute the statistics from bounded-memory column sketches in one pass.
+        - epsilon: The target normalized rank error of the quantile sketches when `approximate` is True.
+        - n_jobs: The number of workers computing the column statistics (None or -1 for one per CPU core).
 
         Returns:
         - dict: A summary including basic stats and info.
         """
+        backend = get_backend(data)
+        if backend is not None:
+            # Polars and Arrow compute the exact statistics natively in one multi-threaded pass
+            return backend.summarize(data)
+
+        if approximate:
+            sketches = Utils.sketch_data(data, epsilon=epsilon)
+            return Utils.summarize_sketches(sketches, dtypes=data.dtypes.to_dict())
+
+        # The statistics come from the dataset's cached profile, shared with show_details and auto_plot
+        return profile_data(data, n_jobs=n_jobs).summary()
+
+    @staticmethod
+    @instrumented
+    def sketch_data(data, epsilon=0.01):
+        """
+        Summarize each column with a mergeable, serializable sketch.
+
+        Sketches of separate partitions can be combined with `ColumnSketch.merge` and passed to `summarize_sketches`.
+
+        Parameters:
+        - data: The dataset (or partition) to sketch.
+        - epsilon: The target normalized rank error of the quantile sketches.
+
+        Returns:
+        - dict: One `ColumnSketch` per column.
+        """
+        return sketch_frame(data, epsilon=epsilon)
+
+    @staticmethod
+    def summarize_sketches(sketches, dtypes=None):
+        """
+        Build a `summarize_data`-style summary from column sketches.
+
+        Parameters:
+        - sketches: A dict of `ColumnSketch` objects, e.g. from `sketch_data`.
+        - dtypes: The column dtypes to report (optional).
+
+        Returns:
+        - dict: A summary including basic stats and info.
+        """
+        rows = max((sketch.count + sketch.nulls for sketch in sketches.values()), default=0)
+        numeric = {column: sketch for column, sketch in sketches.items() if sketch.numeric}
+        # Like DataFrame.describe(), only describe the non-numeric columns when there are no numeric ones
+        described = numeric or sketches
         summary = {
-            "Shape": data.shape,
-            "Columns": data.columns.tolist(),
-            "Data Types": data.dtypes.to_dict(),
-            "Missing Values": data.isnull().sum().to_dict(),
-            "Summary Statistics": data.describe().to_dict()
+            "Shape": (rows, len(sketches)),
+            "Columns": list(sketches),
+            "Data Types": dtypes or {},
+            "Missing Values": {column: sketch.nulls for column, sketch in sketches.items()},
+            "Summary Statistics": {column: sketch.describe() for column, sketch in described.items()}
         }
         return summary
 
     @staticmethod
-    def normalize_data(data, method='min-max'):
+    @instrumented
+    def normalize_data(data, method='min-max', copy=False, by=None, n_jobs=1):
         """
         Normalize numeric columns in the dataset.
 
+        Use `datai.memory.MemoryTracker` around the call to measure the peak extra allocation.
+
         Parameters:
         - data: The dataset to normalize.
         - method: The normalization method ('min-max', 'z-score').
+        - copy: If False (the default), normalize the input in place on its NumPy buffers, as earlier versions
+          did. If True, normalize one copy of the dataset made up front and leave the input untouched.
+        - by: A key column or list of key columns. Each group is then scaled with its own statistics, computed
+          for all groups in one grouped pass; the key columns are left as they are.
+        - n_jobs: The number of threads computing the group statistics (only used with `by`).
 
         Returns:
-        - pd.DataFrame: The normalized dataset.
+        - pd.DataFrame: The normalized dataset (Polars and Arrow inputs stay in their format).
         """
-        numeric_cols = data.select_dtypes(include=[np.number]).columns
-        
-        if method == 'min-max':
-            data[numeric_cols] = (data[numeric_cols] - data[numeric_cols].min()) / (data[numeric_cols].max() - data[numeric_cols].min())
-        elif method == 'z-score':
-            data[numeric_cols] = (data[numeric_cols] - data[numeric_cols].mean()) / data[numeric_cols].std()
-        else:
+        if method not in ('min-max', 'z-score'):
             raise ValueError("Invalid normalization method. Use 'min-max' or 'z-score'.")
-        
+        backend = get_backend(data)
+        if backend is not None and by is not None:
+            raise ValueError("Grouped normalization needs a pandas DataFrame; convert the data with "
+                             "datai.backends.to_pandas.")
+        if backend is not None:
+            # Polars and Arrow data is immutable, so `copy` does not apply
+            return backend.normalize(data, method=method)
+        if copy:
+            data = data.copy()
+
+        numeric_cols = dtype_columns(data, include=[np.number])
+        if by is not None:
+            # Per-group statistics broadcast back to the rows, still one column at a time
+            index = GroupIndex(data, by, n_jobs=n_jobs)
+            scale_groups(data, index, numeric_cols.difference(key_columns(by), sort=False), method=method)
+        else:
+            for column in numeric_cols:
+                # Scale column by column, so the only temporary is at most one column wide
+                series = data[column]
+                if method == 'min-max':
+                    shift, scale = series.min(), series.max() - series.min()
+                else:
+                    shift, scale = series.mean(), series.std()
+                scale_inplace(data, column, shift, scale)
+        if not copy:
+            invalidate_profile(data)
+
         return data
@@ -1,19 +1,30 @@
 # datai/visualization.py
 
 import numpy as np
-import seaborn as sns
-import matplotlib.pyplot as plt
-from pandas.plotting import parallel_coordinates
+
+from datai.datasets import load_dataset
+from datai.lazy import LazyModule
+from datai.rendering import show_or_save
+
+# Imported on first use, so importing datai does not load the plotting stack
+sns = LazyModule('seaborn')
+plt = LazyModule('matplotlib.pyplot')
+pandas_plotting = LazyModule('pandas.plotting')
 
 class Examples:
-    """Class for generating example plots using built-in datasets from pandas and seaborn."""
+    """
+    Class for generating example plots using built-in datasets from pandas and seaborn.
+
+    Every method takes an optional `output`: None shows the plot (the default), a format name
+    ('png', 'svg' or 'pdf') returns the rendered bytes, and a file path saves the plot there.
+    """
 
     @staticmethod
-    def bar_chart():
+    def bar_chart(output=None):
         """Generates two bar charts in a single image: one for the Titanic dataset and one for the Tips dataset."""
         # Load datasets
-        titanic = sns.load_dataset("titanic")
-        tips = sns.load_dataset("tips")
+        titanic = load_dataset("titanic")
+        tips = load_dataset("tips")
 
         # Create subplots
         fig, axes = plt.subplots(nrows=1, ncols=2, figsize=(12, 6))
@@ -28,8 +39,8 @@ class Examples:
         axes[1].set_title("Total Bill by Day - Tips")
         axes[1].set_ylabel("Average Total Bill")
 
-        # Show the plot
-        plt.show()
+        # Show or save the plot
+        result = show_or_save(output)
 
         # Description
         description = """
@@ -42,14 +53,15 @@ class Examples:
         highest revenue, with Saturday showing the highest average bill amount.
         """
         print(description)
+        return result
 
 
     @staticmethod
-    def scatter_plot():
+    def scatter_plot(output=None):
         """Generates two scatter plots in a single image: one for the Iris dataset and one for the mpg dataset."""
         # Load datasets
-        iris = sns.load_dataset("iris")
-        mpg = sns.load_dataset("mpg")
+        iris = load_dataset("iris")
+        mpg = load_dataset("mpg")
 
         # Create subplots
         fig, axes = plt.subplots(nrows=1, ncols=2, figsize=(12, 6))
@@ -62,8 +74,8 @@ class Examples:
         sns.scatterplot(x="horsepower", y="mpg", data=mpg, hue="cylinders", ax=axes[1])
         axes[1].set_title("mpg Dataset")
 
-        # Show the plot
-        plt.show()
+        # Show or save the plot
+        result = show_or_save(output)
 
         # Description
         description = """
@@ -72,13 +84,14 @@ class Examples:
         The mpg plot shows the relationship between horsepower and miles per gallon, colored by the number of cylinders.
         """
         print(description)
+        return result
 
     @staticmethod
-    def line_chart():
+    def line_chart(output=None):
         """Generates two line charts in a single image: one for the Flights dataset and one for the Tips dataset."""
         # Load datasets
-        flights = sns.load_dataset("flights")
-        tips = sns.load_dataset("tips")
+        flights = load_dataset("flights")
+        tips = load_dataset("tips")
 
         # Create subplots
         fig, axes = plt.subplots(nrows=1, ncols=2, figsize=(12, 6))
@@ -94,8 +107,8 @@ class Examples:
         axes[1].set_title("Total Bill by Order Size - Tips")
         axes[1].set_ylabel("Total Bill")
 
-        # Show the plot
-        plt.show()
+        # Show or save the plot
+        result = show_or_save(output)
 
         # Description
         description = """
@@ -107,14 +120,15 @@ class Examples:
         (sorted by party size), and the Y-axis represents the total bill. Larger parties tend to generate higher total bills.
         """
         print(description)
+        return result
 
 
     @staticmethod
-    def histogram():
+    def histogram(output=None):
         """Generates two histograms in a single image: one for the Titanic dataset and one for the Tips dataset."""
         # Load datasets
-        titanic = sns.load_dataset("titanic")
-        tips = sns.load_dataset("tips")
+        titanic = load_dataset("titanic")
+        tips = load_dataset("tips")
 
         # Create subplots
         fig, axes = plt.subplots(nrows=1, ncols=2, figsize=(12, 6))
@@ -131,8 +145,8 @@ class Examples:
         axes[1].set_xlabel("Total Bill")
         axes[1].set_ylabel("Frequency")
 
-        # Show the plot
-        plt.show()
+        # Show or save the plot
+        result = show_or_save(output)
 
         # Description
         description = """
@@ -145,13 +159,14 @@ class Examples:
         between $10 and $30, with a few higher amounts, indicating occasional larger bills.
         """
         print(description)
+        return result
 
     @staticmethod
-    def box_plot():
+    def box_plot(output=None):
         """Generates two box plots in a single image: one for the Titanic dataset and one for the Tips dataset."""
         # Load datasets
-        titanic = sns.load_dataset("titanic")
-        tips = sns.load_dataset("tips")
+        titanic = load_dataset("titanic")
+        tips = load_dataset("tips")
 
         # Create subplots
         fig, axes = plt.subplots(nrows=1, ncols=2, figsize=(12, 6))
@@ -166,8 +181,8 @@ class Examples:
         axes[1].set_title("Total Bill Distribution by Day - Tips")
         axes[1].set_ylabel("Total Bill")
 
-        # Show the plot
-        plt.show()
+        # Show or save the plot
+        result = show_or_save(output)
 
         # Description
         description = """
@@ -180,14 +195,15 @@ class Examples:
         for total bills on each day, with Sunday showing some of the highest bills and largest variability.
         """
         print(description)
+        return result
 
 
     @staticmethod
-    def heatmap():
+    def heatmap(output=None):
         """Generates two heatmaps in a single image: one for the Correlation of the Titanic dataset and one for the Flights dataset."""
         # Load datasets
-        titanic = sns.load_dataset("titanic")
-        flights = sns.load_dataset("flights").pivot_table(index="month", columns="year", values="passengers", observed=False)
+        titanic = load_dataset("titanic")
+        flights = load_dataset("flights").pivot_table(index="month", columns="year", values="passengers", observed=False)
 
         # Filter Titanic dataset for only numeric columns (to avoid 'male'/'female' issue)
         titanic_numeric = titanic.select_dtypes(include=["float64", "int64"])
@@ -203,8 +219,8 @@ class Examples:
         sns.heatmap(flights, cmap="YlGnBu", ax=axes[1], linewidths=0.5, annot=True, fmt=".1f")
         axes[1].set_title("Flights Dataset Heatmap (Passengers per Year/Month)")
 
-        # Show the plot
-        plt.show()
+        # Show or save the plot
+        result = show_or_save(output)
 
         # Description
         description = """
@@ -217,13 +233,14 @@ class Examples:
         higher passenger counts, with a visible growth in air travel over time, particularly in the later years.
         """
         print(description)
+        return result
 
     @staticmethod
-    def area_chart():
+    def area_chart(output=None):
         """Generates two area charts in a single image: one for the Tips dataset and one for the Planets dataset."""
         # Load datasets
-        tips = sns.load_dataset("tips").groupby("day").agg({"total_bill": "sum"}).reset_index()
-        planets = sns.load_dataset("planets")
+        tips = load_dataset("tips").groupby("day").agg({"total_bill": "sum"}).reset_index()
+        planets = load_dataset("planets")
 
         # Aggregate planets data by year and count methods of discovery
         planets_by_year = planets.groupby("year").size().reset_index(name='discoveries')
@@ -243,8 +260,8 @@ class Examples:
         axes[1].set_title("Planet Discovery Count Over Time - Area Chart")
         axes[1].set_ylabel("Number of Discoveries")
 
-        # Show the plot
-        plt.show()
+        # Show or save the plot
+        result = show_or_save(output)
 
         # Description
         description = """
@@ -257,14 +274,15 @@ class Examples:
         underneath the line represents the cumulative count of discoveries, highlighting an upward trend in discoveries over the years.
         """
         print(description)
+        return result
 
 
     @staticmethod
-    def pie_chart():
+    def pie_chart(output=None):
         """Generates two pie charts in a single image: one for the Tips dataset (total bill by day) and one for the Titanic dataset (survival rate by class)."""
         # Load datasets
-        tips = sns.load_dataset("tips").groupby("day").agg({"total_bill": "sum"}).reset_index()
-        titanic = sns.load_dataset("titanic").groupby("class").agg({"survived": "sum"}).reset_index()
+        tips = load_dataset("tips").groupby("day").agg({"total_bill": "sum"}).reset_index()
+        titanic = load_dataset("titanic").groupby("class").agg({"survived": "sum"}).reset_index()
 
         # Create subplots
         fig, axes = plt.subplots(nrows=1, ncols=2, figsize=(14, 6))
@@ -277,8 +295,8 @@ class Examples:
         axes[1].pie(titanic["survived"], labels=titanic["class"], autopct='%1.1f%%', startangle=90, colors=sns.color_palette("Set3"))
         axes[1].set_title("Survival Rate by Class - Titanic")
 
-        # Show the plot
-        plt.show()
+        # Show or save the plot
+        result = show_or_save(output)
 
         # Description
         description = """
@@ -291,15 +309,16 @@ class Examples:
         of survivors were from the first class, with progressively fewer survivors in the second and third classes.
         """
         print(description)
+        return result
 
 
 
     @staticmethod
-    def violin_plot():
+    def violin_plot(output=None):
         """Generates two violin plots in a single image: one for the Tips dataset (total bill by day) and one for the Penguins dataset (flipper length by species)."""
         # Load datasets
-        tips = sns.load_dataset("tips")
-        penguins = sns.load_dataset("penguins")
+        tips = load_dataset("tips")
+        penguins = load_dataset("penguins")
 
         # Create subplots
         fig, axes = plt.subplots(nrows=1, ncols=2, figsize=(14, 6))
@@ -312,8 +331,8 @@ class Examples:
         sns.violinplot(x="species", y="flipper_length_mm", data=penguins, palette="coolwarm", ax=axes[1], hue="sex", split=True)
         axes[1].set_title("Flipper Length Distribution by Species - Penguins")
 
-        # Show the plot
-        plt.show()
+        # Show or save the plot
+        result = show_or_save(output)
 
         # Description
         description = """
@@ -326,23 +345,24 @@ class Examples:
         It illustrates the range and distribution of flipper lengths for each species, where Gentoo penguins tend to have longer flippers compared to the other species.
         """
         print(description)
+        return result
 
 
     @staticmethod
-    def parallel_coordinates_plot():
+    def parallel_coordinates_plot(output=None):
         """Generates a parallel coordinates plot using Pandas."""
         # Load dataset
-        iris = sns.load_dataset("iris")
+        iris = load_dataset("iris")
 
         # Create the plot
         plt.figure(figsize=(12, 6))
-        parallel_coordinates(iris, "species", color=["blue", "green", "red"])
+        pandas_plotting.parallel_coordinates(iris, "species", color=["blue", "green", "red"])
 
         # Add a title
         plt.title("Parallel Coordinates Plot for Iris Dataset")
 
-        # Show the plot
-        plt.show()
+        # Show or save the plot
+        result = show_or_save(output)
 
         # Description
         description = """
@@ -350,12 +370,13 @@ class Examples:
         Each line represents a data point, and the color indicates the species.
         """
         print(description)
+        return result
     
     @staticmethod
-    def bubble_chart():
+    def bubble_chart(output=None):
         """Generates a bubble chart showing the relationship between horsepower, weight, and acceleration in the mpg dataset."""
         # Load dataset
-        mpg = sns.load_dataset("mpg").dropna()
+        mpg = load_dataset("mpg").dropna()
 
         # Create bubble chart
         plt.figure(figsize=(10, 6))
@@ -365,8 +386,8 @@ class Examples:
         plt.xlabel("Horsepower")
         plt.ylabel("Weight")
 
-        # Show the plot
-        plt.show()
+        # Show or save the plot
+        result = show_or_save(output)
 
         # Description
         description = """
@@ -377,15 +398,15 @@ class Examples:
         This chart helps in visualizing how different car characteristics relate to one another.
         """
         print(description)
+        return result
 
     @staticmethod
-    def radial_chart():
+    def radial_chart(output=None):
         """Generates a radial chart (polar chart) showing the average tips by day of the week from the Tips dataset."""
         # Load dataset
-        tips = sns.load_dataset("tips").groupby("day").agg({"tip": "mean"}).reset_index()
+        tips = load_dataset("tips").groupby("day").agg({"tip": "mean"}).reset_index()
 
         # Create radial chart
-        plt.figure(figsize=(8, 8))
         categories = tips["day"]
         values = tips["tip"]
         
@@ -407,8 +428,8 @@ class Examples:
         # Title
         plt.title("Average Tip by Day (Tips Dataset)", size=15)
 
-        # Show the plot
-        plt.show()
+        # Show or save the plot
+        result = show_or_save(output)
 
         # Description
         description = """
@@ -418,4 +439,5 @@ class Examples:
         Radial charts are great for comparing multiple categories in a circular layout.
         """
         print(description)
+        return result
 
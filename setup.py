@@ -14,9 +14,12 @@ setup(
         'matplotlib',
         'setuptools',
     ],
+    entry_points={
+        'console_scripts': ['datai=datai.cli:main'],
+    },
     classifiers=[
         'Programming Language :: Python :: 3',
         'Operating System :: OS Independent',
     ],
-    python_requires='>=3.7',    # Python version requirement
+    python_requires='>=3.9',    # Python version requirement
 )
@@ -0,0 +1,4 @@
+import matplotlib
+
+# Plots are rendered headless in the tests
+matplotlib.use('Agg')
@@ -0,0 +1,53 @@
+import contextlib
+import io
+
+import numpy as np
+import pandas as pd
+import seaborn
+
+import datai.auto_plot
+import datai.profile
+from datai.auto_plot import AutoPlot
+from datai.inference import SAMPLE_ROWS
+
+
+def make_frame(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({"x": rng.normal(size=rows), "y": rng.normal(size=rows),
+                         "kind": rng.choice(["a", "b", "c"], rows)})
+
+
+def test_sampled_panels_draw_a_bounded_number_of_rows(monkeypatch):
+    drawn = {}
+    for name in ("pairplot", "violinplot", "kdeplot"):
+        def spy(*args, _name=name, _draw=getattr(seaborn, name), **kwargs):
+            data = kwargs.get("data", args[0] if args else None)
+            drawn[_name] = len(data)
+            return _draw(*args, **kwargs)
+        monkeypatch.setattr(seaborn, name, spy)
+    monkeypatch.setattr(AutoPlot, "sample_points", 500)
+    data = make_frame(3000)
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert len(AutoPlot.auto_plot(data, output='png')) == 5
+        AutoPlot.density_plot(data, "x", output='png')
+    assert drawn == {"pairplot": 500, "violinplot": 500, "kdeplot": 500}
+
+
+def test_auto_plot_renders_every_suggested_plot():
+    with contextlib.redirect_stdout(io.StringIO()):
+        images = AutoPlot.auto_plot(make_frame(200), output='png')
+    assert len(images) == 5 and all(image.startswith(b'\x89PNG') for image in images)
+
+
+def test_plot_choice_only_reads_a_bounded_sample(monkeypatch):
+    inspected = []
+
+    def spy(values, _infer=datai.auto_plot.infer_column_type):
+        inspected.append(len(values))
+        return _infer(values)
+    monkeypatch.setattr(datai.auto_plot, "infer_column_type", spy)
+    datai.profile.clear_profiles()
+    with contextlib.redirect_stdout(io.StringIO()):
+        AutoPlot.auto_plot(make_frame(50_000), output='png')
+    assert inspected == [SAMPLE_ROWS] * 3
+    assert not datai.profile._profiles
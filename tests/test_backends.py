@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from datai.backends import to_pandas
+from datai.data_cleaning import DataCleaning
+from datai.utils import Utils
+
+pl = pytest.importorskip('polars')
+pa = pytest.importorskip('pyarrow')
+
+VALUES = [1.0, float('nan'), 3.0, None, 100.0, 2.0, 4.0, 2.5]
+
+
+def frames():
+    """The same data as pandas (NaN), Polars and Arrow (a NaN and a null), and a Polars LazyFrame."""
+    text = ['a', None, 'b', 'b', 'a', 'c', None, 'a']
+    polars = pl.DataFrame({"x": pl.Series(VALUES, dtype=pl.Float64), "t": text})
+    return {
+        "pandas": pd.DataFrame({"x": [np.nan if value is None else value for value in VALUES], "t": text}),
+        "polars": polars,
+        "lazy": polars.lazy(),
+        "arrow": pa.table({"x": pa.array(VALUES, type=pa.float64()), "t": text}),
+    }
+
+
+def cleaned(data, step, **kwargs):
+    result = getattr(DataCleaning(data), step)(**kwargs)
+    result = result.collect() if hasattr(result, 'collect') else result
+    return to_pandas(result).reset_index(drop=True)
+
+
+@pytest.mark.parametrize("step", ["clean_missing_data", "remove_outliers", "normalize_data", "fused_clean"])
+def test_backends_match_pandas_with_nan(step):
+    results = {name: cleaned(data, step) for name, data in frames().items()}
+    expected = results.pop("pandas")
+    for name, result in results.items():
+        np.testing.assert_allclose(result["x"].to_numpy(dtype='float64'), expected["x"].to_numpy(dtype='float64'),
+                                   err_msg=name)
+        assert result["t"].tolist() == expected["t"].tolist(), name
+
+
+def test_fill_uses_the_median_of_the_present_values():
+    for name, data in frames().items():
+        values = cleaned(data, "clean_missing_data")["x"].tolist()
+        assert values == [1.0, 2.75, 3.0, 2.75, 100.0, 2.0, 4.0, 2.5], name
+
+
+def test_summaries_count_nan_as_missing():
+    summaries = {name: Utils.summarize_data(data) for name, data in frames().items() if name != "lazy"}
+    for name, summary in summaries.items():
+        assert summary["Missing Values"]["x"] == 2, name
+        assert summary["Summary Statistics"]["x"]["50%"] == pytest.approx(2.75), name
@@ -0,0 +1,23 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from datai.charts import Chart, ChartPool
+
+
+def test_chart_is_abstract():
+    with pytest.raises(TypeError):
+        Chart()
+
+
+def test_pool_reuses_charts_and_released_figures():
+    data = pd.DataFrame({"x": np.arange(10.0), "y": np.arange(10.0) ** 2})
+    with ChartPool() as pool:
+        chart = pool.chart('panel', 'line', 'x', 'y')
+        assert pool.chart('panel', 'line', 'x', 'y') is chart
+        assert chart.update(data).render('png').startswith(b'\x89PNG')
+        figure = chart.figure
+        pool.release('panel')
+        other = pool.chart('other', 'scatter', 'x', 'y')
+        assert other.figure is figure
+        assert other.update(data).render('png').startswith(b'\x89PNG')
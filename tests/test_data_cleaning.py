@@ -0,0 +1,28 @@
+import numpy as np
+import pandas as pd
+
+from datai.data_cleaning import DataCleaning
+
+
+def make_frame(rows=2000, seed=0):
+    rng = np.random.default_rng(seed)
+    data = pd.DataFrame({
+        "x": rng.normal(size=rows),
+        "count": rng.integers(0, 100, rows),
+        "city": rng.choice(["Paris", "Rome", "Oslo"], rows).astype(object),
+        "flag": rng.choice(["yes", "no"], rows).astype(object),
+    })
+    data.loc[rng.random(rows) < 0.1, "x"] = np.nan
+    data.loc[rng.random(rows) < 0.1, "city"] = None
+    return data
+
+
+def test_fused_pipeline_keeps_compact_dtypes():
+    data = make_frame()
+    data["x"] = data["x"].astype('float32').astype('float64')
+    fused = DataCleaning(data).get_cleaned_data(fused=True, optimize_dtypes=True)
+    steps = DataCleaning(data).get_cleaned_data(optimize_dtypes=True)
+    assert fused["x"].dtype == np.float32
+    assert isinstance(fused["city"].dtype, pd.CategoricalDtype)
+    assert isinstance(fused["flag"].dtype, pd.CategoricalDtype)
+    assert fused.dtypes.to_dict() == steps.dtypes.to_dict()
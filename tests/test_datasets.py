@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+import pytest
+import seaborn
+
+from datai import datasets
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setenv('DATAI_DATA_HOME', str(tmp_path))
+    datasets.clear_cache()
+    yield tmp_path
+    datasets.clear_cache()
+
+
+def make_frame():
+    return pd.DataFrame({"x": np.arange(100_000.0), "day": pd.Categorical(["Sat", "Sun"] * 50_000),
+                         "name": ["a", None] * 50_000})
+
+
+def test_stored_datasets_load_without_the_network(store, monkeypatch):
+    datasets.save_dataset("frame", make_frame())
+
+    def offline(name):
+        raise AssertionError("The network was used.")
+    monkeypatch.setattr(seaborn, "load_dataset", offline)
+    first = datasets.load_dataset("frame")
+    pd.testing.assert_frame_equal(first, make_frame())
+    first.loc[0, "x"] = -1.0
+    assert datasets.load_dataset("frame").loc[0, "x"] == 0.0
+
+
+def test_feather_files_are_memory_mapped_without_decompression(store):
+    pa = pytest.importorskip("pyarrow")
+    datasets.save_dataset("frame", make_frame())
+    before = pa.total_allocated_bytes()
+    table = datasets._read_stored("frame", str(store))
+    assert pa.total_allocated_bytes() - before < 100_000 * 8 // 10
+    assert table.num_rows == 100_000
@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from datai.data_cleaning import DataCleaning
+from datai.dedup import BloomFilter, StreamingDeduplicator, duplicate_mask, near_duplicate_mask
+
+
+def make_frame(rows=20_000, seed=0):
+    rng = np.random.default_rng(seed)
+    data = pd.DataFrame({
+        "user": rng.integers(0, 300, rows),
+        "event": rng.choice(["view", "click", None], rows),
+        "amount": rng.integers(0, 5, rows) * 0.5,
+        "day": pd.Categorical(rng.choice(["mon", "tue"], rows)),
+    })
+    data.loc[rng.random(rows) < 0.05, "amount"] = np.nan
+    return data
+
+
+@pytest.mark.parametrize("keep", ['first', 'last', False])
+@pytest.mark.parametrize("exact", [False, True])
+def test_duplicate_mask_matches_duplicated(keep, exact):
+    data = make_frame()
+    expected = data.duplicated(keep=keep).to_numpy()
+    np.testing.assert_array_equal(duplicate_mask(data, keep=keep, exact=exact), expected)
+
+
+def test_duplicate_mask_on_key_columns():
+    data = make_frame()
+    expected = data.duplicated(subset=["user", "event"]).to_numpy()
+    np.testing.assert_array_equal(duplicate_mask(data, columns=["user", "event"]), expected)
+
+
+def test_remove_duplicates_matches_drop_duplicates():
+    data = make_frame()
+    pd.testing.assert_frame_equal(DataCleaning(data).remove_duplicates(), data.drop_duplicates())
+
+
+@pytest.mark.parametrize("method", ["exact", "bloom"])
+def test_streaming_deduplication_across_chunks(method):
+    data = make_frame()
+    deduplicator = StreamingDeduplicator(method=method, capacity=len(data))
+    kept = pd.concat([deduplicator.transform(chunk) for chunk in np.array_split(data, 7)])
+    expected = data.drop_duplicates()
+    if method == "exact":
+        pd.testing.assert_frame_equal(kept, expected)
+    else:
+        # A Bloom filter may drop a few unique rows, but never keeps a duplicate
+        assert set(kept.index) <= set(expected.index)
+        assert len(kept) >= len(expected) - 5
+    assert deduplicator.rows_dropped == len(data) - len(kept)
+
+
+def test_bloom_filter_has_no_false_negatives():
+    hashes = np.random.default_rng(0).integers(0, 2**63, 10_000, dtype=np.int64).astype(np.uint64)
+    bloom = BloomFilter(capacity=10_000)
+    bloom.add(hashes)
+    assert bloom.contains(hashes).all()
+
+
+def test_near_duplicates_keep_the_first_text():
+    data = pd.DataFrame({"text": [
+        "the quick brown fox jumps over the lazy dog",
+        "the quick brown fox jumps over the lazy dog!",
+        "completely different sentence about data cleaning",
+        None,
+        "the quick brown fox jumps over the lazy dog",
+    ]})
+    np.testing.assert_array_equal(near_duplicate_mask(data, ["text"], threshold=0.8),
+                                  [False, True, False, False, True])
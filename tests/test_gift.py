@@ -0,0 +1,20 @@
+import numpy as np
+from matplotlib import animation
+
+from datai.gift import Gift
+
+
+def test_shown_animation_is_a_func_animation(tmp_path):
+    anim = Gift.myName("Ab", interval=10)
+    assert isinstance(anim, animation.FuncAnimation)
+    path = tmp_path / "name.gif"
+    anim.save(path, writer='pillow')
+    assert path.read_bytes().startswith(b'GIF8')
+    assert "<script" in anim.to_jshtml()
+
+
+def test_exported_frames_reveal_one_character_each():
+    frames = Gift.myName("Ab", output="frames")
+    assert frames.shape[0] == 2 and frames.shape[-1] == 4
+    # The second frame adds ink to the first
+    assert (frames[1] != frames[0]).any() and np.array_equal(np.minimum(frames[1], frames[0]), frames[1])
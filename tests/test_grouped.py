@@ -0,0 +1,131 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from datai.data_cleaning import DataCleaning
+from datai.grouped import GroupIndex
+from datai.utils import Utils
+
+
+def make_frame(rows=20_000, groups=500, seed=0):
+    rng = np.random.default_rng(seed)
+    data = pd.DataFrame({
+        "sensor": rng.integers(0, groups, rows),
+        "site": rng.choice(["north", "south", None], rows),
+        "x": rng.normal(size=rows),
+        "y": rng.integers(0, 100, rows).astype('float64'),
+        "state": rng.choice(["on", "off", "idle"], rows).astype(object),
+    })
+    data.loc[rng.random(rows) < 0.1, "x"] = np.nan
+    data.loc[rng.random(rows) < 0.1, "state"] = None
+    # A group without any x values
+    data.loc[data["sensor"] == 3, "x"] = np.nan
+    return data
+
+
+def loop_statistic(data, keys, column, statistic):
+    """The per-row statistic, computed with a Python loop over the groups."""
+    result = pd.Series(np.nan, index=data.index, dtype=object if statistic == "mode" else 'float64')
+    for _, group in data.groupby(keys, dropna=False):
+        values = group[column]
+        if statistic == "mode":
+            modes = values.mode()
+            value = modes.iloc[0] if len(modes) else np.nan
+        elif statistic in ("min", "max", "mean", "std"):
+            value = getattr(values, statistic)()
+        else:
+            value = values.quantile(statistic)
+        result[group.index] = value
+    return result.to_numpy()
+
+
+@pytest.mark.parametrize("keys", [["sensor"], ["sensor", "site"]])
+def test_group_statistics_match_a_groupby_loop(keys):
+    data = make_frame()
+    index = GroupIndex(data, keys, n_jobs=2)
+    values = data["x"].to_numpy()
+    quantiles = index.quantiles(values, [0.25, 0.5, 0.75])
+    for row, q in enumerate([0.25, 0.5, 0.75]):
+        np.testing.assert_allclose(index.expand(quantiles[row]), loop_statistic(data, keys, "x", q))
+    low, high = index.min_max(values)
+    np.testing.assert_allclose(index.expand(low), loop_statistic(data, keys, "x", "min"))
+    np.testing.assert_allclose(index.expand(high), loop_statistic(data, keys, "x", "max"))
+    mean, std = index.mean_std(values)
+    np.testing.assert_allclose(index.expand(mean), loop_statistic(data, keys, "x", "mean"))
+    np.testing.assert_allclose(index.expand(std), loop_statistic(data, keys, "x", "std"))
+    modes = pd.Series(index.expand(index.modes(data["state"])))
+    expected = pd.Series(loop_statistic(data, keys, "state", "mode"))
+    assert modes.fillna("-").tolist() == expected.fillna("-").tolist()
+
+
+def test_quantiles_of_the_filled_column_come_from_one_sort():
+    data = make_frame()
+    index = GroupIndex(data, "sensor")
+    values = data["x"].to_numpy()
+    medians = index.medians(values)
+    filled = np.where(np.isnan(values), index.expand(medians), values)
+    np.testing.assert_allclose(index.quantiles(values, [0.25, 0.75], fill=medians),
+                               index.quantiles(filled, [0.25, 0.75]))
+
+
+def test_filled_quantiles_sort_each_group_once(monkeypatch):
+    data = make_frame()
+    index = GroupIndex(data, "sensor")
+    values = data["x"].to_numpy()
+    expected_medians = index.medians(values)
+    expected = index.quantiles(values, [0.25, 0.75], fill=expected_medians)
+    sorts = []
+    original = GroupIndex._sort_within_groups
+    monkeypatch.setattr(GroupIndex, "_sort_within_groups", lambda self, *args: (sorts.append(1), original(self, *args)))
+    medians, quartiles = index.filled_quantiles(values, [0.25, 0.75])
+    assert len(sorts) == 1
+    np.testing.assert_array_equal(medians, expected_medians)
+    np.testing.assert_array_equal(quartiles, expected)
+
+
+def test_grouped_cleaning_matches_groupby_transforms():
+    data = make_frame()
+    result = DataCleaning(data, by="sensor", n_jobs=2).get_cleaned_data()
+
+    expected = data.copy()
+    groups = expected.groupby("sensor")
+    for column in ["x", "y"]:
+        expected[column] = expected[column].fillna(groups[column].transform("median"))
+    for column in ["site", "state"]:
+        expected[column] = expected[column].fillna(pd.Series(loop_statistic(expected, ["sensor"], column, "mode"),
+                                                             index=expected.index))
+    keep = np.ones(len(expected), dtype=bool)
+    for column in ["x", "y"]:
+        kept = expected[keep].groupby("sensor")[column]
+        q1, q3 = expected["sensor"].map(kept.quantile(0.25)), expected["sensor"].map(kept.quantile(0.75))
+        keep &= ((expected[column] >= q1 - 1.5 * (q3 - q1)) & (expected[column] <= q3 + 1.5 * (q3 - q1))).to_numpy()
+    expected = expected[keep].copy()
+    for column in ["x", "y"]:
+        low = expected.groupby("sensor")[column].transform("min")
+        high = expected.groupby("sensor")[column].transform("max")
+        expected[column] = (expected[column] - low) / (high - low)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_fused_grouped_cleaning_keeps_extension_dtypes():
+    data = make_frame()
+    data["state"] = data["state"].astype('category')
+    data["count"] = pd.array(np.arange(len(data)) % 7, dtype='Int64')
+    data["label"] = data["site"].astype('string')
+    result = DataCleaning(data, by="sensor").get_cleaned_data(fused=True)
+    assert isinstance(result["state"].dtype, pd.CategoricalDtype)
+    assert result["label"].dtype == 'string'
+    assert result["state"].notna().all() and result["label"].notna().all()
+
+
+def test_grouped_normalize_leaves_the_keys_alone():
+    data = make_frame()
+    scaled = Utils.normalize_data(data, method='z-score', copy=True, by="sensor")
+    groups = data.groupby("sensor")["y"]
+    np.testing.assert_allclose(scaled["y"], (data["y"] - groups.transform("mean")) / groups.transform("std"))
+    pd.testing.assert_series_equal(scaled["sensor"], data["sensor"])
+
+
+def test_grouped_fit_is_rejected():
+    with pytest.raises(ValueError):
+        DataCleaning(make_frame(), by="sensor").fit()
@@ -0,0 +1,9 @@
+import pandas as pd
+
+from datai.inference import infer_types
+
+
+def test_small_integer_columns_stay_numeric():
+    data = pd.DataFrame({"Age": [25, 32, 47, 51, 62, 25, 33], "Salary": [50, 60, 70, 80, 90, 55, 65]})
+    kinds = infer_types(data)
+    assert kinds["Age"]["kind"] == "numeric" and kinds["Salary"]["kind"] == "numeric"
@@ -0,0 +1,46 @@
+import contextlib
+import io
+import threading
+
+import numpy as np
+import pandas as pd
+
+from datai.data_cleaning import DataCleaning
+from datai.instrumentation import Collector, instrument
+from datai.utils import Utils
+
+
+def make_frame(rows=1000):
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({"a": rng.normal(size=rows), "b": rng.normal(size=rows)})
+    data.loc[::10, "a"] = np.nan
+    return data
+
+
+def test_nested_stages_record_their_parent():
+    with contextlib.redirect_stdout(io.StringIO()), instrument(Collector()) as collector:
+        DataCleaning(make_frame()).get_cleaned_data()
+    records = {record["stage"]: record for record in collector.records}
+    top = records["DataCleaning.get_cleaned_data"]
+    assert top["parent"] is None and top["depth"] == 0
+    assert records["DataCleaning.remove_outliers"]["parent"] == "DataCleaning.get_cleaned_data"
+    assert records["DataCleaning.remove_outliers"]["depth"] == 1
+    assert top["rows_in"] == 1000 and top["rows_out"] <= 1000
+
+
+def test_concurrent_calls_keep_their_own_nesting():
+    barrier = threading.Barrier(4)
+
+    def work():
+        barrier.wait()
+        for _ in range(20):
+            Utils.normalize_data(make_frame(200), copy=True)
+
+    with instrument(Collector()) as collector:
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert len(collector.records) == 80
+    assert all(record["parent"] is None and record["depth"] == 0 for record in collector.records)
@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from datai import loaders
+from datai.loaders import read_csv, read_path
+
+
+@pytest.fixture
+def small_ranges(monkeypatch):
+    # Split even small test files into several byte ranges
+    monkeypatch.setattr(loaders, 'MIN_RANGE_BYTES', 64 << 10)
+
+
+def make_frame(rows=40_000, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({"a": rng.integers(0, 100, rows), "b": rng.normal(size=rows), "t": ["plain"] * rows})
+
+
+def test_multiline_quoted_fields_are_not_split(tmp_path, small_ranges):
+    data = make_frame()
+    # Quoted fields holding newlines and separators well past the start of the file
+    for row in (5, 17_000, 31_000, 39_999):
+        data.loc[row, "t"] = 'several\nlines, "quoted"\nfield'
+    path = tmp_path / "quoted.csv"
+    data.to_csv(path, index=False)
+    pd.testing.assert_frame_equal(read_csv(path, n_jobs=4), pd.read_csv(path))
+
+
+def test_projection_and_filters_in_parallel(tmp_path, small_ranges):
+    data = make_frame()
+    path = tmp_path / "data.csv"
+    data.to_csv(path, index=False)
+    result = read_path(path, columns=["b"], filters=[("a", "<", 10)], n_jobs=4)
+    expected = data.loc[data["a"] < 10, ["b"]].reset_index(drop=True)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_tsv_files_use_tabs(tmp_path, small_ranges):
+    data = make_frame()
+    path = tmp_path / "data.tsv"
+    data.to_csv(path, index=False, sep="\t")
+    pd.testing.assert_frame_equal(read_path(path, n_jobs=4), data)
+
+
+@pytest.mark.parametrize("options", [{"nrows": 1000}, {"skiprows": [1, 2, 3]}, {"header": None, "names": list("xyz")}])
+def test_row_options_are_applied_once(tmp_path, small_ranges, options):
+    path = tmp_path / "data.csv"
+    make_frame().to_csv(path, index=False)
+    expected = pd.read_csv(path, **options)
+    pd.testing.assert_frame_equal(read_csv(path, n_jobs=4, **options), expected)
+
+
+def test_types_changing_between_ranges_match_a_whole_file_read(tmp_path, small_ranges):
+    rows = 40_000
+    data = pd.DataFrame({
+        "ints": np.arange(rows),
+        "gaps": np.arange(rows).astype(object),
+        "text": np.arange(rows).astype(object),
+        "flags": np.where(np.arange(rows) % 2, "True", "False").astype(object),
+        "mixed": np.arange(rows).astype(object),
+    })
+    # Late in the file: a missing integer, a word among numbers, empty flags and flags among numbers
+    data.loc[35_000, "gaps"] = None
+    data.loc[36_000, "text"] = "word"
+    data.loc[30_000:, "flags"] = None
+    data.loc[38_000, "mixed"] = "True"
+    path = tmp_path / "types.csv"
+    data.to_csv(path, index=False)
+    expected = pd.read_csv(path)
+    result = read_csv(path, n_jobs=4)
+    pd.testing.assert_frame_equal(result, expected)
+    assert result["text"].map(type).eq(str).all()
+    pd.testing.assert_frame_equal(read_csv(path, columns=["text"], filters=[("ints", "<", 5)], n_jobs=4),
+                                  expected.loc[expected["ints"] < 5, ["text"]])
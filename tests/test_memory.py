@@ -0,0 +1,26 @@
+import threading
+
+import numpy as np
+
+from datai.memory import MemoryTracker
+
+
+def test_memory_trackers_nest_per_thread():
+    errors = []
+
+    def work():
+        try:
+            with MemoryTracker() as outer:
+                with MemoryTracker() as inner:
+                    buffer = np.ones(1_000_000)
+                del buffer
+            assert outer.peak_bytes >= inner.peak_bytes >= 8_000_000
+        except Exception as error:  # reported by the main thread
+            errors.append(error)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
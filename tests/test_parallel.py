@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from datai.data_cleaning import DataCleaning
+import datai.parallel
+from datai.parallel import column_statistics
+
+
+def make_frame(rows=5000, seed=1):
+    rng = np.random.default_rng(seed)
+    data = pd.DataFrame({
+        "a": rng.normal(size=rows),
+        "b": rng.exponential(size=rows),
+        "n": rng.integers(0, 50, rows).astype('float64'),
+        "city": rng.choice(["Paris", "Rome", "Oslo"], rows).astype(object),
+        "kind": pd.Categorical(rng.choice(["x", "y", "z"], rows)),
+    })
+    for column in data.columns:
+        data.loc[rng.random(rows) < 0.05, column] = np.nan
+    return data
+
+
+@pytest.mark.parametrize("step", ["clean_missing_data", "remove_outliers", "normalize_data"])
+def test_parallel_steps_match_serial(step):
+    data = make_frame()
+    serial, parallel = DataCleaning(data), DataCleaning(data, n_jobs=2)
+    if step != "clean_missing_data":
+        serial.clean_missing_data()
+        parallel.clean_missing_data()
+    pd.testing.assert_frame_equal(getattr(serial, step)(), getattr(parallel, step)())
+
+
+def test_parallel_pipelines_match_serial():
+    data = make_frame()
+    pd.testing.assert_frame_equal(DataCleaning(data).get_cleaned_data(),
+                                  DataCleaning(data, n_jobs=2).get_cleaned_data())
+    pd.testing.assert_frame_equal(DataCleaning(data).get_cleaned_data(fused=True),
+                                  DataCleaning(data, n_jobs=2).get_cleaned_data(fused=True))
+
+
+def test_parallel_mode_breaks_ties_like_series_mode():
+    data = pd.DataFrame({
+        "text": ['b', 'a', 'b', 'a', None],
+        "kind": pd.Categorical(['y', 'x', 'y', 'x', None], categories=['y', 'x', 'z']),
+        "value": [1.0, 2.0, 3.0, 4.0, 5.0],
+    })
+    serial = DataCleaning(data).clean_missing_data()
+    parallel = DataCleaning(data, n_jobs=2).clean_missing_data()
+    pd.testing.assert_frame_equal(serial, parallel)
+    assert parallel.loc[4, "text"] == data["text"].mode()[0] == 'a'
+    assert parallel.loc[4, "kind"] == data["kind"].mode()[0] == 'y'
+
+
+def test_column_statistics_match_describe():
+    data = make_frame()
+    statistics = column_statistics(data, n_jobs=2)
+    described = data.describe(include='all')
+    for column in ["a", "b", "n"]:
+        for stat in ["count", "mean", "std", "min", "25%", "50%", "75%", "max"]:
+            assert statistics[column][stat] == pytest.approx(described.loc[stat, column])
+    assert statistics["city"]["unique"] == data["city"].nunique()
+    assert statistics["city"]["nulls"] == data["city"].isna().sum()
+
+
+def test_object_columns_in_worker_processes_match_threads(monkeypatch):
+    data = make_frame()
+    in_threads = column_statistics(data, n_jobs=2)
+    monkeypatch.setattr(datai.parallel, "PROCESS_MIN_VALUES", 0)
+    first, second = column_statistics(data, n_jobs=2), column_statistics(data, n_jobs=2)
+    pool = datai.parallel._process_pool
+    assert pool is not None and column_statistics(data, n_jobs=2) == second
+    assert datai.parallel._process_pool is pool
+    for column in ["city", "kind"]:
+        assert first[column] == second[column] == in_threads[column]
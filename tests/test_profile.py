@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+
+import datai.profile
+from datai.profile import fingerprint, invalidate_profile, profile_data
+from datai.utils import Utils
+
+
+def test_profile_is_reused_while_the_data_is_unchanged():
+    data = pd.DataFrame({"a": np.arange(1000.0), "b": ["x"] * 1000})
+    assert profile_data(data) is profile_data(data)
+
+
+def test_replaced_columns_invalidate_the_cached_summary():
+    data = pd.DataFrame({"a": np.arange(100_000.0), "b": np.ones(100_000)})
+    assert Utils.summarize_data(data)["Summary Statistics"]["a"]["max"] == 99999.0
+    data["a"] = data["a"] * 2
+    assert Utils.summarize_data(data)["Summary Statistics"]["a"]["max"] == 199998.0
+    data["b"] = data["b"].astype('float32')
+    assert profile_data(data).dtypes["b"] == np.float32
+
+
+def test_full_fingerprint_notices_any_edit(monkeypatch):
+    data = pd.DataFrame({"a": np.arange(100_000.0)})
+    cheap = fingerprint(data)
+    full = fingerprint(data, full=True)
+    data.loc[5, "a"] = 1e9
+    assert fingerprint(data, full=True) != full
+    monkeypatch.setattr(datai.profile, "FULL_FINGERPRINT", True)
+    assert fingerprint(data) != full and fingerprint(data) != cheap
+    assert Utils.summarize_data(data)["Summary Statistics"]["a"]["max"] == 1e9
+
+
+def test_sampled_fingerprint_covers_the_sampled_rows():
+    data = pd.DataFrame({"a": np.arange(100_000.0)})
+    before = fingerprint(data)
+    data.iloc[-1, 0] = -1.0
+    assert fingerprint(data) != before
+
+
+def test_fingerprint_covers_text_columns_and_the_index():
+    data = pd.DataFrame({"t": ["x"] * 5000}, index=np.arange(5000) * 2)
+    before = fingerprint(data)
+    data.iloc[0, 0] = "y"
+    assert fingerprint(data) != before
+    data.iloc[0, 0] = "x"
+    assert fingerprint(data) == before
+    assert fingerprint(data.set_axis(np.arange(5000) * 3)) != before
+
+
+def test_invalidate_profile_drops_the_profile():
+    data = pd.DataFrame({"a": [1.0, 2.0]})
+    profile = profile_data(data)
+    invalidate_profile(data)
+    assert profile_data(data) is not profile
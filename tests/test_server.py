@@ -0,0 +1,124 @@
+import http.client
+import io
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from datai.server import DataServer, parse_params, served_plot
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope='module')
+def server(tmp_path_factory):
+    """A `datai serve` process with one worker, serving files under a temporary directory."""
+    directory = tmp_path_factory.mktemp('served')
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        port = probe.getsockname()[1]
+    process = subprocess.Popen([sys.executable, '-m', 'datai', 'serve', '--port', str(port), '--workers', '1',
+                                '--root', str(directory)], cwd=ROOT, stdout=subprocess.DEVNULL)
+    try:
+        for _ in range(300):
+            try:
+                connection = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+                connection.request('GET', '/health')
+                if connection.getresponse().status == 200:
+                    break
+            except OSError:
+                time.sleep(0.1)
+        else:
+            pytest.fail("The server did not start.")
+        yield port, directory
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+def request(port, method, target, body=None):
+    connection = http.client.HTTPConnection('127.0.0.1', port, timeout=120)
+    connection.request(method, target, body=body)
+    response = connection.getresponse()
+    return response.status, response.getheader('Content-Type'), response.getheader('X-Cache'), response.read()
+
+
+@pytest.fixture(scope='module')
+def upload():
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({"a": rng.normal(size=500), "b": rng.normal(size=500), "c": rng.choice(list("xyz"), 500)})
+    data.loc[::7, "a"] = np.nan
+    return data, data.to_csv(index=False).encode()
+
+
+def test_summary_is_cached_by_content(server, upload):
+    port, _ = server
+    data, body = upload
+    status, content_type, cache, payload = request(port, 'POST', '/summary', body)
+    assert status == 200 and content_type.startswith('application/json')
+    summary = json.loads(payload)
+    assert summary["Shape"] == [500, 3]
+    assert summary["Missing Values"]["a"] == data["a"].isna().sum()
+    assert request(port, 'POST', '/summary', body)[2] == 'hit'
+
+
+def test_clean_returns_the_cleaned_dataset(server, upload):
+    port, _ = server
+    data, body = upload
+    status, _, _, payload = request(port, 'POST', '/clean?fused=true&output=parquet', body)
+    assert status == 200
+    expected_rows = len(pd.read_csv(io.BytesIO(body)))
+    cleaned = pd.read_parquet(io.BytesIO(payload))
+    assert 0 < len(cleaned) <= expected_rows
+    assert cleaned[["a", "b"]].min().min() >= 0 and cleaned[["a", "b"]].max().max() <= 1
+
+
+def test_plot_renders_png(server, upload):
+    port, _ = server
+    status, content_type, _, payload = request(port, 'POST', '/plot?plot=histogram&col=a', upload[1])
+    assert status == 200 and content_type == 'image/png'
+    assert payload.startswith(b'\x89PNG')
+
+
+def test_files_are_read_from_the_served_directory_only(server, upload):
+    port, directory = server
+    upload[0].to_parquet(directory / 'data.parquet')
+    status, _, _, payload = request(port, 'GET', f"/summary?path={directory / 'data.parquet'}&columns=a,b")
+    assert status == 200 and json.loads(payload)["Columns"] == ["a", "b"]
+    assert request(port, 'GET', '/summary?path=data.parquet&columns=a')[0] == 200
+    assert request(port, 'GET', '/summary?path=/etc/passwd')[0] == 403
+    assert request(port, 'GET', '/summary?path=../../etc/passwd')[0] == 403
+
+
+def test_files_are_confined_to_the_working_directory_by_default(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert DataServer().root == os.path.realpath(tmp_path)
+
+
+@pytest.mark.parametrize("target, status", [
+    ('/plot?plot=Examples.bar_chart', 400),
+    ('/plot?plot=nope', 400),
+    ('/plot?output=/tmp/x.png', 400),
+    ('/summary?fused=1', 400),
+    ('/clean?output=xml', 400),
+    ('/nothing', 404),
+])
+def test_invalid_requests(server, upload, target, status):
+    port, _ = server
+    assert request(port, 'POST', target, upload[1])[0] == status
+
+
+def test_only_autoplot_methods_taking_the_dataset_are_served():
+    assert served_plot('histogram')[1] == 'data'
+    assert served_plot('AutoPlot.auto_plot')[1] == 'dataset'
+    for name in ('Examples.bar_chart', 'auto_plot_path', '_resolve', 'missing'):
+        with pytest.raises(ValueError):
+            served_plot(name)
+    with pytest.raises(ValueError):
+        parse_params('plot', {'plot': ['Examples.heatmap']})
@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+
+from datai.sketches import QuantileSketch, approximate_quantiles
+
+
+def test_in_memory_quantiles_match_nanquantile():
+    rng = np.random.default_rng(0)
+    block = rng.normal(size=(5000, 3))
+    block[::7, 1] = np.nan
+    block[:, 2] = np.nan
+    q = [0, 0.1, 0.25, 0.5, 0.75, 1]
+    with pytest.warns(RuntimeWarning):
+        expected = np.nanquantile(block, q, axis=0)
+    np.testing.assert_array_equal(approximate_quantiles(block, q), expected)
+    assert approximate_quantiles(block[:, 0], 0.5) == np.nanquantile(block[:, 0], 0.5)
+
+
+def test_merged_sketches_stay_within_their_error():
+    values = np.random.default_rng(1).normal(size=200_000)
+    sketch = QuantileSketch(epsilon=0.01, seed=0).update(values[:100_000])
+    sketch.merge(QuantileSketch(epsilon=0.01, seed=1).update(values[100_000:]))
+    q = np.array([0.1, 0.25, 0.5, 0.75, 0.9])
+    ranks = np.searchsorted(np.sort(values), sketch.quantile(q)) / len(values)
+    assert np.abs(ranks - q).max() < 0.01
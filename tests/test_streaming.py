@@ -0,0 +1,16 @@
+import contextlib
+import io
+
+import numpy as np
+import pandas as pd
+
+from datai.streaming import ChunkedCleaning
+
+
+def test_chunked_cleaning_can_be_quiet():
+    rng = np.random.default_rng(0)
+    chunks = [pd.DataFrame({"a": rng.normal(size=100)}) for _ in range(3)]
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        cleaned = pd.concat(ChunkedCleaning(lambda: iter(chunks), verbose=False).iter_cleaned())
+    assert output.getvalue() == "" and len(cleaned) > 0
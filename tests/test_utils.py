@@ -0,0 +1,20 @@
+import numpy as np
+import pandas as pd
+
+from datai.utils import Utils
+
+
+def test_in_place_fill_with_per_column_values():
+    data = pd.DataFrame({"a": [1.0, np.nan], "b": ["x", None]})
+    result = Utils.handle_missing_values(data, method='fill', fill_value={"a": 0.5, "b": "y"}, copy=False)
+    assert result["a"].tolist() == [1.0, 0.5] and result["b"].tolist() == ["x", "y"]
+
+
+def test_normalize_data_scales_the_input_in_place_by_default():
+    data = pd.DataFrame({"a": [1, 2, 3], "b": [2.0, 4.0, 6.0], "c": ["x", "y", "z"]})
+    result = Utils.normalize_data(data)
+    assert result is data
+    assert data["a"].tolist() == data["b"].tolist() == [0.0, 0.5, 1.0]
+    original = pd.DataFrame({"a": [1, 2, 3]})
+    Utils.normalize_data(original, copy=True)
+    assert original["a"].tolist() == [1, 2, 3]